@@ -1,6 +1,6 @@
 # backend/app/config/settings.py
 
-from typing import Literal
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -16,12 +16,36 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # Async driver URL for the async routes; derived from DATABASE_URL when unset
+    # (mysql+pymysql -> mysql+aiomysql, sqlite -> sqlite+aiosqlite)
+    ASYNC_DATABASE_URL: Optional[str] = None
 
     # JWT / auth settings
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: Literal["HS256", "HS384", "HS512"] = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Enrollment admission control (in-process queue in front of enroll/drop routes)
+    ENROLL_MAX_CONCURRENCY: int = 8
+    ENROLL_QUEUE_SIZE: int = 200
+    ENROLL_QUEUE_TIMEOUT_SECONDS: float = 10.0
+    ENROLL_RETRY_AFTER_SECONDS: int = 2
+    ENROLL_MAX_PENDING_PER_STUDENT: int = 2
+
+    # How long enroll/drop outcomes are replayed for a repeated Idempotency-Key
+    IDEMPOTENCY_TTL_SECONDS: int = 24 * 60 * 60
+    # How long an in-progress key stays claimed if its request dies before finishing
+    IDEMPOTENCY_PENDING_TTL_SECONDS: int = 60
+
+    # Per-(student, term) eligibility matrix cache; bounds staleness from other processes
+    ELIGIBILITY_CACHE_TTL_SECONDS: float = 300.0
+
+    # Per-student passed-course set cache (dropped on every history write in this process)
+    PASSED_COURSES_CACHE_TTL_SECONDS: float = 300.0
+
+    # Full reload interval of the in-memory prerequisite graph (local writes apply immediately)
+    PREREQ_GRAPH_RELOAD_SECONDS: float = 300.0
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
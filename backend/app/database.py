@@ -41,3 +41,69 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+# -----------------------------
+# Async engine (student enrollment / schedule / catalog routes)
+# -----------------------------
+
+_ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "mysql+mysqldb": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def to_async_url(url: str) -> str:
+    """
+    Map a sync SQLAlchemy URL to its async-driver twin.
+    URLs that already name an async driver (or unknown dialects) are returned unchanged.
+    """
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        return url
+    return f"{_ASYNC_DRIVERS.get(scheme, scheme)}://{rest}"
+
+
+def get_async_engine():
+    """
+    Lazily create the process-wide AsyncEngine.
+
+    Created on first use so that the sync-only tooling (create_db.py, seed scripts)
+    does not need aiomysql/aiosqlite installed.
+    """
+    global _async_engine, _AsyncSessionLocal
+
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # type: ignore
+
+        _async_engine = create_async_engine(
+            settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL),
+            echo=settings.DEBUG,
+            pool_pre_ping=True,
+        )
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=_async_engine,
+            class_=AsyncSession,
+            autoflush=False,
+            # Route code reads ids/timestamps after commit; avoid implicit async reloads.
+            expire_on_commit=False,
+        )
+    return _async_engine
+
+
+async def get_async_db():
+    """
+    FastAPI dependency that provides an AsyncSession per request.
+
+    Sync service/repository code is reused via `await db.run_sync(fn, ...)`,
+    which runs `fn(sync_session, ...)` without blocking the event loop.
+    """
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,46 @@
+# backend/app/dependencies/admission.py
+
+from __future__ import annotations
+
+from typing import AsyncGenerator, Optional
+
+from fastapi import HTTPException, Request, status
+
+from backend.app.services.admission_control import AdmissionRejectedError, enrollment_admission
+from backend.app.services.jwt import InvalidTokenError, decode_access_token
+
+
+def _student_key(request: Request) -> Optional[str]:
+    """
+    Fairness key = JWT subject, decoded without touching the DB.
+    Invalid/missing tokens get no key; the auth dependency rejects them right after.
+    """
+    auth = request.headers.get("Authorization") or ""
+    scheme, _, token = auth.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return decode_access_token(token).get("sub")
+    except InvalidTokenError:
+        return None
+
+
+async def enrollment_admission_slot(request: Request) -> AsyncGenerator[None, None]:
+    """
+    Route dependency that admits the request through the enrollment queue
+    BEFORE any DB session work happens, and frees the slot afterwards.
+    Full queue / per-student cap / wait timeout -> fast 429 with Retry-After.
+    """
+    key = _student_key(request)
+    try:
+        await enrollment_admission.acquire(key)
+    except AdmissionRejectedError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Registration is busy ({exc.reason}); please retry shortly.",
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+    try:
+        yield
+    finally:
+        enrollment_admission.release(key)
@@ -6,9 +6,11 @@ from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from backend.app.database import get_db
+from backend.app.database import get_async_db, get_db
 from backend.app.models.admin import Admin
 from backend.app.models.student import Student
 from backend.app.models.professor import Professor
@@ -163,10 +165,7 @@ def test_get_current_student_success(client: TestClient, db_session: Session) ->
 student_bearer_scheme = HTTPBearer()
 
 
-async def get_current_student(
-    credentials: HTTPAuthorizationCredentials = Depends(student_bearer_scheme),
-    db: Session = Depends(get_db),
-) -> Student:
+def _student_number_from_credentials(credentials: HTTPAuthorizationCredentials) -> str:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -192,9 +191,16 @@ async def get_current_student(
             detail="Not enough permissions",
         )
 
-    student = db.query(Student).filter(Student.student_number == sub).first()
+    return sub
+
+
+def _ensure_active_student(student: Optional[Student]) -> Student:
     if not student:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
     if hasattr(student, "is_active") and not student.is_active:
         raise HTTPException(
@@ -205,11 +211,31 @@ async def get_current_student(
     return student
 
 
+# Plain `def`: the lookup is blocking I/O, so FastAPI runs it in the threadpool.
+def get_current_student(
+    credentials: HTTPAuthorizationCredentials = Depends(student_bearer_scheme),
+    db: Session = Depends(get_db),
+) -> Student:
+    sub = _student_number_from_credentials(credentials)
+    student = db.query(Student).filter(Student.student_number == sub).first()
+    return _ensure_active_student(student)
+
+
+async def get_current_student_async(
+    credentials: HTTPAuthorizationCredentials = Depends(student_bearer_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> Student:
+    """Same contract as get_current_student, for routes running on the async engine."""
+    sub = _student_number_from_credentials(credentials)
+    result = await db.execute(select(Student).where(Student.student_number == sub))
+    return _ensure_active_student(result.scalars().first())
+
+
 # HTTP Bearer scheme – Swagger will show a simple "Value" field
 bearer_scheme = HTTPBearer(auto_error=True)
 
 
-async def get_current_admin(
+def get_current_admin(
     credentials: HTTPAuthorizationCredentials = Depends(admin_bearer),
     db: Session = Depends(get_db),
 ) -> Admin:
@@ -304,7 +330,7 @@ def _raise_unauthorized(detail: str = "Could not validate credentials") -> None:
     )
 
 
-async def get_current_professor(
+def get_current_professor(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_professor_scheme),
     db: Session = Depends(get_db),
 ) -> Professor:
@@ -4,27 +4,50 @@ from __future__ import annotations
 
 from datetime import datetime, time
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Time # type: ignore
+from sqlalchemy import DDL, Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Time, UniqueConstraint, event, update # type: ignore
 from sqlalchemy.sql import func # type: ignore
 from sqlalchemy.sql import text
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import attributes, object_session, relationship
 from sqlalchemy.ext.associationproxy import association_proxy
 
 
 from backend.app.database import Base   
 
+from backend.app.models.course_meeting import CourseMeeting  # noqa: F401  (registers the mapper)
 from backend.app.models.course_prerequisite import CoursePrerequisite
+from backend.app.models.professor import Professor, professor_id_for_key
+from backend.app.utils.text_search import course_search_text, fold_text
 
 from sqlalchemy.orm import relationship
 
 class Course(Base):
     __tablename__ = "courses"
+    # Faceted catalog filters and facet counts (course_repository.CatalogFilters)
+    __table_args__ = (
+        # One offering per course code and semester (create/update checks, bulk upsert key)
+        UniqueConstraint("code", "semester", name="uq_courses_code_semester"),
+        Index("ix_courses_semester_department", "semester", "department"),
+        Index("ix_courses_semester_day_start", "semester", "day_of_week", "start_time"),
+        Index("ix_courses_semester_units", "semester", "units"),
+        # Professor course lists and ownership checks (professor_service)
+        Index("ix_courses_professor_semester", "professor_id", "semester"),
+        # Owner resolution by folded professor name (hooks below)
+        Index("ix_courses_professor_key_owner", "professor_key", "professor_id"),
+    )
 
     id: int = Column(Integer, primary_key=True, index=True)
     code: str = Column(String(20), index=True, nullable=False)
     name: str = Column(String(100), nullable=False)
     capacity: int = Column(Integer, nullable=False)
+    # Maintained seat counter (enrollments in this offering); updated atomically
+    # by enrollment_repository.create/delete so capacity checks never COUNT(*).
+    seats_taken: int = Column(Integer, nullable=False, default=0, server_default=text("0"))
     professor_name: str = Column(String(100), nullable=False)
+    # Owning professor account, resolved from professor_name by the hooks below
+    # (NULL while no professor with that name exists).
+    professor_id: int = Column(Integer, ForeignKey("professors.id", ondelete="SET NULL"), nullable=True)
+    # Folded professor_name, matched against Professor.name_key
+    professor_key: str = Column(String(100), nullable=False, default="", server_default="")
 
     # e.g. "SAT", "SUN", "MON", etc.
     day_of_week: str = Column(String(10), nullable=False)
@@ -61,8 +84,25 @@ class Course(Base):
     units: int = Column(Integer, nullable=False)                   # 1..4 units
     department: str = Column(String(100), nullable=False)               # e.g. “Computer Engineering” 
     semester: str = Column(String(20), nullable=False)             # e.g. “2025-1”
+
+    # Folded code + name + professor_name + department (utils.text_search), kept up to date
+    # by the before_insert/before_update hooks below; the full-text index is built on it.
+    search_text: str = Column(String(400), nullable=False, default="", server_default="")
+
+    # Bumped by every write to the row (ORM flushes via the before_update hook below,
+    # seat counter UPDATEs in course_repository); course_repository.get_catalog_stamp
+    # sums it into the catalog ETag.
+    row_version: int = Column(Integer, nullable=False, default=1, server_default=text("1"))
 #    prerequisites: Optional[List[int]] = None # List of course IDs that are prerequisites
 
+    # Meetings after the first one (the columns above); see CourseMeeting
+    meetings = relationship(
+        "CourseMeeting",
+        back_populates="course",
+        cascade="all, delete-orphan",
+        order_by="CourseMeeting.id",
+    )
+
     # Links where THIS course requires others
     prerequisite_links = relationship(
         "CoursePrerequisite",
@@ -87,6 +127,11 @@ class Course(Base):
 
 
 
+    @property
+    def enrolled(self) -> int:
+        """Read-only alias used by CourseRead.enrolled."""
+        return int(self.seats_taken or 0)
+
     def __repr__(self) -> str:
         return (
             f"<Course id={self.id!r} "
@@ -108,4 +153,84 @@ class Course(Base):
         )
 
 
+# -----------------------------
+# Full-text search index on search_text
+# -----------------------------
+
+# MySQL: InnoDB FULLTEXT with the ngram parser (works for Persian and for partial words).
+Index(
+    "ft_courses_search_text",
+    Course.search_text,
+    mysql_prefix="FULLTEXT",
+    mysql_with_parser="ngram",
+).ddl_if(dialect="mysql")
+
+# SQLite: external-content FTS5 table over courses.search_text, synced by triggers so
+# every insert / update / delete (ORM or not) reaches the index.
+COURSE_SEARCH_SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS courses_fts USING fts5("
+    "search_text, content='courses', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS courses_fts_ai AFTER INSERT ON courses BEGIN "
+    "INSERT INTO courses_fts(rowid, search_text) VALUES (new.id, new.search_text); END",
+    "CREATE TRIGGER IF NOT EXISTS courses_fts_ad AFTER DELETE ON courses BEGIN "
+    "INSERT INTO courses_fts(courses_fts, rowid, search_text) VALUES ('delete', old.id, old.search_text); END",
+    "CREATE TRIGGER IF NOT EXISTS courses_fts_au AFTER UPDATE OF search_text ON courses BEGIN "
+    "INSERT INTO courses_fts(courses_fts, rowid, search_text) VALUES ('delete', old.id, old.search_text); "
+    "INSERT INTO courses_fts(rowid, search_text) VALUES (new.id, new.search_text); END",
+]
+
+for _statement in COURSE_SEARCH_SQLITE_DDL:
+    event.listen(Course.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    Course.__table__, "before_drop", DDL("DROP TABLE IF EXISTS courses_fts").execute_if(dialect="sqlite")
+)
+
+
+@event.listens_for(Course, "before_update")
+def _bump_row_version(mapper, connection, target: Course) -> None:
+    # before_update also fires for collection-only changes; only real column edits count
+    if object_session(target).is_modified(target, include_collections=False):
+        target.row_version = Course.row_version + 1
+
+
+@event.listens_for(Course, "before_insert")
+@event.listens_for(Course, "before_update")
+def _refresh_search_text(mapper, connection, target: Course) -> None:
+    target.search_text = course_search_text(
+        target.code, target.name, target.professor_name, target.department
+    )
+
 
+@event.listens_for(Course, "before_insert")
+def _set_professor_id(mapper, connection, target: Course) -> None:
+    target.professor_key = fold_text(target.professor_name)
+    if target.professor_id is None:
+        target.professor_id = professor_id_for_key(connection, target.professor_key)
+
+
+@event.listens_for(Course, "before_update")
+def _reset_professor_id(mapper, connection, target: Course) -> None:
+    # professor_name is what admins edit; keep the FK in step unless it was set explicitly
+    if not attributes.get_history(target, "professor_name").has_changes():
+        return
+    target.professor_key = fold_text(target.professor_name)
+    if not attributes.get_history(target, "professor_id").has_changes():
+        target.professor_id = professor_id_for_key(connection, target.professor_key)
+
+
+@event.listens_for(Professor, "after_insert")
+@event.listens_for(Professor, "after_update")
+def _claim_unowned_courses(mapper, connection, target: Professor) -> None:
+    """
+    A new (or renamed) professor takes over the courses already listed under their
+    name that have no owner yet: one UPDATE on the professor_key index, run only
+    when a professor account is written, never per request.
+    """
+    if not attributes.get_history(target, "full_name").has_changes():
+        return
+    courses = Course.__table__
+    connection.execute(
+        update(courses)
+        .where(courses.c.professor_key == target.name_key, courses.c.professor_id.is_(None))
+        .values(professor_id=target.id)
+    )
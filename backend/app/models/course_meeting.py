@@ -0,0 +1,40 @@
+# backend/app/models/course_meeting.py
+
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Index, Integer, String, Time
+from sqlalchemy.orm import relationship
+
+from backend.app.database import Base
+
+
+class CourseMeeting(Base):
+    """
+    An additional weekly meeting of a course. The Course row's own day_of_week /
+    start_time / end_time / location is the first meeting; courses that meet two or
+    three times a week add the others here instead of being duplicated.
+    """
+
+    __tablename__ = "course_meetings"
+
+    id = Column(Integer, primary_key=True)
+    course_id = Column(Integer, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # Same value sets as Course: "SAT", "SUN", ...
+    day_of_week = Column(String(10), nullable=False)
+    start_time = Column(Time, nullable=False)
+    end_time = Column(Time, nullable=False)
+    # NULL: same room as the course
+    location = Column(String(100), nullable=True)
+
+    __table_args__ = (
+        CheckConstraint("start_time < end_time", name="ck_course_meeting_times"),
+        # day / time-window catalog filters and conflict lookups
+        Index("ix_course_meetings_day_start_end", "day_of_week", "start_time", "end_time"),
+    )
+
+    course = relationship("Course", back_populates="meetings")
+
+    def __repr__(self) -> str:
+        return (
+            f"<CourseMeeting course_id={self.course_id} day_of_week={self.day_of_week!r} "
+            f"start_time={self.start_time!r} end_time={self.end_time!r}>"
+        )
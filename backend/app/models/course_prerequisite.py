@@ -13,6 +13,10 @@ class CoursePrerequisite(Base):
     course_id = Column(Integer, ForeignKey("courses.id", ondelete="CASCADE"), primary_key=True, index=True)
     prereq_course_id = Column(Integer, ForeignKey("courses.id", ondelete="CASCADE"), primary_key=True, index=True)
 
+    # NULL: this prerequisite is required on its own ("all of").
+    # Links of one course sharing a number form an "any of" group: passing one of them is enough.
+    any_of_group = Column(Integer, nullable=True)
+
     __table_args__ = (
         UniqueConstraint("course_id", "prereq_course_id", name="uq_course_prereq_pair"),
         CheckConstraint("course_id <> prereq_course_id", name="ck_course_not_self_prereq"),
@@ -23,4 +27,7 @@ class CoursePrerequisite(Base):
     prerequisite = relationship("Course", foreign_keys=[prereq_course_id], back_populates="dependent_links")
 
     def __repr__(self) -> str:
-        return f"<CoursePrerequisite course_id={self.course_id} prereq_course_id={self.prereq_course_id}>"
+        return (
+            f"<CoursePrerequisite course_id={self.course_id} prereq_course_id={self.prereq_course_id} "
+            f"any_of_group={self.any_of_group}>"
+        )
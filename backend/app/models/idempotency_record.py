@@ -0,0 +1,44 @@
+# backend/app/models/idempotency_record.py
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.sql import func
+
+from backend.app.database import Base
+
+
+class IdempotencyRecord(Base):
+    """
+    Stored outcome of an enroll/drop request sent with an Idempotency-Key header.
+    A retry with the same key (same student) replays status + body until expires_at.
+    The row is inserted as pending (no status) before the request runs, so a retry
+    that arrives meanwhile is turned away instead of enrolling twice.
+    Timestamps are naive UTC.
+    """
+
+    __tablename__ = "idempotency_records"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
+    key = Column(String(255), nullable=False)
+
+    # sha256 of method + path + body; a reused key with a different request is rejected
+    request_fingerprint = Column(String(64), nullable=False)
+
+    # NULL while the first request with this key is still running
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(Text, nullable=True)  # JSON; NULL for 204
+
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("student_id", "key", name="uq_idempotency_student_key"),
+        Index("ix_idempotency_expires_at", "expires_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<IdempotencyRecord id={self.id} student_id={self.student_id} "
+            f"key={self.key!r} status_code={self.status_code}>"
+        )
@@ -1,9 +1,12 @@
 # backend/app/models/professor.py
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, event, select
 from sqlalchemy.sql import func
 
 from backend.app.database import Base
+from backend.app.utils.text_search import fold_text
 
 
 class Professor(Base):
@@ -16,6 +19,9 @@ class Professor(Base):
 
     # Profile
     full_name = Column(String(100), nullable=False)
+    # Folded full_name (utils.text_search.fold_text), kept up to date by the hook below;
+    # courses are matched to their owner on it (Course.professor_key).
+    name_key = Column(String(100), index=True, nullable=False, default="", server_default="")
     email = Column(String(100), unique=True, index=True, nullable=True)
 
     # Auth
@@ -33,3 +39,33 @@ class Professor(Base):
 
     def __repr__(self) -> str:
         return f"<Professor id={self.id} code={self.professor_code!r}>"
+
+
+@event.listens_for(Professor, "before_insert")
+@event.listens_for(Professor, "before_update")
+def _refresh_name_key(mapper, connection, target: Professor) -> None:
+    target.name_key = fold_text(target.full_name)
+
+
+def professor_id_for_key(bind, key: str) -> Optional[int]:
+    """
+    Id of the professor whose folded full_name is `key` (a Session or a Connection),
+    or None. When two professors share a name the older account wins.
+    """
+    return bind.execute(
+        select(Professor.id).where(Professor.name_key == key).order_by(Professor.id).limit(1)
+    ).scalar()
+
+
+def professor_ids_by_key(bind, keys: Iterable[str]) -> Dict[str, int]:
+    """{folded full_name: professor id} for `keys` only, in one indexed query."""
+    ids: Dict[str, int] = {}
+    keys = set(keys)
+    if not keys:
+        return ids
+    rows = bind.execute(
+        select(Professor.id, Professor.name_key).where(Professor.name_key.in_(keys)).order_by(Professor.id)
+    )
+    for professor_id, name_key in rows:
+        ids.setdefault(name_key, professor_id)
+    return ids
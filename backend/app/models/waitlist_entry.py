@@ -0,0 +1,39 @@
+# backend/app/models/waitlist_entry.py
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+
+from backend.app.database import Base
+
+
+class WaitlistEntry(Base):
+    """
+    One student waiting for a seat in a course for a given term.
+    Queue order is FIFO by id within (course_id, term).
+    """
+
+    __tablename__ = "course_waitlist"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False, index=True)
+    course_id = Column(Integer, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False)
+
+    term = Column(String(32), nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("student_id", "course_id", "term", name="uq_waitlist_student_course_term"),
+        Index("ix_waitlist_course_term_id", "course_id", "term", "id"),
+    )
+
+    student = relationship("Student")
+    course = relationship("Course")
+
+    def __repr__(self) -> str:
+        return (
+            f"<WaitlistEntry id={self.id} student_id={self.student_id} "
+            f"course_id={self.course_id} term={self.term!r}>"
+        )
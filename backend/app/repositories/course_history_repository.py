@@ -2,27 +2,83 @@
 
 from __future__ import annotations
 
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List, Set, Tuple
 
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from backend.app.config.settings import settings
 from backend.app.models.student_course_history import StudentCourseHistory
+from backend.app.utils import student_cache
+from backend.app.utils.passed_courses import PassedCourseSet
+
+
+# One compact passed-course set per student; term-independent, so keyed by a fixed term slot.
+_passed_cache = student_cache.StudentTermCache(ttl_seconds=settings.PASSED_COURSES_CACHE_TTL_SECONDS)
+_PASSED_SLOT = "passed"
+
+
+def get_passed_course_set(db: Session, student_id: int) -> PassedCourseSet:
+    """
+    Every course the student has passed, as a PassedCourseSet (one query on a miss).
+
+    Cached per student and dropped whenever a history row of the student is
+    written (create_history_record, or any flush touching StudentCourseHistory).
+    """
+    passed = _passed_cache.get(student_id, _PASSED_SLOT)
+    if passed is None:
+        generation = _passed_cache.generation(student_id)
+        rows = (
+            db.query(StudentCourseHistory.course_id)
+            .filter(
+                StudentCourseHistory.student_id == student_id,
+                StudentCourseHistory.status == "passed",
+            )
+            .all()
+        )
+        passed = PassedCourseSet.from_ids(course_id for (course_id,) in rows)
+        _passed_cache.set(student_id, _PASSED_SLOT, passed, generation=generation)
+    return passed
+
+
+def get_passed_course_sets(db: Session, student_ids: Iterable[int]) -> Dict[int, PassedCourseSet]:
+    """
+    {student_id: PassedCourseSet} for many students: cached sets are reused and all
+    misses are loaded with a single IN query.
+    """
+    result: Dict[int, PassedCourseSet] = {}
+    misses: Dict[int, Tuple[int, int]] = {}  # student_id -> cache generation before the read
+    for student_id in set(student_ids):
+        passed = _passed_cache.get(student_id, _PASSED_SLOT)
+        if passed is None:
+            misses[student_id] = _passed_cache.generation(student_id)
+        else:
+            result[student_id] = passed
+
+    if misses:
+        loaded: Dict[int, List[int]] = {sid: [] for sid in misses}
+        rows = (
+            db.query(StudentCourseHistory.student_id, StudentCourseHistory.course_id)
+            .filter(
+                StudentCourseHistory.student_id.in_(list(misses)),
+                StudentCourseHistory.status == "passed",
+            )
+            .all()
+        )
+        for student_id, course_id in rows:
+            loaded[student_id].append(course_id)
+        for student_id, course_ids in loaded.items():
+            passed = PassedCourseSet.from_ids(course_ids)
+            _passed_cache.set(student_id, _PASSED_SLOT, passed, generation=misses[student_id])
+            result[student_id] = passed
+    return result
 
 
 def has_passed_course(db: Session, student_id: int, course_id: int) -> bool:
     """
     Returns True if the student has ANY history record for the course with status == "passed".
     """
-    row = (
-        db.query(StudentCourseHistory.id)
-        .filter(
-            StudentCourseHistory.student_id == student_id,
-            StudentCourseHistory.course_id == course_id,
-            StudentCourseHistory.status == "passed",
-        )
-        .first()
-    )
-    return row is not None
+    return course_id in get_passed_course_set(db, student_id)
 
 
 def list_passed_courses(db: Session, student_id: int) -> List[int]:
@@ -30,17 +86,18 @@ def list_passed_courses(db: Session, student_id: int) -> List[int]:
     Returns a distinct list of course_id values for which the student has status == "passed".
     Stable ordering: course_id ASC.
     """
-    rows = (
-        db.query(StudentCourseHistory.course_id)
-        .filter(
-            StudentCourseHistory.student_id == student_id,
-            StudentCourseHistory.status == "passed",
-        )
-        .distinct()
-        .order_by(StudentCourseHistory.course_id.asc())
-        .all()
-    )
-    return [course_id for (course_id,) in rows]
+    return list(get_passed_course_set(db, student_id))
+
+
+def list_passed_course_ids_among(db: Session, student_id: int, course_ids: Iterable[int]) -> Set[int]:
+    """
+    Returns the subset of course_ids the student has passed.
+    Empty input short-circuits without touching the DB.
+    """
+    ids = set(course_ids)
+    if not ids:
+        return set()
+    return get_passed_course_set(db, student_id).intersection(ids)
 
 
 def create_history_record(
@@ -63,6 +120,15 @@ def create_history_record(
         grade=grade,
     )
     db.add(record)
+    student_cache.invalidate_student(db, student_id)
     db.commit()
     db.refresh(record)
-    return record
\ No newline at end of file
+    return record
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed_history(session: Session, flush_context) -> None:
+    # History rows written outside create_history_record (imports, admin tools, tests).
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, StudentCourseHistory) and obj.student_id is not None:
+            student_cache.invalidate_student(session, obj.student_id)
@@ -0,0 +1,49 @@
+# backend/app/repositories/course_meeting_repository.py
+
+from typing import Dict, Iterable, List, Mapping, Sequence
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from backend.app.models.course import Course
+from backend.app.models.course_meeting import CourseMeeting
+from backend.app.utils import student_cache
+
+
+def get_meetings_for_courses(db: Session, course_ids: Iterable[int]) -> Dict[int, List[CourseMeeting]]:
+    """
+    {course_id: [additional meetings, ordered by id]} for many courses in one IN query.
+    Every requested id is present; courses meeting once a week map to an empty list.
+    """
+    ids = set(course_ids)
+    meetings: Dict[int, List[CourseMeeting]] = {cid: [] for cid in ids}
+    if not ids:
+        return meetings
+    rows = (
+        db.query(CourseMeeting)
+        .filter(CourseMeeting.course_id.in_(ids))
+        .order_by(CourseMeeting.course_id.asc(), CourseMeeting.id.asc())
+        .all()
+    )
+    for meeting in rows:
+        meetings[meeting.course_id].append(meeting)
+    return meetings
+
+
+def replace_course_meetings(
+    db: Session, course_id: int, meetings: Sequence[Mapping[str, object]]
+) -> List[CourseMeeting]:
+    """
+    Replace the additional meetings of course_id with `meetings` (dicts of
+    day_of_week, start_time, end_time, location) in one transaction, bumping the
+    course's row_version so catalog ETags change.
+    """
+    db.query(CourseMeeting).filter(CourseMeeting.course_id == course_id).delete(synchronize_session="fetch")
+    rows = [CourseMeeting(course_id=course_id, **dict(m)) for m in meetings]
+    db.add_all(rows)
+    db.execute(update(Course).where(Course.id == course_id).values(row_version=Course.row_version + 1))
+    student_cache.invalidate_all(db)
+    db.commit()
+    for row in rows:
+        db.refresh(row)
+    return rows
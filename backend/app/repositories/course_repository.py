@@ -2,14 +2,196 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from datetime import time
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
 
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from sqlalchemy import Float, Integer, and_, bindparam, exists, func, insert, or_, select, text, tuple_, union, update
 
 
-from backend.app.models.course import Course
-from backend.app.schemas.course import CourseCreate, CourseUpdate
+from backend.app.models.course import COURSE_SEARCH_SQLITE_DDL, Course
+from backend.app.models.course_meeting import CourseMeeting
+from backend.app.models.professor import Professor, professor_ids_by_key
+from backend.app.models.enrollment import Enrollment
+from backend.app.schemas.course import COURSE_READ_FIELDS, CourseCreate, CourseUpdate
+from backend.app.utils import student_cache, text_search
+
+
+# Sort key of a catalog row: (full-text relevance, or None for the plain id order; course id)
+CourseKey = Tuple[Optional[float], int]
+
+
+class CatalogFilters(NamedTuple):
+    """
+    Faceted catalog filters. Empty tuples / None mean "no filter"; several values of
+    one field are OR-ed, different fields AND-ed. The time window keeps courses that
+    start at or after time_from and end at or before time_to. Day and time window
+    match when any one meeting of the course (its own columns or a CourseMeeting)
+    satisfies both.
+    """
+
+    semester: Optional[str] = None
+    departments: Tuple[str, ...] = ()
+    days: Tuple[str, ...] = ()
+    units: Tuple[int, ...] = ()
+    time_from: Optional[time] = None
+    time_to: Optional[time] = None
+
+
+NO_FILTERS = CatalogFilters()
+
+# CourseRead fields as columns, for listings that skip the ORM (enrolled is the seats counter)
+COURSE_READ_COLUMNS = tuple(
+    Course.seats_taken.label("enrolled") if field == "enrolled" else getattr(Course, field)
+    for field in COURSE_READ_FIELDS
+)
+
+# Facet name -> grouped column (each served by one of the (semester, ...) indexes on Course)
+CATALOG_FACETS = {
+    "department": Course.department,
+    "day_of_week": Course.day_of_week,
+    "units": Course.units,
+}
+
+
+def _meeting_match(model, filters: CatalogFilters, with_days: bool):
+    """Day / time-window conditions on one meeting (Course or CourseMeeting columns)."""
+    conditions = []
+    if with_days and filters.days:
+        conditions.append(model.day_of_week.in_(filters.days))
+    if filters.time_from is not None:
+        conditions.append(model.start_time >= filters.time_from)
+    if filters.time_to is not None:
+        conditions.append(model.end_time <= filters.time_to)
+    return conditions
+
+
+def _apply_filters(query, filters: CatalogFilters, *, except_facet: Optional[str] = None):
+    """
+    Apply filters to a Course query. except_facet leaves that facet's own filter out,
+    so its counts show what choosing another value would return.
+    """
+    if filters.semester is not None:
+        query = query.filter(Course.semester == filters.semester)
+    if filters.departments and except_facet != "department":
+        query = query.filter(Course.department.in_(filters.departments))
+    if filters.units and except_facet != "units":
+        query = query.filter(Course.units.in_(filters.units))
+
+    # Day / time window: the first meeting (Course columns) or any additional one
+    with_days = except_facet != "day_of_week"
+    primary = _meeting_match(Course, filters, with_days)
+    if primary:
+        additional = exists().where(
+            CourseMeeting.course_id == Course.id, *_meeting_match(CourseMeeting, filters, with_days)
+        )
+        query = query.filter(or_(and_(*primary), additional))
+    return query
+
+
+def _meeting_days():
+    """(course_id, day_of_week) of every meeting, first and additional, de-duplicated."""
+    return union(
+        select(Course.id.label("course_id"), Course.day_of_week),
+        select(CourseMeeting.course_id, CourseMeeting.day_of_week),
+    ).subquery("meeting_days")
+
+
+def _catalog_query(db: Session, q: Optional[str], only_active: bool):
+    """
+    The catalog query and its sort: (query, score, score_ascending).
+
+    Without search words score is None and rows are ordered by id. With q, rows must
+    match every word of q through the dialect's full-text index on Course.search_text
+    (FTS5 on SQLite, FULLTEXT/ngram on MySQL) and score is the relevance column;
+    other dialects fall back to LIKE on the folded column (id order).
+    """
+    query = db.query(Course)
+
+    # "Offered courses" -> usually means active courses only
+    if only_active and hasattr(Course, "is_active"):
+        query = query.filter(Course.is_active.is_(True))
+
+    tokens = text_search.search_tokens(q) if q else []
+    if not tokens:
+        return query, None, True
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        hits = (
+            text("SELECT rowid AS course_id, bm25(courses_fts) AS score FROM courses_fts WHERE courses_fts MATCH :match")
+            .bindparams(match=text_search.fts5_match_query(tokens))
+            .columns(course_id=Integer, score=Float)
+            .subquery("search_hits")
+        )
+        # bm25() is lower for better matches
+        return query.join(hits, hits.c.course_id == Course.id), hits.c.score, True
+
+    if dialect in ("mysql", "mariadb"):
+        relevance = Course.search_text.match(text_search.mysql_boolean_query(tokens))
+        return query.filter(relevance), relevance, False
+
+    for token in tokens:
+        query = query.filter(Course.search_text.like(f"%{token}%"))
+    return query, None, True
+
+
+def list_courses_page(
+    db: Session,
+    *,
+    limit: int = 100,
+    q: Optional[str] = None,
+    only_active: bool = True,
+    skip: int = 0,
+    after: Optional[CourseKey] = None,
+    filters: CatalogFilters = NO_FILTERS,
+    as_rows: bool = False,
+) -> Tuple[List[Any], Optional[CourseKey]]:
+    """
+    One catalog page, plus the sort key of its last row when more rows follow.
+    With as_rows the page is COURSE_READ_COLUMNS tuples instead of Course objects
+    (no identity map, no attribute instrumentation).
+
+    With `after` (keyset pagination) the page starts right after that key and `skip`
+    is ignored, so page N costs the same as page 1; otherwise `skip` rows are skipped
+    (legacy offset paging). Ordered by (relevance, id) for searches, id otherwise.
+    """
+    query, score, ascending = _catalog_query(db, q, only_active)
+    query = _apply_filters(query, filters)
+    if as_rows:
+        query = query.with_entities(*COURSE_READ_COLUMNS)
+
+    if after is not None:
+        after_score, after_id = after
+        if score is None or after_score is None:
+            query = query.filter(Course.id > after_id)
+        else:
+            beyond = score > after_score if ascending else score < after_score
+            query = query.filter(or_(beyond, and_(score == after_score, Course.id > after_id)))
+
+    if score is None:
+        query = query.order_by(Course.id.asc())
+    else:
+        query = query.add_columns(score).order_by(score.asc() if ascending else score.desc(), Course.id.asc())
+
+    if after is None and skip:
+        query = query.offset(skip)
+    rows = query.limit(limit + 1).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if score is None:
+        courses = rows
+        next_key = (None, rows[-1].id) if has_more else None
+    elif as_rows:
+        # score is the trailing column
+        courses = rows
+        next_key = (float(rows[-1][-1]), rows[-1].id) if has_more else None
+    else:
+        courses = [course for course, _ in rows]
+        next_key = (float(rows[-1][1]), rows[-1][0].id) if has_more else None
+    return courses, next_key
 
 
 def list_courses_filtered(
@@ -19,28 +201,131 @@ def list_courses_filtered(
     limit: int = 100,
     q: Optional[str] = None,
     only_active: bool = True,
+    filters: CatalogFilters = NO_FILTERS,
 ) -> List[Course]:
-    query = db.query(Course)
+    """
+    Catalog listing (offset paging); with q, a ranked full-text search over code, name,
+    professor_name and department (Persian/Arabic folded, word-prefix matches),
+    narrowed by the faceted filters.
+    """
+    courses, _ = list_courses_page(db, limit=limit, q=q, only_active=only_active, skip=skip, filters=filters)
+    return courses
 
-    # "Offered courses" -> usually means active courses only
-    if only_active and hasattr(Course, "is_active"):
-        query = query.filter(Course.is_active.is_(True))
 
-    if q:
-        term = q.strip().lower()
-        if term:
-            pattern = f"%{term}%"
-            query = query.filter(
-                or_(
-                    func.lower(Course.name).like(pattern),
-                    func.lower(Course.professor_name).like(pattern),
-                )
-            )
+def iter_course_row_batches(
+    db: Session, *, only_active: bool = False, batch_size: int = 1000
+) -> Iterator[Sequence[Any]]:
+    """
+    Every course as COURSE_READ_COLUMNS tuples, id order, batch_size rows at a time.
+    Streams through a server-side cursor (yield_per implies stream_results), so memory
+    stays at one batch whatever the catalog size.
+    """
+    stmt = select(*COURSE_READ_COLUMNS).order_by(Course.id.asc())
+    if only_active:
+        stmt = stmt.where(Course.is_active.is_(True))
+    result = db.execute(stmt.execution_options(yield_per=batch_size))
+    try:
+        yield from result.partitions()
+    finally:
+        result.close()
 
-    # stable ordering for pagination
-    query = query.order_by(Course.id.asc())
 
-    return query.offset(skip).limit(limit).all()
+def count_catalog_facets(
+    db: Session,
+    *,
+    q: Optional[str] = None,
+    only_active: bool = True,
+    filters: CatalogFilters = NO_FILTERS,
+) -> Dict[str, Dict[Any, int]]:
+    """
+    {facet: {value: number of matching courses}} for every facet in CATALOG_FACETS,
+    one GROUP BY query per facet. Each facet is counted under all the other filters
+    but not its own (multi-select faceting); day_of_week counts a course under every
+    day it meets on.
+    """
+    base, _, _ = _catalog_query(db, q, only_active)
+    facets: Dict[str, Dict[Any, int]] = {}
+    for name, column in CATALOG_FACETS.items():
+        query = _apply_filters(base, filters, except_facet=name)
+        if name == "day_of_week":
+            # A course is counted once under each day it meets on
+            days = _meeting_days()
+            query = query.join(days, days.c.course_id == Course.id)
+            column = days.c.day_of_week
+        rows = (
+            query.with_entities(column, func.count(Course.id.distinct()))
+            .group_by(column)
+            .order_by(column.asc())
+            .all()
+        )
+        facets[name] = {value: int(count) for value, count in rows}
+    return facets
+
+
+def rebuild_course_search_index(db: Session) -> None:
+    """
+    Recompute Course.search_text for every course and rebuild the full-text index.
+    One-off backfill for databases created before search_text existed (after adding
+    the column, plus the FULLTEXT index on MySQL).
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        for statement in COURSE_SEARCH_SQLITE_DDL:
+            db.execute(text(statement))
+
+    rows = db.query(Course.id, Course.code, Course.name, Course.professor_name, Course.department).all()
+    if rows:
+        db.execute(
+            update(Course),
+            [{"id": r.id, "search_text": text_search.course_search_text(*r[1:])} for r in rows],
+        )
+
+    if db.get_bind().dialect.name == "sqlite":
+        db.execute(text("INSERT INTO courses_fts(courses_fts) VALUES ('rebuild')"))
+    db.commit()
+
+
+def backfill_course_professors(db: Session) -> int:
+    """
+    One-off backfill after adding the owner columns: fill Professor.name_key and
+    Course.professor_key where still empty, then link every course without an owner
+    in one UPDATE matched on the name_key index (new writes are kept in step by the
+    mapper hooks on Course and Professor). Returns the number of courses linked.
+    """
+    professors = db.query(Professor.id, Professor.full_name).filter(Professor.name_key == "").all()
+    if professors:
+        db.execute(
+            update(Professor), [{"id": p.id, "name_key": text_search.fold_text(p.full_name)} for p in professors]
+        )
+    courses = db.query(Course.id, Course.professor_name).filter(Course.professor_key == "").all()
+    if courses:
+        db.execute(
+            update(Course), [{"id": c.id, "professor_key": text_search.fold_text(c.professor_name)} for c in courses]
+        )
+    owners = select(Professor.id).where(Professor.name_key == Course.professor_key)
+    result = db.execute(
+        update(Course)
+        .where(Course.professor_id.is_(None), owners.exists())
+        .values(professor_id=owners.with_only_columns(func.min(Professor.id)).scalar_subquery())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
+def get_catalog_stamp(db: Session) -> Tuple[Any, ...]:
+    """
+    Cheap version stamp of the whole courses table, for HTTP ETags: one aggregate
+    query, no rows loaded. Any insert, delete or write to a course changes it
+    (row count / max id / sum of Course.row_version / latest updated_at).
+    """
+    return tuple(
+        db.query(
+            func.count(Course.id),
+            func.max(Course.id),
+            func.sum(Course.row_version),
+            func.max(Course.updated_at),
+        ).one()
+    )
 
 
 def get_course_by_id(db: Session, course_id: int) -> Optional[Course]:
@@ -50,28 +335,194 @@ def get_course_by_id(db: Session, course_id: int) -> Optional[Course]:
     return db.query(Course).filter(Course.id == course_id).first()
 
 
+def get_courses_by_ids(db: Session, course_ids: Iterable[int]) -> List[Course]:
+    """
+    Return the courses whose id is in course_ids using a single IN query.
+    Missing ids are simply absent from the result.
+    """
+    ids = set(course_ids)
+    if not ids:
+        return []
+    return db.query(Course).filter(Course.id.in_(ids)).all()
+
+
+def get_existing_course_ids(db: Session, course_ids: Iterable[int]) -> Set[int]:
+    """Subset of course_ids that exist, in a single IN query (ids only)."""
+    ids = set(course_ids)
+    if not ids:
+        return set()
+    return {cid for (cid,) in db.query(Course.id).filter(Course.id.in_(ids)).all()}
+
+
+def list_term_courses(db: Session, term: str) -> List[Course]:
+    """All courses offered in `term` (Course.semester), ordered by code then id."""
+    return (
+        db.query(Course)
+        .filter(Course.semester == term)
+        .order_by(Course.code.asc(), Course.id.asc())
+        .all()
+    )
+
+
+def get_term_seats_left(db: Session, term: str) -> Dict[int, int]:
+    """{course_id: free seats} for every course of the term, from the seats_taken counter."""
+    rows = (
+        db.query(Course.id, Course.capacity, Course.seats_taken)
+        .filter(Course.semester == term)
+        .all()
+    )
+    return {cid: max(int(capacity or 0) - int(taken or 0), 0) for cid, capacity, taken in rows}
+
+
+def reserve_seat(db: Session, course_id: int) -> bool:
+    """
+    Atomically take one seat with a conditional UPDATE (no COUNT, no commit).
+    Returns False when the course is full (or does not exist).
+    """
+    result = db.execute(
+        update(Course)
+        .where(Course.id == course_id, Course.seats_taken < Course.capacity)
+        .values(seats_taken=Course.seats_taken + 1, row_version=Course.row_version + 1)
+    )
+    return result.rowcount == 1
+
+
+def release_seat(db: Session, course_id: int) -> None:
+    """
+    Give one seat back (no commit). Never drops below zero.
+    """
+    db.execute(
+        update(Course)
+        .where(Course.id == course_id, Course.seats_taken > 0)
+        .values(seats_taken=Course.seats_taken - 1, row_version=Course.row_version + 1)
+    )
+
+
+def recount_seats_taken(db: Session) -> None:
+    """
+    Rebuild every seats_taken counter from the enrollments table.
+    One-off backfill for databases created before the counter existed.
+    """
+    enrolled_count = (
+        select(func.count(Enrollment.id))
+        .where(Enrollment.course_id == Course.id)
+        .scalar_subquery()
+    )
+    db.execute(update(Course).values(seats_taken=enrolled_count, row_version=Course.row_version + 1))
+    db.commit()
+
+
 def get_courses(
     db: Session,
     skip: int = 0,
     limit: int = 100,
 ) -> List[Course]:
     """
-    Return a list of courses with basic pagination (offset + limit).
+    Return a list of courses with basic pagination (offset + limit), ordered by id.
     """
     return (
         db.query(Course)
+        .order_by(Course.id.asc())
         .offset(skip)
         .limit(limit)
         .all()
     )
 
 
-def get_course_by_code(db: Session, code: str) -> Optional[Course]:
+# Columns an upsert writes (CourseCreate fields), keyed by (code, semester)
+COURSE_WRITE_FIELDS = tuple(CourseCreate.model_fields)
+
+CourseNaturalKey = Tuple[str, str]
+
+
+def get_courses_by_code_semester(db: Session, keys: Iterable[CourseNaturalKey]) -> Dict[CourseNaturalKey, Any]:
+    """
+    {(code, semester): row of id + COURSE_WRITE_FIELDS} for the keys that exist,
+    in a single row-value IN query (no ORM objects).
+    """
+    keys = set(keys)
+    if not keys:
+        return {}
+    rows = db.execute(
+        select(Course.id, *(getattr(Course, f) for f in COURSE_WRITE_FIELDS)).where(
+            tuple_(Course.code, Course.semester).in_(keys)
+        )
+    ).all()
+    return {(row.code, row.semester): row for row in rows}
+
+
+# Columns the mapper hooks on Course derive from COURSE_WRITE_FIELDS
+_DERIVED_FIELDS = ("search_text", "professor_key", "professor_id")
+
+
+def _derived_columns(row: Dict[str, Any], owners: Dict[str, int]) -> Dict[str, Any]:
+    professor_key = text_search.fold_text(row["professor_name"])
+    return {
+        "search_text": text_search.course_search_text(row["code"], row["name"], row["professor_name"], row["department"]),
+        "professor_key": professor_key,
+        "professor_id": owners.get(professor_key),
+    }
+
+
+def upsert_courses_chunk(db: Session, inserts: List[Dict[str, Any]], updates: List[Dict[str, Any]]) -> None:
+    """
+    Write one chunk of a bulk upsert in one transaction: an executemany INSERT for new
+    courses and an executemany UPDATE (by id, bumping row_version) for changed ones.
+
+    Core statements skip the mapper hooks, so search_text, professor_key and
+    professor_id are computed here (owners of the chunk's names in one query). Each dict holds COURSE_WRITE_FIELDS; updates also carry "id".
+    On a database error the chunk is rolled back and the error re-raised.
+    """
+    if not inserts and not updates:
+        return
+    table = Course.__table__
+    try:
+        owners = professor_ids_by_key(
+            db, {text_search.fold_text(row["professor_name"]) for row in (*inserts, *updates)}
+        )
+        if inserts:
+            db.execute(
+                insert(table),
+                [{**row, **_derived_columns(row, owners)} for row in inserts],
+            )
+        if updates:
+            stmt = (
+                update(table)
+                .where(table.c.id == bindparam("b_id"))
+                .values(
+                    {
+                        **{
+                            f: bindparam(f"b_{f}", type_=table.c[f].type)
+                            for f in (*COURSE_WRITE_FIELDS, *_DERIVED_FIELDS)
+                        },
+                        "row_version": table.c.row_version + 1,
+                    }
+                )
+            )
+            db.execute(
+                stmt,
+                [
+                    {
+                        "b_id": row["id"],
+                        **{f"b_{f}": value for f, value in _derived_columns(row, owners).items()},
+                        **{f"b_{f}": row[f] for f in COURSE_WRITE_FIELDS},
+                    }
+                    for row in updates
+                ],
+            )
+        student_cache.invalidate_all(db)
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        raise
+
+
+def get_course_by_code(db: Session, code: str, semester: str) -> Optional[Course]:
     """
-    Return a single Course by its unique course code, or None if not found.
-    Useful for uniqueness checks in the service layer.
+    Return the offering of course `code` in `semester` (unique together, like the
+    bulk upsert key), or None if not found. Used for uniqueness checks in the service layer.
     """
-    return db.query(Course).filter(Course.code == code).first()
+    return db.query(Course).filter(Course.code == code, Course.semester == semester).one_or_none()
 
 
 def create_course(db: Session, course_in: CourseCreate) -> Course:
@@ -80,6 +531,7 @@ def create_course(db: Session, course_in: CourseCreate) -> Course:
     """
     course = Course(**course_in.model_dump())
     db.add(course)
+    student_cache.invalidate_all(db)
     db.commit()
     db.refresh(course)
     return course
@@ -103,6 +555,7 @@ def update_course(
         setattr(db_course, field_name, value)
 
     db.add(db_course)
+    student_cache.invalidate_all(db)
     db.commit()
     db.refresh(db_course)
     return db_course
@@ -113,4 +566,5 @@ def delete_course(db: Session, db_course: Course) -> None:
     Delete an existing Course from the database.
     """
     db.delete(db_course)
+    student_cache.invalidate_all(db)
     db.commit()
@@ -2,26 +2,76 @@
 
 from __future__ import annotations
 
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List, Tuple
 
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
 from backend.app.models.enrollment import Enrollment
 from backend.app.models.course import Course
+from backend.app.repositories import course_repository
+from backend.app.utils import student_cache
+
+
+class SeatUnavailableError(Exception):
+    """Raised when the conditional seat reservation finds the course full."""
+
+    def __init__(self, message: str, course_id: Optional[int] = None):
+        super().__init__(message)
+        self.course_id = course_id
 
 
 def create(db: Session, *, student_id: int, course_id: int, term: str) -> Enrollment:
+    """
+    Reserve a seat (conditional UPDATE on courses.seats_taken) and insert the
+    enrollment in the same transaction.
+
+    Raises:
+        SeatUnavailableError: if seats_taken already reached capacity.
+    """
+    if not course_repository.reserve_seat(db, course_id):
+        raise SeatUnavailableError(f"No seat left: course_id={course_id}", course_id=course_id)
+
     enrollment = Enrollment(student_id=student_id, course_id=course_id, term=term)
     db.add(enrollment)
+    student_cache.invalidate_student(db, student_id, term)
     db.commit()
     db.refresh(enrollment)
     return enrollment
 
 
-def delete(db: Session, enrollment: Enrollment) -> None:
-    db.delete(enrollment)
+def create_many(db: Session, *, student_id: int, course_ids: List[int], term: str) -> List[Enrollment]:
+    """
+    Reserve a seat and insert an enrollment for every course_id, committing ONCE.
+    All-or-nothing: if any reservation fails the whole transaction is rolled back.
+
+    Raises:
+        SeatUnavailableError: for the first course that has no seat left
+            (its course_id is available as exc.course_id).
+    """
+    enrollments: List[Enrollment] = []
+    for course_id in course_ids:
+        if not course_repository.reserve_seat(db, course_id):
+            db.rollback()
+            raise SeatUnavailableError(f"No seat left: course_id={course_id}", course_id=course_id)
+        enrollments.append(Enrollment(student_id=student_id, course_id=course_id, term=term))
+
+    db.add_all(enrollments)
+    student_cache.invalidate_student(db, student_id, term)
     db.commit()
+    return enrollments
+
+
+def delete(db: Session, enrollment: Enrollment, *, commit: bool = True) -> None:
+    """
+    Delete the enrollment and give its seat back in the same transaction.
+    Pass commit=False to keep the transaction open (e.g. to promote a waitlisted student).
+    """
+    course_repository.release_seat(db, enrollment.course_id)
+    db.delete(enrollment)
+    student_cache.invalidate_student(db, enrollment.student_id, enrollment.term)
+    if commit:
+        db.commit()
 
 
 def get_by_student_course_term(
@@ -39,6 +89,10 @@ def get_by_student_course_term(
 
 
 def count_course_enrollments(db: Session, course_id: int, term: str) -> int:
+    """
+    Exact COUNT(*) for one course and term (audits / recounts). Listings must not
+    call this per row: they read Course.enrolled, backed by the seats_taken counter.
+    """
     return (
         db.query(func.count(Enrollment.id))
         .filter(Enrollment.course_id == course_id, Enrollment.term == term)
@@ -56,6 +110,55 @@ def list_student_enrollments(db: Session, student_id: int, term: str) -> List[En
     )
 
 
+def list_student_term_courses(db: Session, student_id: int, term: str) -> List[Tuple[Enrollment, Course]]:
+    """
+    Returns the student's enrollments for a term joined to their courses in ONE query.
+    Used by the enroll validation path (duplicate, time conflict and unit sum checks).
+    """
+    return (
+        db.query(Enrollment, Course)
+        .join(Course, Course.id == Enrollment.course_id)
+        .filter(Enrollment.student_id == student_id, Enrollment.term == term)
+        .order_by(Enrollment.id.asc())
+        .all()
+    )
+
+
+def list_term_courses_for_students(db: Session, student_ids: Iterable[int], term: str) -> Dict[int, List[Course]]:
+    """
+    {student_id: [courses enrolled in for the term]} for many students in ONE IN query.
+    Every requested id is present; students without enrollments map to an empty list.
+    """
+    ids = set(student_ids)
+    result: Dict[int, List[Course]] = {sid: [] for sid in ids}
+    if not ids:
+        return result
+    rows = (
+        db.query(Enrollment.student_id, Course)
+        .join(Course, Course.id == Enrollment.course_id)
+        .filter(Enrollment.student_id.in_(ids), Enrollment.term == term)
+        .order_by(Enrollment.id.asc())
+        .all()
+    )
+    for student_id, course in rows:
+        result[student_id].append(course)
+    return result
+
+
+def list_student_schedule_courses(db: Session, student_id: int, term: str) -> List[Course]:
+    """
+    Courses the student is enrolled in for a term, already ordered by start time
+    in SQL (one query), so schedule building never has to re-sort blocks.
+    """
+    return (
+        db.query(Course)
+        .join(Enrollment, Enrollment.course_id == Course.id)
+        .filter(Enrollment.student_id == student_id, Enrollment.term == term)
+        .order_by(Course.start_time.asc(), Course.id.asc())
+        .all()
+    )
+
+
 def sum_student_units(db: Session, student_id: int, term: str) -> int:
     total = (
         db.query(func.coalesce(func.sum(Course.units), 0))
@@ -85,4 +188,14 @@ def get_by_student_course_any_term(db: Session, student_id: int, course_id: int)
         db.query(Enrollment)
         .filter(Enrollment.student_id == student_id, Enrollment.course_id == course_id)
         .first()
-    )
\ No newline at end of file
+    )
+
+def list_student_term_course_ids(db: Session, student_id: int, term: str) -> List[int]:
+    """Ids of the courses the student is enrolled in for a term (index-only, sorted)."""
+    rows = (
+        db.query(Enrollment.course_id)
+        .filter(Enrollment.student_id == student_id, Enrollment.term == term)
+        .order_by(Enrollment.course_id.asc())
+        .all()
+    )
+    return [cid for (cid,) in rows]
@@ -0,0 +1,92 @@
+# backend/app/repositories/idempotency_repository.py
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.app.models.idempotency_record import IdempotencyRecord
+
+
+def get_live_record(db: Session, *, student_id: int, key: str, now: datetime) -> Optional[IdempotencyRecord]:
+    return (
+        db.query(IdempotencyRecord)
+        .filter(
+            IdempotencyRecord.student_id == student_id,
+            IdempotencyRecord.key == key,
+            IdempotencyRecord.expires_at > now,
+        )
+        .first()
+    )
+
+
+def claim_key(
+    db: Session,
+    *,
+    student_id: int,
+    key: str,
+    request_fingerprint: str,
+    now: datetime,
+    expires_at: datetime,
+) -> bool:
+    """
+    Insert a pending record (status_code NULL) for (student_id, key), clearing that
+    student's expired records first (which also frees an expired row holding the same key).
+
+    Returns False if another request holds or has completed the same key.
+    """
+    db.query(IdempotencyRecord).filter(
+        IdempotencyRecord.student_id == student_id,
+        IdempotencyRecord.expires_at <= now,
+    ).delete()
+
+    db.add(
+        IdempotencyRecord(
+            student_id=student_id,
+            key=key,
+            request_fingerprint=request_fingerprint,
+            status_code=None,
+            response_body=None,
+            expires_at=expires_at,
+        )
+    )
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return False
+    return True
+
+
+def complete_record(
+    db: Session,
+    *,
+    student_id: int,
+    key: str,
+    status_code: int,
+    response_body: Optional[str],
+    expires_at: datetime,
+) -> None:
+    """Fill in the outcome of a pending record."""
+    db.query(IdempotencyRecord).filter(
+        IdempotencyRecord.student_id == student_id,
+        IdempotencyRecord.key == key,
+        IdempotencyRecord.status_code.is_(None),
+    ).update(
+        {"status_code": status_code, "response_body": response_body, "expires_at": expires_at},
+        synchronize_session=False,
+    )
+    db.commit()
+
+
+def release_key(db: Session, *, student_id: int, key: str) -> None:
+    """Drop a pending record so the key can be retried (outcome not worth replaying)."""
+    db.query(IdempotencyRecord).filter(
+        IdempotencyRecord.student_id == student_id,
+        IdempotencyRecord.key == key,
+        IdempotencyRecord.status_code.is_(None),
+    ).delete(synchronize_session=False)
+    db.commit()
@@ -1,11 +1,25 @@
 # backend/app/repositories/prerequisite_repository.py
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from sqlalchemy import event, insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from backend.app.config.settings import settings
+from backend.app.models.course import Course
 from backend.app.models.course_prerequisite import CoursePrerequisite
+from backend.app.utils import student_cache
+from backend.app.utils.prerequisite_graph import PrerequisiteGraph, PrerequisiteLink
+from backend.app.utils.prerequisite_rules import PrerequisiteRule
+
+# Process-wide read model of course_prerequisites (see get_prereq_graph)
+prerequisite_graph = PrerequisiteGraph()
+
+# session.info key: graph changes flushed by the session's open transaction, applied on commit
+_GRAPH_PENDING = "prerequisite_graph_pending"
+# Pending entry meaning "reload the whole graph" (bulk statements, rolled-back SAVEPOINTs)
+_RELOAD = ("reload",)
 
 
 class DuplicatePrerequisiteError(Exception):
@@ -27,34 +41,74 @@ def get_prereq_link(
     )
 
 
-def get_prereqs_for_course(db: Session, course_id: int) -> List[CoursePrerequisite]:
-    """Return all prerequisite links for a given course_id."""
-    return (
-        db.query(CoursePrerequisite)
-        .filter(CoursePrerequisite.course_id == course_id)
-        .all()
-    )
+def get_prereq_graph(db: Session) -> PrerequisiteGraph:
+    """
+    Return the shared prerequisite graph, loading it with one query if it was never
+    loaded, was invalidated, or is older than PREREQ_GRAPH_RELOAD_SECONDS (which only
+    bounds staleness from writes made by other processes; local writes are applied
+    once they are committed, see the session listeners below).
 
+    If a commit changed or invalidated the graph while the rows were being read,
+    they may miss that change: they are not installed in the shared graph, and this
+    call answers from a private graph over the rows it read.
+    """
+    if prerequisite_graph.needs_load(settings.PREREQ_GRAPH_RELOAD_SECONDS):
+        generation = prerequisite_graph.generation
+        rows = db.query(
+            CoursePrerequisite.course_id, CoursePrerequisite.prereq_course_id, CoursePrerequisite.any_of_group
+        ).all()
+        if not prerequisite_graph.load(rows, generation=generation):
+            snapshot = PrerequisiteGraph()
+            snapshot.load(rows)
+            return snapshot
+    return prerequisite_graph
 
-def get_all_prereqs(db: Session) -> List[CoursePrerequisite]:
-    """Return all prerequisite links across all courses (stable ordering)."""
-    return (
-        db.query(CoursePrerequisite)
-        .order_by(CoursePrerequisite.course_id.asc(), CoursePrerequisite.prereq_course_id.asc())
-        .all()
-    )
+
+def get_prereqs_for_course(db: Session, course_id: int) -> List[PrerequisiteLink]:
+    """Return all prerequisite links for a given course_id (served from the graph)."""
+    return get_prereq_graph(db).links(course_id)
+
+
+def get_prereq_ids_for_course(db: Session, course_id: int) -> List[int]:
+    """Return direct prerequisite course ids for a given course_id (served from the graph)."""
+    return get_prereq_graph(db).direct_prereqs(course_id)
+
+
+def get_prereq_ids_for_courses(db: Session, course_ids: Iterable[int]) -> Dict[int, List[int]]:
+    """
+    Return {course_id: [prereq_course_id, ...]} for many courses (served from the graph).
+    Courses without prerequisites map to an empty list.
+    """
+    return get_prereq_graph(db).direct_prereqs_many(course_ids)
+
+
+def get_dependent_ids_for_courses(db: Session, course_ids: Iterable[int]) -> Dict[int, List[int]]:
+    """
+    Reverse index: {course_id: [course ids that list it as a direct prerequisite]}
+    for many courses (served from the graph, no per-course lazy loads).
+    """
+    graph = get_prereq_graph(db)
+    return {cid: graph.dependents(cid) for cid in set(course_ids)}
+
+
+def get_prereq_rule(db: Session, course_id: int) -> PrerequisiteRule:
+    """Compiled AND/OR prerequisite requirement of a course (served from the graph)."""
+    return get_prereq_graph(db).rule(course_id)
 
 
-def get_all_prereqs(db: Session) -> List[CoursePrerequisite]:
+def get_prereq_rules_for_courses(db: Session, course_ids: Iterable[int]) -> Dict[int, PrerequisiteRule]:
+    """{course_id: PrerequisiteRule} for many courses; courses without prerequisites get an empty rule."""
+    return get_prereq_graph(db).rules_many(course_ids)
+
+
+def get_all_prereqs(db: Session) -> List[PrerequisiteLink]:
     """Return all prerequisite links across all courses (stable ordering)."""
-    return (
-        db.query(CoursePrerequisite)
-        .order_by(
-            CoursePrerequisite.course_id.asc(),
-            CoursePrerequisite.prereq_course_id.asc(),
-        )
-        .all()
-    )
+    return get_prereq_graph(db).links()
+
+
+def would_create_cycle(db: Session, course_id: int, prereq_course_id: int) -> bool:
+    """True if course_id -> prereq_course_id would make a course (transitively) require itself."""
+    return get_prereq_graph(db).would_create_cycle(course_id, prereq_course_id)
 
 
 def add_prereq(db: Session, course_id: int, prereq_course_id: int) -> CoursePrerequisite:
@@ -75,6 +129,7 @@ def add_prereq(db: Session, course_id: int, prereq_course_id: int) -> CoursePrer
 
     link = CoursePrerequisite(course_id=course_id, prereq_course_id=prereq_course_id)
     db.add(link)
+    student_cache.invalidate_all(db)
 
     try:
         db.commit()
@@ -88,6 +143,53 @@ def add_prereq(db: Session, course_id: int, prereq_course_id: int) -> CoursePrer
     return link
 
 
+def add_prereqs_bulk(db: Session, links: List[Tuple[int, int]]) -> int:
+    """
+    Insert many (course_id, prereq_course_id) links with one executemany INSERT and
+    one commit. Callers validate first; a racing duplicate rolls everything back.
+
+    Raises:
+        DuplicatePrerequisiteError: if any link already exists at insert time.
+    """
+    if not links:
+        return 0
+
+    try:
+        db.execute(
+            insert(CoursePrerequisite),
+            [{"course_id": c, "prereq_course_id": p} for c, p in links],
+        )
+        student_cache.invalidate_all(db)
+        db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        raise DuplicatePrerequisiteError("A prerequisite relation in the batch already exists.") from exc
+    return len(links)
+
+
+def replace_prereqs(db: Session, course_id: int, links: List[Tuple[int, Optional[int]]]) -> None:
+    """
+    Replace every prerequisite link of course_id with `links`
+    ((prereq_course_id, any_of_group) pairs) in one transaction.
+
+    Raises:
+        DuplicatePrerequisiteError: if the new links collide at insert time.
+    """
+    try:
+        for link in db.query(CoursePrerequisite).filter(CoursePrerequisite.course_id == course_id).all():
+            db.delete(link)
+        # Flush the deletes first so re-added pairs are plain INSERTs (and graph adds) rather than row switches.
+        db.flush()
+        db.add_all(
+            CoursePrerequisite(course_id=course_id, prereq_course_id=p, any_of_group=g) for p, g in links
+        )
+        student_cache.invalidate_all(db)
+        db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        raise DuplicatePrerequisiteError("A prerequisite relation in the expression already exists.") from exc
+
+
 def remove_prereq(db: Session, course_id: int, prereq_course_id: int) -> bool:
     """
     Remove a course -> prerequisite relationship.
@@ -100,5 +202,61 @@ def remove_prereq(db: Session, course_id: int, prereq_course_id: int) -> bool:
         return False
 
     db.delete(link)
+    student_cache.invalidate_all(db)
     db.commit()
-    return True
\ No newline at end of file
+    return True
+
+# -----------------------------
+# Keep the in-memory graph in step with ORM writes
+# -----------------------------
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_links(session: Session, flush_context) -> None:
+    # Recorded, not applied: other sessions must not see links that may still roll back.
+    changes = []
+    for obj in (*session.new, *session.dirty):
+        if isinstance(obj, CoursePrerequisite):
+            changes.append(("add", obj.course_id, obj.prereq_course_id, obj.any_of_group))
+    for obj in session.deleted:
+        if isinstance(obj, CoursePrerequisite):
+            changes.append(("remove", obj.course_id, obj.prereq_course_id))
+        elif isinstance(obj, Course):
+            changes.append(("remove_course", obj.id))
+    if changes:
+        session.info.setdefault(_GRAPH_PENDING, []).extend(changes)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_on_bulk_statement(orm_execute_state) -> None:
+    # Bulk INSERT/UPDATE/DELETE bypasses the unit of work: reload instead of patching,
+    # now (readers reload committed rows) and again once the statement is committed.
+    if orm_execute_state.is_select:
+        return
+    mapper = orm_execute_state.bind_mapper
+    target = mapper.class_ if mapper is not None else None
+    # Course deletes cascade to links in the DB; seat-counter UPDATEs on courses are irrelevant.
+    if target is CoursePrerequisite or (target is Course and orm_execute_state.is_delete):
+        prerequisite_graph.invalidate()
+        orm_execute_state.session.info.setdefault(_GRAPH_PENDING, []).append(_RELOAD)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_links(session: Session) -> None:
+    for change in session.info.pop(_GRAPH_PENDING, ()):
+        if change == _RELOAD:
+            prerequisite_graph.invalidate()
+        elif change[0] == "add":
+            prerequisite_graph.add_link(*change[1:])
+        elif change[0] == "remove":
+            prerequisite_graph.remove_link(*change[1:])
+        else:
+            prerequisite_graph.remove_course(*change[1:])
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_links(session: Session, previous_transaction) -> None:
+    pending = session.info.pop(_GRAPH_PENDING, None)
+    if pending and previous_transaction.nested:
+        # Only a SAVEPOINT was rolled back; what the outer transaction flushed before it
+        # may still commit, so reload the graph if it does.
+        session.info[_GRAPH_PENDING] = [_RELOAD]
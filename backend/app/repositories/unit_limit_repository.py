@@ -8,6 +8,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from backend.app.models.unit_limit_policy import UnitLimitPolicy
+from backend.app.utils import student_cache
 
 DEFAULT_MIN_UNITS = 0
 DEFAULT_MAX_UNITS = 20
@@ -57,6 +58,8 @@ def set_policy(db: Session, min_units: int, max_units: int) -> UnitLimitPolicy:
     policy = get_or_create_policy(db)
     policy.min_units = min_units
     policy.max_units = max_units
+    # Every cached eligibility matrix carries the unit caps
+    student_cache.invalidate_all(db)
 
     try:
         db.commit()
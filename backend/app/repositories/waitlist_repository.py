@@ -0,0 +1,70 @@
+# backend/app/repositories/waitlist_repository.py
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.app.models.waitlist_entry import WaitlistEntry
+
+
+def get_entry(db: Session, student_id: int, course_id: int, term: str) -> Optional[WaitlistEntry]:
+    return (
+        db.query(WaitlistEntry)
+        .filter(
+            WaitlistEntry.student_id == student_id,
+            WaitlistEntry.course_id == course_id,
+            WaitlistEntry.term == term,
+        )
+        .first()
+    )
+
+
+def add_entry(db: Session, *, student_id: int, course_id: int, term: str) -> WaitlistEntry:
+    entry = WaitlistEntry(student_id=student_id, course_id=course_id, term=term)
+    db.add(entry)
+    db.commit()
+    db.refresh(entry)
+    return entry
+
+
+def delete_entry(db: Session, entry: WaitlistEntry, *, commit: bool = True) -> None:
+    db.delete(entry)
+    if commit:
+        db.commit()
+
+
+def get_position(db: Session, entry: WaitlistEntry) -> int:
+    """1-based queue position of the entry within its (course_id, term) queue."""
+    ahead = (
+        db.query(func.count(WaitlistEntry.id))
+        .filter(
+            WaitlistEntry.course_id == entry.course_id,
+            WaitlistEntry.term == entry.term,
+            WaitlistEntry.id < entry.id,
+        )
+        .scalar()
+        or 0
+    )
+    return int(ahead) + 1
+
+
+def list_course_queue(db: Session, course_id: int, term: str) -> List[WaitlistEntry]:
+    """Entries for (course_id, term) in FIFO order (served by ix_waitlist_course_term_id)."""
+    return (
+        db.query(WaitlistEntry)
+        .filter(WaitlistEntry.course_id == course_id, WaitlistEntry.term == term)
+        .order_by(WaitlistEntry.id.asc())
+        .all()
+    )
+
+
+def list_student_entries(db: Session, student_id: int, term: str) -> List[WaitlistEntry]:
+    return (
+        db.query(WaitlistEntry)
+        .filter(WaitlistEntry.student_id == student_id, WaitlistEntry.term == term)
+        .order_by(WaitlistEntry.id.asc())
+        .all()
+    )
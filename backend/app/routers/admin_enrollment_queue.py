@@ -0,0 +1,18 @@
+# backend/app/routers/admin_enrollment_queue.py
+
+from fastapi import APIRouter, Depends
+
+from backend.app.dependencies.auth import get_current_admin
+from backend.app.models.admin import Admin
+from backend.app.schemas.admission import AdmissionStatsRead
+from backend.app.services.admission_control import enrollment_admission
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+@router.get("/enrollment-queue", response_model=AdmissionStatsRead)
+def get_enrollment_queue_stats(
+    _current_admin: Admin = Depends(get_current_admin),
+) -> AdmissionStatsRead:
+    """Queue depth, wait times and rejection counts of the enrollment admission queue."""
+    return AdmissionStatsRead(**enrollment_admission.snapshot())
@@ -52,7 +52,7 @@ def student_me(current_student: Student = Depends(get_current_student)):
 
 
 @router.post("/professor/login", response_model=TokenResponse)
-async def professor_login(
+def professor_login(
     credentials: ProfessorLoginRequest,
     db: Session = Depends(get_db),
 ) -> TokenResponse:
@@ -97,7 +97,7 @@ async def professor_login(
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(
+def login(
     credentials: AdminLoginRequest,  # must remain {username, password}
     db: Session = Depends(get_db),
 ) -> TokenResponse:
@@ -146,7 +146,7 @@ async def login(
 
 
 @router.post("/student/login", response_model=TokenResponse)
-async def student_login(
+def student_login(
     credentials: StudentLoginRequest,
     db: Session = Depends(get_db),
 ) -> TokenResponse:
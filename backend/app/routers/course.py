@@ -1,32 +1,62 @@
 # backend/app/routers/course.py
 
 
-from typing import List
+import csv
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
 from backend.app.database import get_db
-from backend.app.schemas.course import CourseCreate, CourseUpdate, CourseRead
+from backend.app.schemas.course import (
+    CourseCreate,
+    CourseMeetingRead,
+    CourseMeetingsReplace,
+    CourseRead,
+    CourseUpdate,
+    CourseUpsertReport,
+)
 from backend.app.services.course_service import (
+    bulk_upsert_courses_service,
+    catalog_etag_service,
     create_course_service,
-    list_courses_service,
+    export_courses_service,
+    list_course_meetings_service,
+    list_courses_page_service,
     get_course_service,
+    replace_course_meetings_service,
     update_course_service,
     delete_course_service,
+    CourseImportError,
     CourseNotFoundError,
     DuplicateCourseCodeError,
+    MeetingConflictError,
+)
+from backend.app.schemas.prerequisite import (
+    AnyOfGroup,
+    PrerequisiteCreate,
+    PrerequisiteExpressionRead,
+    PrerequisiteExpressionWrite,
+    PrerequisiteRead,
 )
-from backend.app.schemas.prerequisite import PrerequisiteCreate, PrerequisiteRead
 from backend.app.services.prerequisite_service import (
     add_prerequisite_service,
+    get_prerequisite_expression_service,
     list_prerequisites_service,
     remove_prerequisite_service,
+    set_prerequisite_expression_service,
     PrerequisiteNotFoundError,
     DuplicatePrerequisiteError,
     InvalidPrerequisiteRelationError,
 )
 from backend.app.models.admin import Admin
+from backend.app.utils.cursor import NEXT_CURSOR_HEADER, InvalidCursorError
+from backend.app.utils.etag import ETAG_HEADER, etag_matches, not_modified
+from backend.app.utils.fast_json import json_response
+from backend.app.utils.import_body import parse_import_body
+from backend.app.utils.row_export import EXPORT_MEDIA_TYPES
 from backend.app.dependencies.auth import get_current_admin, get_current_user_any_role
 
 
@@ -35,23 +65,81 @@ router = APIRouter(
     tags=["courses"],
 )
 
-@router.get("", response_model=List[CourseRead])
+@router.get("", response_model=List[CourseRead], response_class=ORJSONResponse)
 def list_courses(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(default=None, description=f"Value of {NEXT_CURSOR_HEADER} from the previous page"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_any_role),
 ):
-    courses = list_courses_service(db, skip=skip, limit=limit)
-    return courses
+    etag = catalog_etag_service(db, f"{request.url.path}?{request.url.query}")
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    headers = {ETAG_HEADER: etag}
+    try:
+        # column tuples straight to orjson: no ORM objects, no response_model pass
+        courses, next_cursor = list_courses_page_service(db, skip=skip, limit=limit, cursor=cursor, as_rows=True)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return json_response(courses, headers=headers)
+
+
+@router.post("/bulk", response_model=CourseUpsertReport)
+async def bulk_upsert_courses(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin),
+) -> CourseUpsertReport:
+    """
+    Bulk create / update of course offerings keyed by (code, semester), as a JSON array
+    or CSV upload in the request body. Written in chunked transactions; the response
+    reports every row.
+    """
+    try:
+        rows = parse_import_body(request.headers.get("content-type", ""), await request.body())
+    except (ValueError, UnicodeDecodeError, csv.Error) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unreadable import body: {e}")
+
+    try:
+        results = await run_in_threadpool(bulk_upsert_courses_service, db, rows)
+    except CourseImportError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    counts = {name: sum(1 for r in results if r["status"] == name) for name in ("created", "updated", "unchanged")}
+    return CourseUpsertReport(**counts, rejected=len(results) - sum(counts.values()), results=results)
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_courses(
+    format: Literal["ndjson", "csv"] = Query(default="ndjson"),
+    active_only: bool = False,
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin),
+):
+    """Stream the whole catalog (CourseRead columns) as NDJSON or CSV; memory stays constant."""
+    return StreamingResponse(
+        export_courses_service(db, fmt=format, only_active=active_only),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="courses.{format}"'},
+    )
 
 
 @router.get("/{course_id}", response_model=CourseRead)
 def get_course(
     course_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user_any_role),
 ):
+    etag = catalog_etag_service(db, f"{request.url.path}?{request.url.query}")
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    response.headers[ETAG_HEADER] = etag
     try:
         course = get_course_service(db, course_id)
         return course
@@ -74,7 +162,7 @@ def create_course(
     except DuplicateCourseCodeError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Course with this code already exists",
+            detail="Course with this code already exists in this semester",
         )
 
 
@@ -96,7 +184,7 @@ def update_course(
     except DuplicateCourseCodeError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Course with this code already exists",
+            detail="Course with this code already exists in this semester",
         )
 
 
@@ -116,6 +204,34 @@ def delete_course(
         )
 
 
+@router.get("/{course_id}/meetings", response_model=List[CourseMeetingRead])
+def list_course_meetings(
+    course_id: int,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user_any_role),
+):
+    """Additional weekly meetings of a course (its own day/time is the first meeting)."""
+    try:
+        return list_course_meetings_service(db, course_id)
+    except CourseNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course not found")
+
+
+@router.put("/{course_id}/meetings", response_model=List[CourseMeetingRead])
+def replace_course_meetings(
+    course_id: int,
+    payload: CourseMeetingsReplace,
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin),
+):
+    try:
+        return replace_course_meetings_service(db, course_id, payload.meetings)
+    except CourseNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course not found")
+    except MeetingConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
 @router.post(
     "/{course_id}/prerequisites",
     response_model=PrerequisiteRead,
@@ -160,6 +276,50 @@ def list_course_prerequisites(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
+def _to_expression_read(course_id: int, rule) -> PrerequisiteExpressionRead:
+    return PrerequisiteExpressionRead(
+        course_id=course_id,
+        all_of=[g[0] if len(g) == 1 else AnyOfGroup(any_of=list(g)) for g in rule.groups],
+        expression=rule.expression(),
+    )
+
+
+@router.get(
+    "/{course_id}/prerequisites/expression",
+    response_model=PrerequisiteExpressionRead,
+)
+def get_course_prerequisite_expression(
+    course_id: int,
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin),
+):
+    try:
+        return _to_expression_read(course_id, get_prerequisite_expression_service(db, course_id))
+    except PrerequisiteNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.put(
+    "/{course_id}/prerequisites/expression",
+    response_model=PrerequisiteExpressionRead,
+)
+def set_course_prerequisite_expression(
+    course_id: int,
+    payload: PrerequisiteExpressionWrite,
+    db: Session = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin),
+):
+    try:
+        rule = set_prerequisite_expression_service(db, course_id, payload.groups())
+        return _to_expression_read(course_id, rule)
+    except InvalidPrerequisiteRelationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except DuplicatePrerequisiteError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except PrerequisiteNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
 @router.delete(
     "/{course_id}/prerequisites/{prereq_course_id}",
     status_code=status.HTTP_204_NO_CONTENT,
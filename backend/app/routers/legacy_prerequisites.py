@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import csv
 from typing import List, Tuple
 
-from fastapi import APIRouter, Body, Depends, HTTPException, status, Response
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, status, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
@@ -15,9 +18,16 @@ from backend.app.schemas.legacy_prerequisite import (
     LegacyPrerequisiteCreate,
     LegacyPrerequisiteRead,
 )
+from backend.app.schemas.prerequisite import PrerequisiteImportReport
+from backend.app.utils.import_body import parse_import_body
+from backend.app.utils.etag import ETAG_HEADER, etag_matches, not_modified
+from backend.app.utils.fast_json import json_response
 from backend.app.services.prerequisite_service import (
     add_prerequisite_service,
+    bulk_import_prerequisites_service,
+    PrerequisiteImportError,
     list_all_prerequisites_service,
+    prerequisites_etag_service,
     remove_prerequisite_service,
     DuplicatePrerequisiteError,
     InvalidPrerequisiteRelationError,
@@ -76,13 +86,27 @@ def _parse_legacy_id(raw_id: str) -> Tuple[int, int]:
     return course_id, prereq_course_id
 
 
-@router.get("", response_model=List[LegacyPrerequisiteRead])
+@router.get("", response_model=List[LegacyPrerequisiteRead], response_class=ORJSONResponse)
 def list_all_prerequisites(
+    request: Request,
     db: Session = Depends(get_db),
     _current_user: dict = Depends(get_current_user_any_role),
 ) -> List[LegacyPrerequisiteRead]:
-    links = list_all_prerequisites_service(db)
-    return [_to_legacy_read(link) for link in links]
+    etag = prerequisites_etag_service(db, str(request.url.path))
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    # LegacyPrerequisiteRead-shaped dicts straight to orjson (no per-link model)
+    body = [
+        {
+            "id": _canonical_legacy_id(link.course_id, link.prereq_course_id),
+            "course_id": link.course_id,
+            "prereq_course_id": link.prereq_course_id,
+            "target_course_id": link.course_id,
+            "prerequisite_course_id": link.prereq_course_id,
+        }
+        for link in list_all_prerequisites_service(db)
+    ]
+    return json_response(body, headers={ETAG_HEADER: etag})
 
 
 @router.post("", response_model=LegacyPrerequisiteRead, status_code=status.HTTP_201_CREATED)
@@ -115,6 +139,42 @@ def create_prerequisite(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
+@router.post("/bulk", response_model=PrerequisiteImportReport)
+async def bulk_import_prerequisites(
+    request: Request,
+    all_or_nothing: bool = Query(default=False, description="Write nothing if any row is rejected"),
+    db: Session = Depends(get_db),
+    _current_admin: Admin = Depends(get_current_admin),
+) -> PrerequisiteImportReport:
+    """
+    Bulk import of prerequisite links (JSON array or CSV upload as the request body).
+
+    Each row uses either {course_id, prereq_course_id} or {target_course_id, prerequisite_course_id}.
+    Valid rows are inserted in one transaction; the response reports every row.
+    """
+    try:
+        rows = parse_import_body(request.headers.get("content-type", ""), await request.body())
+    except (ValueError, UnicodeDecodeError, csv.Error) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unreadable import body: {e}")
+
+    try:
+        results = await run_in_threadpool(
+            bulk_import_prerequisites_service, db, rows, all_or_nothing=all_or_nothing
+        )
+    except PrerequisiteImportError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(e), "results": e.results},
+        )
+    except InvalidPrerequisiteRelationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except DuplicatePrerequisiteError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    created = sum(1 for r in results if r["status"] == "created")
+    return PrerequisiteImportReport(created=created, rejected=len(results) - created, results=results)
+
+
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_prerequisite_legacy(
     id: str,
@@ -0,0 +1,30 @@
+# backend/app/routers/prerequisite_unlocks.py
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from backend.app.database import get_db
+from backend.app.dependencies.auth import get_current_admin
+from backend.app.models.admin import Admin
+from backend.app.schemas.prerequisite import UnlocksQuery, UnlocksReport
+from backend.app.services.prerequisite_service import PrerequisiteNotFoundError, get_unlocks_service
+
+router = APIRouter(prefix="/prerequisites", tags=["prerequisites"])
+
+
+@router.post("/unlocks", response_model=UnlocksReport)
+def get_unlocks(
+    payload: UnlocksQuery,
+    db: Session = Depends(get_db),
+    _current_admin: Admin = Depends(get_current_admin),
+) -> UnlocksReport:
+    """
+    Advisor view: which courses each of `course_ids` unlocks, and, per student in
+    `student_ids`, which courses would become eligible (prerequisite-wise) after passing it.
+    """
+    try:
+        return UnlocksReport(**get_unlocks_service(db, payload.course_ids, payload.student_ids))
+    except PrerequisiteNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -1,21 +1,78 @@
-from typing import Optional, List
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from datetime import time
+from typing import Optional, List, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.database import get_db
-from backend.app.dependencies.auth import get_current_student
+from backend.app.database import get_async_db
+from backend.app.dependencies.auth import get_current_student_async
 from backend.app.models.student import Student
-from backend.app.schemas.course import CourseRead
-from backend.app.services.course_service import list_student_catalog_courses_service
+from backend.app.repositories.course_repository import CatalogFilters
+from backend.app.schemas.course import DayOfWeek, StudentCatalogCourseRead, StudentCatalogPage
+from backend.app.services.course_service import (
+    catalog_etag_service,
+    list_student_catalog_page_service,
+    student_catalog_facets_service,
+)
+from backend.app.utils.cursor import NEXT_CURSOR_HEADER, InvalidCursorError
+from backend.app.utils.etag import ETAG_HEADER, etag_matches, not_modified
+from backend.app.utils.fast_json import json_response
 
 router = APIRouter(prefix="/student", tags=["student-courses"])
 
-@router.get("/courses", response_model=List[CourseRead])
-def list_student_courses(
-    q: Optional[str] = Query(default=None, description="Search across course name and professor name"),
+@router.get(
+    "/courses",
+    response_model=Union[List[StudentCatalogCourseRead], StudentCatalogPage],
+    response_class=ORJSONResponse,
+)
+async def list_student_courses(
+    request: Request,
+    q: Optional[str] = Query(default=None, description="Search across course code, name, professor and department"),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=200),
-    db: Session = Depends(get_db),
-    current_student: Student = Depends(get_current_student),
-) -> List[CourseRead]:
-    return list_student_catalog_courses_service(db, q=q, skip=skip, limit=limit)
+    cursor: Optional[str] = Query(default=None, description=f"Value of {NEXT_CURSOR_HEADER} from the previous page"),
+    semester: Optional[str] = Query(default=None),
+    department: List[str] = Query(default=[], description="Repeat to select several departments"),
+    day: List[DayOfWeek] = Query(default=[], description="Repeat to select several days"),
+    units: List[int] = Query(default=[], description="Repeat to select several unit counts"),
+    time_from: Optional[time] = Query(default=None, description="Courses starting at or after this time"),
+    time_to: Optional[time] = Query(default=None, description="Courses ending at or before this time"),
+    facets: bool = Query(default=False, description="Return {items, facets} with per-value counts"),
+    db: AsyncSession = Depends(get_async_db),
+    current_student: Student = Depends(get_current_student_async),
+) -> Union[List[StudentCatalogCourseRead], StudentCatalogPage]:
+    student_id = current_student.id
+    filters = CatalogFilters(
+        semester=semester,
+        departments=tuple(department),
+        days=tuple(d.value for d in day),
+        units=tuple(units),
+        time_from=time_from,
+        time_to=time_to,
+    )
+    request_key = f"{request.url.path}?{request.url.query}"
+    if_none_match = request.headers.get("if-none-match")
+
+    def _page(sync_db):
+        etag = catalog_etag_service(sync_db, request_key, student_id=student_id)
+        if etag_matches(if_none_match, etag):
+            return etag, None, None
+        # column tuples -> dicts -> orjson: no ORM objects, no per-row pydantic model
+        items, next_cursor = list_student_catalog_page_service(
+            sync_db, q=q, skip=skip, limit=limit, cursor=cursor, student_id=student_id, filters=filters, as_rows=True
+        )
+        if facets:
+            counts = student_catalog_facets_service(sync_db, q=q, filters=filters)
+            return etag, {"items": items, "facets": counts}, next_cursor
+        return etag, items, next_cursor
+
+    try:
+        etag, body, next_cursor = await db.run_sync(_page)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if body is None:
+        return not_modified(etag)
+    headers = {ETAG_HEADER: etag}
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return json_response(body, headers=headers)
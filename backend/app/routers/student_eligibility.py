@@ -0,0 +1,29 @@
+# backend/app/routers/student_eligibility.py
+
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.database import get_async_db
+from backend.app.dependencies.auth import get_current_student_async
+from backend.app.models.student import Student
+from backend.app.schemas.eligibility import EligibilityMatrixRead
+from backend.app.services.eligibility_service import get_eligibility_matrix
+
+router = APIRouter(prefix="/student", tags=["student-courses"])
+
+
+@router.get("/eligibility", response_model=EligibilityMatrixRead)
+async def get_my_eligibility(
+    term: Optional[str] = Query(default=None, description="Defaults to the current term"),
+    db: AsyncSession = Depends(get_async_db),
+    current_student: Student = Depends(get_current_student_async),
+) -> EligibilityMatrixRead:
+    """Which courses of the term the student can enroll in right now, and why not."""
+    student_id = current_student.id
+    return await db.run_sync(
+        lambda sync_db: get_eligibility_matrix(sync_db, student_id=student_id, term=term)
+    )
@@ -4,21 +4,30 @@ from __future__ import annotations
 
 import os
 from datetime import datetime, time as dtime
-from typing import Any
+from typing import Any, Callable, Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from backend.app.database import get_db  
+from backend.app.config.settings import settings
+from backend.app.database import get_async_db
 
-from backend.app.dependencies.auth import get_current_student
+from backend.app.dependencies.admission import enrollment_admission_slot
+from backend.app.dependencies.auth import get_current_student_async
 from backend.app.models.course import Course
 from backend.app.models.enrollment import Enrollment
 from backend.app.models.student import Student
+from backend.app.repositories import enrollment_repository
 from backend.app.services import unit_limit_service
 from backend.app.services import enrollment_service
+from backend.app.services import idempotency_service
+from backend.app.services import waitlist_service
+from backend.app.schemas.enrollment import EnrollmentBatchRead
 
 
 router = APIRouter(prefix="/student", tags=["student"])
@@ -55,58 +64,212 @@ class StudentEnrollmentItemRead(BaseModel):
     course: CourseMiniRead
 
 
-@router.post("/enrollments", status_code=status.HTTP_201_CREATED, response_model=EnrollmentRead)
-def enroll_student(
+# Routes below run on the async engine. Service/repository code stays sync and is
+# executed via `db.run_sync(...)`; response models are built inside the sync call so
+# nothing lazy-loads on the event loop.
+
+
+def _replay_response(stored: idempotency_service.StoredResponse) -> Response:
+    headers = {"Idempotent-Replayed": "true"}
+    if stored.body is None:
+        return Response(status_code=stored.status_code, headers=headers)
+    return JSONResponse(status_code=stored.status_code, content=stored.body, headers=headers)
+
+
+async def _run_idempotent(
+    db: AsyncSession,
+    request: Request,
+    *,
+    student_id: int,
+    idempotency_key: Optional[str],
+    body: Any,
+    success_status: int,
+    work: Callable[[Session], Any],
+) -> Any:
+    """
+    Run `work(sync_db)` once per Idempotency-Key.
+
+    A repeat of a stored key returns the stored status/body after a single lookup,
+    skipping every enrollment validation query. The key is claimed before `work`
+    runs, so a retry sent while the first request is still running gets a 409
+    instead of running it a second time. Without the header, `work` just runs.
+    """
+    if idempotency_key is None:
+        return await db.run_sync(work)
+
+    try:
+        key = idempotency_service.validate_key(idempotency_key)
+    except idempotency_service.InvalidIdempotencyKeyError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    fingerprint = idempotency_service.request_fingerprint(request.method, request.url.path, body)
+
+    def _run(sync_db: Session) -> Any:
+        stored = idempotency_service.claim_or_replay(
+            sync_db, student_id=student_id, key=key, fingerprint=fingerprint
+        )
+        if stored is not None:
+            return _replay_response(stored)
+
+        try:
+            result = work(sync_db)
+        except HTTPException as exc:
+            if exc.status_code in idempotency_service.REPLAYABLE_ERROR_STATUSES:
+                idempotency_service.store_response(
+                    sync_db,
+                    student_id=student_id,
+                    key=key,
+                    status_code=exc.status_code,
+                    body={"detail": jsonable_encoder(exc.detail)},
+                )
+            else:
+                idempotency_service.release(sync_db, student_id=student_id, key=key)
+            raise
+        except Exception:
+            sync_db.rollback()
+            idempotency_service.release(sync_db, student_id=student_id, key=key)
+            raise
+
+        idempotency_service.store_response(
+            sync_db,
+            student_id=student_id,
+            key=key,
+            status_code=success_status,
+            body=jsonable_encoder(result) if result is not None else None,
+        )
+        return result
+
+    try:
+        return await db.run_sync(_run)
+    except idempotency_service.IdempotencyKeyInProgressError as exc:
+        raise HTTPException(
+            status_code=409,
+            detail=str(exc),
+            headers={"Retry-After": str(settings.ENROLL_RETRY_AFTER_SECONDS)},
+        )
+    except idempotency_service.IdempotencyKeyReuseError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+
+@router.post(
+    "/enrollments",
+    status_code=status.HTTP_201_CREATED,
+    response_model=EnrollmentRead,
+    dependencies=[Depends(enrollment_admission_slot)],
+)
+async def enroll_student(
+    request: Request,
     payload: dict[str, Any] = Body(...),
-    db: Session = Depends(get_db),
-    current_student: Student = Depends(get_current_student),
+    db: AsyncSession = Depends(get_async_db),
+    current_student: Student = Depends(get_current_student_async),
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
 ):
     course_id = payload.get("course_id") or payload.get("courseId")
     if course_id is None:
         raise HTTPException(status_code=422, detail="course_id is required")
 
     term = payload.get("term") or _current_term()
-
-    try:
-        e = enrollment_service.enroll_student(
-            db,
-            student_id=current_student.id,
-            course_id=int(course_id),
-            term=term,
+    student_id = current_student.id
+
+    def _enroll(sync_db: Session) -> EnrollmentRead:
+        try:
+            e = enrollment_service.enroll_student(
+                sync_db,
+                student_id=student_id,
+                course_id=int(course_id),
+                term=term,
+            )
+        except enrollment_service.CourseNotFoundError:
+            raise HTTPException(status_code=404, detail="The requested course was not found.")
+        except enrollment_service.DuplicateEnrollmentError:
+            raise HTTPException(status_code=409, detail="Student is already enrolled in this course.")
+        except enrollment_service.CapacityFullError:
+            raise HTTPException(status_code=409, detail="Course is full.")
+        except enrollment_service.PrereqNotMetError as exc:
+            raise HTTPException(status_code=409, detail=str(exc))
+        except enrollment_service.TimeConflictError as exc:
+            raise HTTPException(status_code=409, detail=str(exc))
+        except enrollment_service.UnitLimitViolationError as exc:
+            raise HTTPException(status_code=409, detail=str(exc))
+
+        return EnrollmentRead(
+            course_id=e.course_id,
+            student_id=e.student_id,
+            term=e.term,
+            created_at=getattr(e, "created_at", None),
         )
-    except enrollment_service.CourseNotFoundError:
-        raise HTTPException(status_code=404, detail="The requested course was not found.")
-    except enrollment_service.DuplicateEnrollmentError:
-        raise HTTPException(status_code=409, detail="Student is already enrolled in this course.")
-    except enrollment_service.CapacityFullError:
-        raise HTTPException(status_code=409, detail="Course is full.")
-    except enrollment_service.PrereqNotMetError as exc:
-        raise HTTPException(status_code=409, detail=str(exc))
-    except enrollment_service.TimeConflictError as exc:
-        raise HTTPException(status_code=409, detail=str(exc))
-    except enrollment_service.UnitLimitViolationError as exc:
-        raise HTTPException(status_code=409, detail=str(exc))
-
-    return EnrollmentRead(
-        course_id=e.course_id,
-        student_id=e.student_id,
-        term=e.term,
-        created_at=getattr(e, "created_at", None),
-    )
 
+    return await _run_idempotent(
+        db,
+        request,
+        student_id=student_id,
+        idempotency_key=idempotency_key,
+        body=payload,
+        success_status=status.HTTP_201_CREATED,
+        work=_enroll,
+    )
 
 
-@router.get("/enrollments", response_model=list[StudentEnrollmentItemRead])
-def list_my_enrollments(
-    db: Session = Depends(get_db),
-    current_student: Student = Depends(get_current_student),
+@router.post(
+    "/enrollments/batch",
+    status_code=status.HTTP_201_CREATED,
+    response_model=EnrollmentBatchRead,
+    dependencies=[Depends(enrollment_admission_slot)],
+)
+async def enroll_student_batch(
+    request: Request,
+    payload: dict[str, Any] = Body(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_student: Student = Depends(get_current_student_async),
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
 ):
-    term = _current_term()
+    """
+    Cart checkout: enroll in every course of `course_ids` in one transaction, or none.
+    409 carries per-course diagnostics in detail.results.
+    """
+    course_ids = payload.get("course_ids") or payload.get("courseIds")
+    if not isinstance(course_ids, list) or not course_ids:
+        raise HTTPException(status_code=422, detail="course_ids must be a non-empty list")
+    try:
+        course_ids = [int(cid) for cid in course_ids]
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=422, detail="course_ids must contain integers")
+
+    term = payload.get("term") or _current_term()
+    student_id = current_student.id
+
+    def _checkout(sync_db: Session) -> EnrollmentBatchRead:
+        try:
+            results = enrollment_service.enroll_student_bulk(
+                sync_db,
+                student_id=student_id,
+                course_ids=course_ids,
+                term=term,
+            )
+        except enrollment_service.BulkEnrollmentError as exc:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": str(exc), "results": exc.results},
+            )
+        return EnrollmentBatchRead(term=term, results=results)
+
+    return await _run_idempotent(
+        db,
+        request,
+        student_id=student_id,
+        idempotency_key=idempotency_key,
+        body=payload,
+        success_status=status.HTTP_201_CREATED,
+        work=_checkout,
+    )
 
+
+
+def _list_enrollment_items(db: Session, student_id: int, term: str) -> list[StudentEnrollmentItemRead]:
     rows = (
         db.query(Enrollment, Course)
         .join(Course, Course.id == Enrollment.course_id)
-        .filter(Enrollment.student_id == current_student.id, Enrollment.term == term)
+        .filter(Enrollment.student_id == student_id, Enrollment.term == term)
         .all()
     )
 
@@ -145,18 +308,47 @@ def list_my_enrollments(
     return items
 
 
-@router.delete("/enrollments/{course_id}", status_code=status.HTTP_204_NO_CONTENT)
-def drop_student_course(
+@router.get("/enrollments", response_model=list[StudentEnrollmentItemRead])
+async def list_my_enrollments(
+    db: AsyncSession = Depends(get_async_db),
+    current_student: Student = Depends(get_current_student_async),
+):
+    student_id = current_student.id
+    term = _current_term()
+    return await db.run_sync(_list_enrollment_items, student_id, term)
+
+
+@router.delete(
+    "/enrollments/{course_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(enrollment_admission_slot)],
+)
+async def drop_student_course(
+    request: Request,
     course_id: int,
-    db: Session = Depends(get_db),
-    current_student: Student = Depends(get_current_student),
+    db: AsyncSession = Depends(get_async_db),
+    current_student: Student = Depends(get_current_student_async),
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
 ):
+    student_id = current_student.id
     term = _current_term()
+    replay = await _run_idempotent(
+        db,
+        request,
+        student_id=student_id,
+        idempotency_key=idempotency_key,
+        body=None,
+        success_status=status.HTTP_204_NO_CONTENT,
+        work=lambda sync_db: _drop_course(sync_db, student_id, course_id, term),
+    )
+    return replay if replay is not None else Response(status_code=status.HTTP_204_NO_CONTENT)
+
 
+def _drop_course(db: Session, student_id: int, course_id: int, term: str) -> None:
     enrollment = (
         db.query(Enrollment)
         .filter(
-            Enrollment.student_id == current_student.id,
+            Enrollment.student_id == student_id,
             Enrollment.course_id == course_id,
             Enrollment.term == term,
         )
@@ -177,7 +369,7 @@ def drop_student_course(
         db.query(func.coalesce(func.sum(Course.units), 0))
         .select_from(Enrollment)
         .join(Course, Course.id == Enrollment.course_id)
-        .filter(Enrollment.student_id == current_student.id, Enrollment.term == term)
+        .filter(Enrollment.student_id == student_id, Enrollment.term == term)
         .scalar()
     )
     total_units = int(total_units or 0)
@@ -186,6 +378,7 @@ def drop_student_course(
     if remaining_units < min_units:
         raise HTTPException(status_code=409, detail="Dropping would violate minimum units")
 
-    db.delete(enrollment)
-    db.commit()
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+    # Free the seat and hand it to the next eligible waitlisted student atomically
+    enrollment_repository.delete(db, enrollment, commit=False)
+    waitlist_service.promote_next(db, course_id=course_id, term=term)
+    db.commit()
\ No newline at end of file
@@ -1,10 +1,10 @@
 # backend/app/routers/student_schedule.py
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.database import get_db
-from backend.app.dependencies.auth import get_current_student
+from backend.app.database import get_async_db
+from backend.app.dependencies.auth import get_current_student_async
 from backend.app.models.student import Student
 from backend.app.schemas.schedule import WeeklyScheduleRead
 from backend.app.services.schedule_service import build_weekly_schedule
@@ -16,9 +16,10 @@ router = APIRouter()
     "/student/schedule",
     response_model=WeeklyScheduleRead,
 )
-def get_weekly_schedule(
-    db: Session = Depends(get_db),
-    current_student: Student = Depends(get_current_student),
+async def get_weekly_schedule(
+    db: AsyncSession = Depends(get_async_db),
+    current_student: Student = Depends(get_current_student_async),
 ):
+    student_id = current_student.id
     # Service enforces current-term scoping via get_current_term() when term is None
-    return build_weekly_schedule(db, student_id=current_student.id)
\ No newline at end of file
+    return await db.run_sync(lambda sync_db: build_weekly_schedule(sync_db, student_id=student_id))
@@ -0,0 +1,88 @@
+# backend/app/routers/student_waitlist.py
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
+from sqlalchemy.orm import Session
+
+from backend.app.database import get_db
+from backend.app.dependencies.auth import get_current_student
+from backend.app.models.student import Student
+from backend.app.schemas.waitlist import WaitlistPositionRead
+from backend.app.services import waitlist_service
+from backend.app.utils.current_term import get_current_term
+
+router = APIRouter(prefix="/student", tags=["student-waitlist"])
+
+
+@router.post("/waitlist", status_code=status.HTTP_201_CREATED, response_model=WaitlistPositionRead)
+def join_waitlist(
+    payload: dict[str, Any] = Body(...),
+    db: Session = Depends(get_db),
+    current_student: Student = Depends(get_current_student),
+):
+    course_id = payload.get("course_id") or payload.get("courseId")
+    if course_id is None:
+        raise HTTPException(status_code=422, detail="course_id is required")
+
+    term = payload.get("term") or get_current_term()
+
+    try:
+        entry, position = waitlist_service.join_waitlist(
+            db, student_id=current_student.id, course_id=int(course_id), term=term
+        )
+    except waitlist_service.CourseNotFoundError:
+        raise HTTPException(status_code=404, detail="The requested course was not found.")
+    except waitlist_service.AlreadyEnrolledError:
+        raise HTTPException(status_code=409, detail="Student is already enrolled in this course.")
+    except waitlist_service.AlreadyWaitlistedError:
+        raise HTTPException(status_code=409, detail="Student is already on this course's waitlist.")
+    except waitlist_service.SeatsAvailableError:
+        raise HTTPException(status_code=409, detail="Course has free seats; enroll directly.")
+
+    return WaitlistPositionRead(
+        course_id=entry.course_id, term=entry.term, position=position, created_at=entry.created_at
+    )
+
+
+@router.get("/waitlist", response_model=list[WaitlistPositionRead])
+def list_my_waitlist(
+    db: Session = Depends(get_db),
+    current_student: Student = Depends(get_current_student),
+):
+    return [
+        WaitlistPositionRead(course_id=e.course_id, term=e.term, position=pos, created_at=e.created_at)
+        for e, pos in waitlist_service.list_my_waitlist(db, student_id=current_student.id)
+    ]
+
+
+@router.get("/waitlist/{course_id}", response_model=WaitlistPositionRead)
+def get_waitlist_position(
+    course_id: int,
+    db: Session = Depends(get_db),
+    current_student: Student = Depends(get_current_student),
+):
+    term = get_current_term()
+    try:
+        position = waitlist_service.get_waitlist_position(
+            db, student_id=current_student.id, course_id=course_id, term=term
+        )
+    except waitlist_service.NotWaitlistedError:
+        raise HTTPException(status_code=404, detail="Not on the waitlist for this course")
+
+    return WaitlistPositionRead(course_id=course_id, term=term, position=position)
+
+
+@router.delete("/waitlist/{course_id}", status_code=status.HTTP_204_NO_CONTENT)
+def leave_waitlist(
+    course_id: int,
+    db: Session = Depends(get_db),
+    current_student: Student = Depends(get_current_student),
+):
+    try:
+        waitlist_service.leave_waitlist(db, student_id=current_student.id, course_id=course_id)
+    except waitlist_service.NotWaitlistedError:
+        raise HTTPException(status_code=404, detail="Not on the waitlist for this course")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,19 @@
+# backend/app/schemas/admission.py
+
+from pydantic import BaseModel
+
+
+class AdmissionStatsRead(BaseModel):
+    """
+    Snapshot of the in-process enrollment admission queue.
+    """
+    max_concurrent: int
+    max_queue: int
+    active: int
+    queue_depth: int
+    admitted: int
+    rejected_queue_full: int
+    rejected_per_key_limit: int
+    rejected_timeout: int
+    avg_wait_ms: float
+    max_wait_ms: float
@@ -7,7 +7,7 @@ from enum import Enum
 from typing import Optional
 from typing import List
 
-from pydantic import BaseModel, ConfigDict, conint, constr
+from pydantic import BaseModel, ConfigDict, conint, constr, model_validator
 
 
 class DayOfWeek(str, Enum):
@@ -134,9 +134,91 @@ class CourseRead(CourseBase):
     """
     id: int
     
-    # UI shim: frontend expects `course.enrolled`, but enrollments don't exist yet.
-    # This defaults to 0 and does NOT require a DB field.
+    # Frontend expects `course.enrolled`; read from the Course.enrolled property
+    # (backed by the maintained seats_taken counter). Defaults to 0.
     enrolled: int = 0
 
     # Pydantic v2 config
     model_config = ConfigDict(from_attributes=True)
+
+
+# CourseRead keys in serialization order (row-based fast path, see course_repository.COURSE_READ_COLUMNS)
+COURSE_READ_FIELDS = tuple(CourseRead.model_fields)
+
+
+class CourseMeetingBase(BaseModel):
+    """
+    One additional weekly meeting of a course (the course's own day/time is the
+    first one). location None means the course's own room.
+    """
+    day_of_week: DayOfWeek
+    start_time: time
+    end_time: time
+    location: Optional[constr(strip_whitespace=True, min_length=1)] = None
+
+    @model_validator(mode="after")
+    def validate_times(self) -> "CourseMeetingBase":
+        if self.start_time >= self.end_time:
+            raise ValueError("start_time must be before end_time.")
+        return self
+
+
+class CourseMeetingRead(CourseMeetingBase):
+    model_config = ConfigDict(from_attributes=True)
+
+
+# CourseMeetingRead keys in serialization order (row-based fast path)
+COURSE_MEETING_FIELDS = tuple(CourseMeetingRead.model_fields)
+
+
+class CourseMeetingsReplace(BaseModel):
+    """PUT /api/courses/{id}/meetings body: the complete list of additional meetings."""
+    meetings: List[CourseMeetingBase]
+
+
+class StudentCatalogCourseRead(CourseRead):
+    """
+    Student catalog row: CourseRead plus the course's additional meetings and
+    whether it clashes with the student's current-term schedule.
+    """
+    meetings: List[CourseMeetingRead] = []
+    has_time_conflict: bool = False
+
+
+class FacetCount(BaseModel):
+    value: str | int
+    count: int
+
+
+class CatalogFacets(BaseModel):
+    """Matching course counts per value of each filterable field."""
+    department: List[FacetCount] = []
+    day_of_week: List[FacetCount] = []
+    units: List[FacetCount] = []
+
+
+class StudentCatalogPage(BaseModel):
+    """Student catalog page with facet counts (GET /api/student/courses?facets=true)."""
+    items: List[StudentCatalogCourseRead]
+    facets: CatalogFacets
+
+
+class CourseUpsertRowResult(BaseModel):
+    """
+    One input row of a bulk course upsert.
+    status: created | updated | unchanged | duplicate_in_batch | invalid | failed
+    """
+    row: int  # 1-based position in the JSON array / CSV data rows
+    code: Optional[str] = None
+    semester: Optional[str] = None
+    course_id: Optional[int] = None
+    status: str
+    detail: Optional[str] = None
+
+
+class CourseUpsertReport(BaseModel):
+    created: int
+    updated: int
+    unchanged: int
+    rejected: int
+    results: List[CourseUpsertRowResult]
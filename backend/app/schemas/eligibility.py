@@ -0,0 +1,31 @@
+# backend/app/schemas/eligibility.py
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class CourseEligibilityRead(BaseModel):
+    course_id: int
+    code: str
+    name: str
+    units: int
+
+    already_enrolled: bool
+    prereqs_met: bool
+    missing_prereq_ids: List[int] = []  # every course of each unmet group (one per "any of" group suffices)
+    time_conflict: bool
+    conflicting_course_id: Optional[int] = None
+    unit_headroom: bool  # current units + this course <= max units
+    seats_left: int
+
+    eligible: bool  # every check above passes and at least one seat is free
+
+
+class EligibilityMatrixRead(BaseModel):
+    term: str
+    current_units: int
+    max_units: int
+    courses: List[CourseEligibilityRead]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -20,4 +20,16 @@ class StudentEnrollmentItemRead(BaseModel):
 
     term: str
     created_at: datetime
-    course: CourseRead
\ No newline at end of file
+    course: CourseRead
+
+
+class EnrollmentDiagnosticRead(BaseModel):
+    course_id: int
+    ok: bool
+    error: Optional[str] = None   # e.g. "capacity_full", "prereq_not_met", "time_conflict"
+    detail: Optional[str] = None
+
+
+class EnrollmentBatchRead(BaseModel):
+    term: str
+    results: List[EnrollmentDiagnosticRead]
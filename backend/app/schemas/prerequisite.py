@@ -1,8 +1,8 @@
 # backend/app/schemas/prerequisite.py
 
-from typing import List
+from typing import List, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class PrerequisiteCreate(BaseModel):
@@ -43,6 +43,7 @@ class PrerequisiteRead(BaseModel):
 
     course_id: int
     prereq_course_id: int
+    any_of_group: Optional[int] = None  # links sharing a number: passing any one of them is enough
 
 
 class PrerequisiteListResponse(BaseModel):
@@ -52,3 +53,74 @@ class PrerequisiteListResponse(BaseModel):
     Most endpoints can simply return List[PrerequisiteRead].
     """
     items: List[PrerequisiteRead]
+
+
+class AnyOfGroup(BaseModel):
+    """Satisfied by passing any one of the listed courses."""
+    any_of: List[int] = Field(..., min_length=1)
+
+
+class PrerequisiteExpressionWrite(BaseModel):
+    """
+    Full AND/OR prerequisite expression of a course. Every item of all_of must be
+    satisfied: an int is one required course, {"any_of": [...]} a group of alternatives.
+
+    "one of (CS101, CS102) and MATH201" -> {"all_of": [{"any_of": [<CS101>, <CS102>]}, <MATH201>]}
+    An empty all_of removes every prerequisite of the course.
+    """
+    all_of: List[Union[int, AnyOfGroup]]
+
+    def groups(self) -> List[List[int]]:
+        return [[item] if isinstance(item, int) else list(item.any_of) for item in self.all_of]
+
+
+class PrerequisiteExpressionRead(BaseModel):
+    course_id: int
+    all_of: List[Union[int, AnyOfGroup]]
+    expression: str  # human-readable, e.g. "(3 OR 4) AND 7"
+
+
+class UnlocksQuery(BaseModel):
+    """Batch "what does passing X unlock" query; student_ids adds a per-student view."""
+    course_ids: List[int] = Field(..., min_length=1, max_length=500)
+    student_ids: List[int] = Field(default_factory=list, max_length=500)
+
+
+class CourseUnlocksRead(BaseModel):
+    course_id: int
+    unlocks: List[int]  # courses that list course_id as a direct prerequisite
+
+
+class StudentCourseUnlocksRead(BaseModel):
+    course_id: int
+    already_passed: bool
+    unlocks: List[int]  # courses whose prerequisites become met once the student passes course_id
+
+
+class StudentUnlocksRead(BaseModel):
+    student_id: int
+    courses: List[StudentCourseUnlocksRead]
+
+
+class UnlocksReport(BaseModel):
+    courses: List[CourseUnlocksRead]
+    students: List[StudentUnlocksRead] = []
+
+
+class PrerequisiteImportRowResult(BaseModel):
+    """
+    One input row of a bulk import.
+    status: created | duplicate | duplicate_in_batch | course_not_found | invalid | cycle
+    (when the import is all-or-nothing and fails, valid rows report "valid" instead of "created").
+    """
+    row: int  # 1-based position in the JSON array / CSV data rows
+    course_id: Optional[int] = None
+    prereq_course_id: Optional[int] = None
+    status: str
+    detail: Optional[str] = None
+
+
+class PrerequisiteImportReport(BaseModel):
+    created: int
+    rejected: int
+    results: List[PrerequisiteImportRowResult]
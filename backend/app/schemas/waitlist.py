@@ -0,0 +1,15 @@
+# backend/app/schemas/waitlist.py
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class WaitlistPositionRead(BaseModel):
+    course_id: int
+    term: str
+    position: int  # 1-based
+    created_at: Optional[datetime] = None
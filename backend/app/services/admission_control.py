@@ -0,0 +1,161 @@
+# backend/app/services/admission_control.py
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter, deque
+from typing import Any, Deque, Dict, Hashable, Optional
+
+from backend.app.config.settings import settings
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a request cannot be admitted (queue full, per-key cap or wait timeout)."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"Admission rejected: {reason}")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Bounded in-process admission queue (single node, single event loop).
+
+    - At most `max_concurrent` holders run at once; the rest wait FIFO.
+    - At most `max_queue` waiters; beyond that requests are rejected immediately.
+    - Per-key fairness: one key (e.g. a student) may hold/await at most
+      `max_per_key` slots, so a single client cannot flood the queue.
+    - Waiters give up after `max_wait_seconds`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int,
+        max_queue: int,
+        max_wait_seconds: float,
+        retry_after_seconds: int = 1,
+        max_per_key: int = 1,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self.max_per_key = max_per_key
+
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._per_key: Counter = Counter()
+
+        self._admitted = 0
+        self._rejected: Counter = Counter()
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def acquire(self, key: Optional[Hashable] = None) -> float:
+        """
+        Wait for a slot. Returns the time spent queued (seconds).
+
+        Raises:
+            AdmissionRejectedError: queue full, per-key cap reached or wait timed out.
+        """
+        if key is not None and self._per_key[key] >= self.max_per_key:
+            self._reject("per_key_limit")
+
+        started = time.monotonic()
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+        else:
+            if len(self._waiters) >= self.max_queue:
+                self._reject("queue_full")
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            if key is not None:
+                self._per_key[key] += 1
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter), timeout=self.max_wait_seconds)
+            except BaseException as exc:  # timeout or client cancellation
+                if waiter.done() and not waiter.cancelled():
+                    # Slot was handed over right at the deadline: pass it on.
+                    self._release_slot()
+                else:
+                    waiter.cancel()
+                    self._remove_waiter(waiter)
+                if isinstance(exc, asyncio.TimeoutError):
+                    self._reject("timeout")
+                raise
+            finally:
+                if key is not None:
+                    self._per_key[key] -= 1
+                    if self._per_key[key] <= 0:
+                        del self._per_key[key]
+
+        if key is not None:
+            self._per_key[key] += 1
+
+        waited = time.monotonic() - started
+        self._admitted += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+        return waited
+
+    def release(self, key: Optional[Hashable] = None) -> None:
+        if key is not None:
+            self._per_key[key] -= 1
+            if self._per_key[key] <= 0:
+                del self._per_key[key]
+        self._release_slot()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "queue_depth": len(self._waiters),
+            "admitted": self._admitted,
+            "rejected_queue_full": self._rejected["queue_full"],
+            "rejected_per_key_limit": self._rejected["per_key_limit"],
+            "rejected_timeout": self._rejected["timeout"],
+            "avg_wait_ms": (self._total_wait / self._admitted * 1000.0) if self._admitted else 0.0,
+            "max_wait_ms": self._max_wait * 1000.0,
+        }
+
+    # -----------------------------
+    # internals
+    # -----------------------------
+
+    def _reject(self, reason: str) -> None:
+        self._rejected[reason] += 1
+        raise AdmissionRejectedError(reason, self.retry_after_seconds)
+
+    def _release_slot(self) -> None:
+        # Hand the slot directly to the oldest live waiter (FIFO); otherwise free it.
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    def _remove_waiter(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+
+def _from_settings() -> AdmissionController:
+    return AdmissionController(
+        max_concurrent=settings.ENROLL_MAX_CONCURRENCY,
+        max_queue=settings.ENROLL_QUEUE_SIZE,
+        max_wait_seconds=settings.ENROLL_QUEUE_TIMEOUT_SECONDS,
+        retry_after_seconds=settings.ENROLL_RETRY_AFTER_SECONDS,
+        max_per_key=settings.ENROLL_MAX_PENDING_PER_STUDENT,
+    )
+
+
+# Process-wide controller guarding the enrollment write routes
+enrollment_admission = _from_settings()
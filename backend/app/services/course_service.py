@@ -2,14 +2,45 @@
 
 from __future__ import annotations
 
-from typing import Optional,List
+import zlib
+from typing import Any, Dict, Iterator, Mapping, Optional, List, Sequence, Tuple
 
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from backend.app.models.course import Course
-from backend.app.repositories.course_repository import list_courses_filtered
-from backend.app.schemas.course import CourseCreate, CourseUpdate
 from backend.app.repositories.course_repository import (
+    COURSE_WRITE_FIELDS,
+    NO_FILTERS,
+    CatalogFilters,
+    CourseKey,
+    count_catalog_facets,
+    get_courses_by_code_semester,
+    iter_course_row_batches,
+    list_courses_page,
+    upsert_courses_chunk,
+)
+from backend.app.models.course_meeting import CourseMeeting
+from backend.app.schemas.course import (
+    COURSE_MEETING_FIELDS,
+    COURSE_READ_FIELDS,
+    CourseCreate,
+    CourseMeetingBase,
+    CourseUpdate,
+)
+from backend.app.repositories import course_meeting_repository, enrollment_repository
+from backend.app.services.schedule_service import build_weekly_occupancy
+from backend.app.utils import text_search
+from backend.app.utils.current_term import get_current_term
+from backend.app.utils.etag import make_etag
+from backend.app.utils.fast_json import rows_as_dicts
+from backend.app.utils.row_export import encode_csv, encode_ndjson
+from backend.app.utils.time_bitmap import WeeklyOccupancy
+from backend.app.utils.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from backend.app.repositories.course_repository import (
+    get_catalog_stamp,
     get_course_by_id,
     get_courses,
     get_course_by_code,
@@ -17,20 +48,138 @@ from backend.app.repositories.course_repository import (
     update_course,
     delete_course,
 )
-from backend.app.repositories import enrollment_repository
 
-def list_student_catalog_courses_service(
+
+def _cursor_scope(q: Optional[str], only_active: bool, filters: CatalogFilters = NO_FILTERS) -> str:
+    """Identifies a listing (filter + sort), so a cursor cannot be replayed against another one."""
+    words = " ".join(text_search.search_tokens(q)) if q else ""
+    scope = f"{only_active}|{words}" if filters == NO_FILTERS else f"{only_active}|{words}|{filters!r}"
+    return f"{zlib.crc32(scope.encode('utf-8')):08x}"
+
+
+def _encode_page_cursor(key: Optional[CourseKey], scope: str) -> Optional[str]:
+    if key is None:
+        return None
+    score, last_id = key
+    return encode_cursor({"id": last_id, "s": score, "scope": scope})
+
+
+def _decode_page_cursor(cursor: Optional[str], scope: str) -> Optional[CourseKey]:
+    if not cursor:
+        return None
+    payload = decode_cursor(cursor)
+    last_id, score = payload.get("id"), payload.get("s")
+    if (
+        payload.get("scope") != scope
+        or not isinstance(last_id, int)
+        or not (score is None or isinstance(score, (int, float)))
+    ):
+        raise InvalidCursorError("Cursor does not belong to this listing")
+    return score, last_id
+
+
+def _meeting_dicts(meetings: Sequence[CourseMeeting]) -> List[Dict[str, Any]]:
+    return [{f: getattr(m, f) for f in COURSE_MEETING_FIELDS} for m in meetings]
+
+
+def list_student_catalog_page_service(
     db: Session,
     *,
     q: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-) -> List[Course]:
+    cursor: Optional[str] = None,
+    student_id: Optional[int] = None,
+    filters: CatalogFilters = NO_FILTERS,
+    as_rows: bool = False,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    One page of the student catalog and the opaque cursor of the next page (None on
+    the last page). A cursor continues keyset paging and takes precedence over skip.
+    With as_rows the page is plain StudentCatalogCourseRead-shaped dicts read from
+    column tuples (JSON fast path) instead of Course objects.
+
+    Raises InvalidCursorError for a malformed cursor or one issued for another q or
+    other filters.
+    """
     # normalize empty/whitespace queries to None
     if q is not None and not q.strip():
         q = None
 
-    return list_courses_filtered(db, q=q, skip=skip, limit=limit, only_active=True)
+    scope = _cursor_scope(q, True, filters)
+    courses, next_key = list_courses_page(
+        db,
+        q=q,
+        skip=skip,
+        limit=limit,
+        after=_decode_page_cursor(cursor, scope),
+        only_active=True,
+        filters=filters,
+        as_rows=as_rows,
+    )
+
+    # Additional meetings of the whole page in one query
+    meetings = course_meeting_repository.get_meetings_for_courses(db, [c.id for c in courses])
+
+    # Flag courses clashing with the student's schedule: one bitmap, one AND per meeting
+    flags = (
+        build_weekly_occupancy(db, student_id).flag_conflicts(courses, meetings) if student_id is not None else {}
+    )
+    if as_rows:
+        items = rows_as_dicts(courses, COURSE_READ_FIELDS)
+        for item in items:
+            item["meetings"] = _meeting_dicts(meetings[item["id"]])
+            item["has_time_conflict"] = flags.get(item["id"], False)
+        return items, _encode_page_cursor(next_key, scope)
+    for c in courses:
+        # Populate the relationship from the batch instead of one lazy load per course
+        set_committed_value(c, "meetings", meetings[c.id])
+        if c.id in flags:
+            c.has_time_conflict = flags[c.id]
+
+    return courses, _encode_page_cursor(next_key, scope)
+
+
+def student_catalog_facets_service(
+    db: Session, *, q: Optional[str] = None, filters: CatalogFilters = NO_FILTERS
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Facet counts of the student catalog for the same q and filters as the listing:
+    {facet: [{"value": ..., "count": ...}, ...]} (grouped queries, no rows loaded).
+    """
+    if q is not None and not q.strip():
+        q = None
+    counts = count_catalog_facets(db, q=q, only_active=True, filters=filters)
+    return {
+        name: [{"value": value, "count": count} for value, count in values.items()]
+        for name, values in counts.items()
+    }
+
+
+def catalog_etag_service(db: Session, request_key: str, *, student_id: Optional[int] = None) -> str:
+    """
+    ETag of a course listing / course read: the catalog version stamp plus
+    request_key (path and query string). For the student catalog, the student's
+    term enrollments are part of the body (has_time_conflict), so they are too.
+    No course row is loaded.
+    """
+    stamp = get_catalog_stamp(db)
+    if student_id is None:
+        return make_etag(stamp, request_key)
+    term = get_current_term()
+    return make_etag(stamp, request_key, term, enrollment_repository.list_student_term_course_ids(db, student_id, term))
+
+
+def list_student_catalog_courses_service(
+    db: Session,
+    *,
+    q: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    student_id: Optional[int] = None,
+) -> List[Course]:
+    courses, _ = list_student_catalog_page_service(db, q=q, skip=skip, limit=limit, student_id=student_id)
+    return courses
 
 class CourseNotFoundError(Exception):
     """Raised when a course with the given ID does not exist."""
@@ -41,12 +190,40 @@ class DuplicateCourseCodeError(Exception):
 
 
 def list_courses_service(db: Session, skip: int = 0, limit: int = 100) -> List[Course]:
-    courses = get_courses(db=db, skip=skip, limit=limit)
+    # `enrolled` is read from Course.seats_taken (no per-course COUNT)
+    return get_courses(db=db, skip=skip, limit=limit)
 
-    for c in courses:
-        c.enrolled = enrollment_repository.count_course_enrollments(db, c.id, c.semester)
 
-    return courses
+def list_courses_page_service(
+    db: Session, *, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, as_rows: bool = False
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    All courses (active or not) by id, with the opaque cursor of the next page.
+    With as_rows the page is plain CourseRead-shaped dicts (JSON fast path).
+    """
+    scope = _cursor_scope(None, False)
+    courses, next_key = list_courses_page(
+        db, skip=skip, limit=limit, after=_decode_page_cursor(cursor, scope), only_active=False, as_rows=as_rows
+    )
+    if as_rows:
+        courses = rows_as_dicts(courses, COURSE_READ_FIELDS)
+    return courses, _encode_page_cursor(next_key, scope)
+
+
+def export_courses_service(
+    db: Session, *, fmt: str = "ndjson", only_active: bool = False, batch_size: int = 1000
+) -> Iterator[bytes]:
+    """
+    The whole catalog as NDJSON or CSV (CourseRead columns), one chunk per batch of
+    rows read from a server-side cursor; meant for a StreamingResponse.
+    """
+    if fmt == "csv":
+        yield encode_csv((), COURSE_READ_FIELDS, header=True)
+    for batch in iter_course_row_batches(db, only_active=only_active, batch_size=batch_size):
+        if fmt == "csv":
+            yield encode_csv(batch, COURSE_READ_FIELDS)
+        else:
+            yield encode_ndjson(batch, COURSE_READ_FIELDS)
 
 
 def get_course_service(db: Session, course_id: int) -> Course:
@@ -54,20 +231,18 @@ def get_course_service(db: Session, course_id: int) -> Course:
     if course is None:
         raise CourseNotFoundError(f"Course with id={course_id} not found")
 
-    course.enrolled = enrollment_repository.count_course_enrollments(db, course.id, course.semester)
-
     return course
 
 def create_course_service(db: Session, course_in: CourseCreate) -> Course:
     """
     Create a new course after enforcing basic business rules.
 
-    - Course code must be unique.
+    - Course code must be unique within the semester (the bulk upsert key).
     """
-    existing = get_course_by_code(db=db, code=course_in.code)
+    existing = get_course_by_code(db=db, code=course_in.code, semester=course_in.semester)
     if existing is not None:
         raise DuplicateCourseCodeError(
-            f"Course with code '{course_in.code}' already exists"
+            f"Course with code '{course_in.code}' already exists in semester '{course_in.semester}'"
         )
 
     course = create_course(db=db, course_in=course_in)
@@ -84,21 +259,22 @@ def update_course_service(
 
     Steps:
     - Ensure course exists.
-    - If the code is being changed, ensure the new code is still unique.
+    - If the code or semester is being changed, ensure (code, semester) is still unique.
     - Apply partial updates via repository.
     """
     db_course = get_course_by_id(db=db, course_id=course_id)
     if db_course is None:
         raise CourseNotFoundError(f"Course with id={course_id} not found")
 
-    # Check for code uniqueness if a new code is provided
-    if course_in.code is not None:
-        if course_in.code != db_course.code:
-            existing = get_course_by_code(db=db, code=course_in.code)
-            if existing is not None and existing.id != db_course.id:
-                raise DuplicateCourseCodeError(
-                    f"Course with code '{course_in.code}' already exists"
-                )
+    # Check (code, semester) uniqueness if either is changed
+    code = course_in.code if course_in.code is not None else db_course.code
+    semester = course_in.semester if course_in.semester is not None else db_course.semester
+    if (code, semester) != (db_course.code, db_course.semester):
+        existing = get_course_by_code(db=db, code=code, semester=semester)
+        if existing is not None and existing.id != db_course.id:
+            raise DuplicateCourseCodeError(
+                f"Course with code '{code}' already exists in semester '{semester}'"
+            )
 
     updated_course = update_course(db=db, db_course=db_course, course_in=course_in)
     return updated_course
@@ -116,3 +292,136 @@ def delete_course_service(db: Session, course_id: int) -> None:
         raise CourseNotFoundError(f"Course with id={course_id} not found")
 
     delete_course(db=db, db_course=db_course)
+
+
+class MeetingConflictError(Exception):
+    """Raised when a course's meetings overlap each other."""
+
+
+def list_course_meetings_service(db: Session, course_id: int) -> List[CourseMeeting]:
+    course = get_course_by_id(db=db, course_id=course_id)
+    if course is None:
+        raise CourseNotFoundError(f"Course with id={course_id} not found")
+    return course_meeting_repository.get_meetings_for_courses(db, [course_id])[course_id]
+
+
+def replace_course_meetings_service(
+    db: Session, course_id: int, meetings_in: Sequence[CourseMeetingBase]
+) -> List[CourseMeeting]:
+    """
+    Replace the additional meetings of a course.
+
+    Raises:
+        CourseNotFoundError: if the course does not exist.
+        MeetingConflictError: if two meetings (including the course's own) overlap.
+    """
+    course = get_course_by_id(db=db, course_id=course_id)
+    if course is None:
+        raise CourseNotFoundError(f"Course with id={course_id} not found")
+
+    occupancy = WeeklyOccupancy()
+    occupancy.add_course(course)
+    for m in meetings_in:
+        day = m.day_of_week.value
+        if occupancy.conflicting_course_id(day, m.start_time, m.end_time) is not None:
+            raise MeetingConflictError(
+                f"Meeting {day} {m.start_time}-{m.end_time} overlaps another meeting of course_id={course_id}"
+            )
+        occupancy.add(course_id, day, m.start_time, m.end_time)
+
+    return course_meeting_repository.replace_course_meetings(
+        db, course_id, [m.model_dump(mode="python") | {"day_of_week": m.day_of_week.value} for m in meetings_in]
+    )
+
+
+MAX_UPSERT_ROWS = 20_000
+UPSERT_CHUNK_SIZE = 500
+
+
+class CourseImportError(Exception):
+    """Raised when a bulk course upsert is rejected as a whole (e.g. too many rows)."""
+
+
+def _first_validation_message(exc: ValidationError) -> str:
+    err = exc.errors()[0]
+    loc = ".".join(str(part) for part in err.get("loc", ()))
+    return f"{loc}: {err['msg']}" if loc else err["msg"]
+
+
+def bulk_upsert_courses_service(
+    db: Session, rows: Sequence[Mapping[str, Any]], *, chunk_size: int = UPSERT_CHUNK_SIZE
+) -> List[Dict[str, Any]]:
+    """
+    Create or update many course offerings keyed by (code, semester), e.g. at term setup.
+
+    Rows are CourseCreate payloads. Existing offerings are found with one IN query;
+    rows whose fields all match are left alone. Writes go through
+    course_repository.upsert_courses_chunk, one transaction per chunk_size rows
+    (executemany INSERT / UPDATE). A chunk that hits a database error is rolled back
+    and its rows are reported as failed; earlier and later chunks are kept.
+
+    Returns a per-row report ({row, code, semester, course_id, status, detail});
+    status: created | updated | unchanged | duplicate_in_batch | invalid | failed.
+    Raises CourseImportError (nothing written) for more than MAX_UPSERT_ROWS rows.
+    """
+    if len(rows) > MAX_UPSERT_ROWS:
+        raise CourseImportError(f"Too many rows: {len(rows)} > {MAX_UPSERT_ROWS}")
+
+    results: List[Dict[str, Any]] = []
+    valid: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+    seen = set()
+    for i, raw in enumerate(rows, start=1):
+        result: Dict[str, Any] = {
+            "row": i,
+            "code": raw.get("code"),
+            "semester": raw.get("semester"),
+            "course_id": None,
+            "status": "invalid",
+            "detail": None,
+        }
+        results.append(result)
+        try:
+            course_in = CourseCreate.model_validate(dict(raw))
+        except ValidationError as exc:
+            result["detail"] = _first_validation_message(exc)
+            continue
+        data = course_in.model_dump()
+        data["day_of_week"] = course_in.day_of_week.value
+        key = (data["code"], data["semester"])
+        result.update(code=key[0], semester=key[1])
+        if key in seen:
+            result.update(status="duplicate_in_batch", detail="Same (code, semester) appears earlier in the batch")
+            continue
+        seen.add(key)
+        valid.append((result, data))
+
+    for start in range(0, len(valid), chunk_size):
+        chunk = valid[start:start + chunk_size]
+        existing = get_courses_by_code_semester(db, [(data["code"], data["semester"]) for _, data in chunk])
+        inserts, updates = [], []
+        for result, data in chunk:
+            current = existing.get((data["code"], data["semester"]))
+            if current is None:
+                inserts.append(data)
+                result["status"] = "created"
+            elif all(getattr(current, f) == data[f] for f in COURSE_WRITE_FIELDS):
+                result.update(status="unchanged", course_id=current.id)
+            else:
+                updates.append({**data, "id": current.id})
+                result.update(status="updated", course_id=current.id)
+        try:
+            upsert_courses_chunk(db, inserts, updates)
+        except SQLAlchemyError as exc:
+            detail = f"Database error, chunk not written ({type(exc).__name__})"
+            for result, _ in chunk:
+                if result["status"] in ("created", "updated"):
+                    result.update(status="failed", course_id=None, detail=detail)
+            continue
+
+        if inserts:
+            created = get_courses_by_code_semester(db, [(data["code"], data["semester"]) for data in inserts])
+            for result, data in chunk:
+                if result["status"] == "created":
+                    result["course_id"] = created[(data["code"], data["semester"])].id
+
+    return results
@@ -6,7 +6,7 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from backend.app.repositories import enrollment_repository, course_repository
-from backend.app.services import unit_limit_service
+from backend.app.services import unit_limit_service, waitlist_service
 from backend.app.utils.current_term import get_current_term
 
 
@@ -62,5 +62,7 @@ def drop_student_course(
             f"Min units violation: after_drop={after_units} < min_units={policy.min_units}"
         )
 
-    db.delete(enrollment)
+    # Free the seat and hand it to the next eligible waitlisted student atomically
+    enrollment_repository.delete(db, enrollment, commit=False)
+    waitlist_service.promote_next(db, course_id=course_id, term=current)
     db.commit()
\ No newline at end of file
@@ -0,0 +1,111 @@
+# backend/app/services/eligibility_service.py
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from backend.app.config.settings import settings
+from backend.app.repositories import (
+    course_history_repository,
+    course_meeting_repository,
+    course_repository,
+    enrollment_repository,
+    prerequisite_repository,
+)
+from backend.app.schemas.eligibility import CourseEligibilityRead, EligibilityMatrixRead
+from backend.app.services import unit_limit_service
+from backend.app.utils import student_cache
+from backend.app.utils.current_term import get_current_term
+from backend.app.utils.time_bitmap import WeeklyOccupancy
+
+# Student-specific part of the matrix. Seats are shared state and are re-read per request.
+_matrix_cache = student_cache.StudentTermCache(ttl_seconds=settings.ELIGIBILITY_CACHE_TTL_SECONDS)
+
+
+def _compute_student_flags(db: Session, student_id: int, term: str) -> Dict[str, Any]:
+    """
+    One batch over the term catalog (at most five queries regardless of catalog size):
+    catalog, term enrollments+courses, additional meetings, passed-course set, unit policy
+    (prerequisite rules come from memory).
+    Mirrors the rules in enrollment_service.check_enrollment_eligibility.
+    """
+    catalog = course_repository.list_term_courses(db, term)
+    term_rows = enrollment_repository.list_student_term_courses(db, student_id, term)
+    rules = prerequisite_repository.get_prereq_rules_for_courses(db, [c.id for c in catalog])
+    passed = course_history_repository.get_passed_course_set(db, student_id)
+    policy = unit_limit_service.get_unit_limits_service(db)
+
+    enrolled_ids = {e.course_id for e, _ in term_rows}
+    meetings = course_meeting_repository.get_meetings_for_courses(
+        db, [c.id for c in catalog] + [c.id for _, c in term_rows]
+    )
+    occupancy = WeeklyOccupancy.from_courses((c for _, c in term_rows), meetings)
+    current_units = sum(int(c.units or 0) for _, c in term_rows)
+    max_units = int(policy.max_units)
+
+    rows: List[Dict[str, Any]] = []
+    for course in catalog:
+        rule = rules[course.id]
+        prereqs_met = rule.is_satisfied(passed)
+        already = course.id in enrolled_ids
+        # An enrolled course trivially overlaps itself; only report clashes with other courses.
+        conflict_id = None if already else occupancy.conflicts_with_course(course, meetings[course.id])
+        rows.append(
+            {
+                "course_id": course.id,
+                "code": course.code,
+                "name": course.name,
+                "units": int(course.units or 0),
+                "already_enrolled": already,
+                "prereqs_met": prereqs_met,
+                "missing_prereq_ids": [] if prereqs_met else rule.missing_ids(passed),
+                "time_conflict": conflict_id is not None,
+                "conflicting_course_id": conflict_id,
+                "unit_headroom": current_units + int(course.units or 0) <= max_units,
+            }
+        )
+
+    return {"current_units": current_units, "max_units": max_units, "rows": rows}
+
+
+def get_eligibility_matrix(db: Session, *, student_id: int, term: Optional[str] = None) -> EligibilityMatrixRead:
+    """
+    For every course offered in `term`: prerequisites met, time conflict, unit headroom,
+    seats left and an overall `eligible` flag.
+
+    The student-specific flags are cached per (student, term) and dropped whenever the
+    student's enrollments or course history change (see utils.student_cache).
+    A cache hit costs one query (current seat counters).
+    """
+    effective_term = term or get_current_term()
+
+    flags = _matrix_cache.get(student_id, effective_term)
+    if flags is None:
+        generation = _matrix_cache.generation(student_id)
+        flags = _compute_student_flags(db, student_id, effective_term)
+        _matrix_cache.set(student_id, effective_term, flags, generation=generation)
+
+    seats_left = course_repository.get_term_seats_left(db, effective_term)
+
+    courses: List[CourseEligibilityRead] = []
+    for row in flags["rows"]:
+        seats = seats_left.get(row["course_id"])
+        if seats is None:
+            continue  # course removed / moved to another term since the flags were cached
+        eligible = (
+            not row["already_enrolled"]
+            and row["prereqs_met"]
+            and not row["time_conflict"]
+            and row["unit_headroom"]
+            and seats > 0
+        )
+        courses.append(CourseEligibilityRead(**row, seats_left=seats, eligible=eligible))
+
+    return EligibilityMatrixRead(
+        term=effective_term,
+        current_units=flags["current_units"],
+        max_units=flags["max_units"],
+        courses=courses,
+    )
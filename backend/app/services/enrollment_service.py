@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Optional, Iterable
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -13,10 +13,13 @@ from backend.app.repositories import (
     enrollment_repository,
     prerequisite_repository,
     course_history_repository,
+    course_meeting_repository,
     course_repository,
 )
 
 from backend.app.services import unit_limit_service
+from backend.app.utils.current_term import get_current_term
+from backend.app.utils.time_bitmap import WeeklyOccupancy
 
 
 class PrereqNotMetError(Exception):
@@ -43,9 +46,62 @@ class CourseNotFoundError(Exception):
     pass
 
 
-def _overlaps(a_start, a_end, b_start, b_end) -> bool:
-    # If end == start => NOT a conflict (back-to-back allowed)
-    return (a_start < b_end) and (b_start < a_end)
+def check_enrollment_eligibility(
+    db: Session,
+    *,
+    student_id: int,
+    course: Course,
+    term: str,
+    check_capacity: bool = True,
+) -> None:
+    """
+    Run every enrollment rule for (student, course, term) without writing.
+    Raises the same domain errors as enroll_student. Pass check_capacity=False
+    when the seat is taken with the atomic reservation instead.
+    """
+    # a) Load the student's term enrollments joined to their courses (one query).
+    #    Duplicate, time conflict and unit checks below all run on these rows.
+    term_rows = enrollment_repository.list_student_term_courses(db, student_id, term)
+
+    # b) Duplicate enrollment check
+    if any(e.course_id == course.id for e, _ in term_rows):
+        raise DuplicateEnrollmentError(
+            f"Duplicate enrollment: student_id={student_id}, course_id={course.id}, term={term}"
+        )
+
+    # c) Capacity pre-check on the maintained counter (the atomic reservation
+    #    in enrollment_repository.create is the authoritative check)
+    if check_capacity and (course.seats_taken or 0) >= course.capacity:
+        raise CapacityFullError(f"Course is full: course_id={course.id}, term={term}")
+
+    # d) Prereqs check: the course's compiled AND/OR rule against the student's cached passed-course set
+    rule = prerequisite_repository.get_prereq_rule(db, course.id)
+    passed = course_history_repository.get_passed_course_set(db, student_id)
+
+    if not rule.is_satisfied(passed):
+        raise PrereqNotMetError(
+            f"Missing passed prerequisites for course_id={course.id}: {rule.describe_unmet(passed)}"
+        )
+
+    # e) Time conflict check: one AND per meeting against the student's weekly occupancy
+    #    bitmap (additional meetings of every course involved come from one batch query)
+    meetings = course_meeting_repository.get_meetings_for_courses(
+        db, [c.id for _, c in term_rows] + [course.id]
+    )
+    occupancy = WeeklyOccupancy.from_courses((c for _, c in term_rows), meetings)
+    conflict_id = occupancy.conflicts_with_course(course, meetings[course.id])
+    if conflict_id is not None:
+        raise TimeConflictError(
+            f"Time conflict with course_id={conflict_id} for student_id={student_id} in term={term}"
+        )
+
+    # f) Unit limit check (unit sum derived from the joined rows)
+    policy = unit_limit_service.get_unit_limits_service(db)
+    current_units = sum(int(c.units or 0) for _, c in term_rows)
+    if current_units + course.units > policy.max_units:
+        raise UnitLimitViolationError(
+            f"Unit limit exceeded: current={current_units}, new={course.units}, max={policy.max_units}"
+        )
 
 
 def enroll_student(
@@ -63,58 +119,119 @@ def enroll_student(
     # b) Determine term
     effective_term = term or course.semester
 
-    # c) Duplicate enrollment check
-    if enrollment_repository.get_by_student_course_term(db, student_id, course_id, effective_term):
-        raise DuplicateEnrollmentError(
-            f"Duplicate enrollment: student_id={student_id}, course_id={course_id}, term={effective_term}"
-        )
+    # c) Duplicate, capacity, prereq, time conflict and unit checks
+    check_enrollment_eligibility(db, student_id=student_id, course=course, term=effective_term)
 
-    # d) Capacity check
-    cnt = enrollment_repository.count_course_enrollments(db, course_id, effective_term)
-    if cnt >= course.capacity:
-        raise CapacityFullError(f"Course is full: course_id={course_id}, term={effective_term}")
-
-    # e) Prereqs check
-    prereqs = prerequisite_repository.get_prereqs_for_course(db, course_id)
-    missing = []
-    for link in prereqs:
-        # Adjust attribute name based on your model (common ones shown below)
-        prereq_course_id = getattr(link, "prerequisite_course_id", None) or getattr(link, "prereq_course_id", None)
-        if prereq_course_id is None:
-            # Fallback: some codebases name it "course_id" for the prereq link side
-            prereq_course_id = getattr(link, "course_id", None)
-
-        if prereq_course_id is None:
-            continue
+    # d) Reserve seat + create enrollment (let IntegrityError bubble)
+    try:
+        return enrollment_repository.create(db, student_id=student_id, course_id=course_id, term=effective_term)
+    except enrollment_repository.SeatUnavailableError as exc:
+        # Lost the race for the last seat between the pre-check and the UPDATE
+        raise CapacityFullError(f"Course is full: course_id={course_id}, term={effective_term}") from exc
 
-        if not course_history_repository.has_passed_course(db, student_id, prereq_course_id):
-            missing.append(prereq_course_id)
 
-    if missing:
-        raise PrereqNotMetError(f"Missing passed prerequisites for course_id={course_id}: {missing}")
+class BulkEnrollmentError(Exception):
+    """
+    Raised when at least one course in a cart checkout fails validation.
+    Nothing is written; `results` holds per-course diagnostics.
+    """
 
-    # f) Time conflict check
-    existing = enrollment_repository.list_student_enrollments(db, student_id, effective_term)
-    for e in existing:
-        existing_course = course_repository.get_course_by_id(db, e.course_id)
-        if existing_course is None:
-            continue
+    def __init__(self, results: List[Dict[str, Any]]):
+        super().__init__("Cart checkout rejected; no enrollment was created.")
+        self.results = results
 
-        if course.day_of_week == existing_course.day_of_week and _overlaps(
-            course.start_time, course.end_time,
-            existing_course.start_time, existing_course.end_time
-        ):
-            raise TimeConflictError(
-                f"Time conflict with course_id={existing_course.id} for student_id={student_id} in term={effective_term}"
-            )
 
-    # g) Unit limit check
+def enroll_student_bulk(
+    db: Session,
+    *,
+    student_id: int,
+    course_ids: List[int],
+    term: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Cart checkout: validate every course at once and enroll in all of them or none.
+
+    Checks mirror enroll_student (not found, duplicate, capacity, prereqs, time
+    conflict with existing enrollments AND between cart courses, unit cap on the
+    combined total) but run on a fixed number of set-based queries.
+
+    Returns per-course diagnostics ({course_id, ok, error, detail}) on success.
+    Raises BulkEnrollmentError with the same diagnostics if anything fails.
+    """
+    effective_term = term or get_current_term()
+    cart_ids = list(dict.fromkeys(course_ids))  # de-dup, keep client order
+
+    courses = {c.id: c for c in course_repository.get_courses_by_ids(db, cart_ids)}
+    term_rows = enrollment_repository.list_student_term_courses(db, student_id, effective_term)
+    enrolled_ids = {e.course_id for e, _ in term_rows}
+    meetings = course_meeting_repository.get_meetings_for_courses(
+        db, [c.id for _, c in term_rows] + list(courses)
+    )
+    enrolled_occupancy = WeeklyOccupancy.from_courses((c for _, c in term_rows), meetings)
+    rules = prerequisite_repository.get_prereq_rules_for_courses(db, courses.keys())
+    passed = course_history_repository.get_passed_course_set(db, student_id)
+
+    results: Dict[int, Dict[str, Any]] = {
+        cid: {"course_id": cid, "ok": True, "error": None, "detail": None} for cid in cart_ids
+    }
+
+    def _fail(cid: int, error: str, detail: str) -> None:
+        if results[cid]["ok"]:
+            results[cid].update(ok=False, error=error, detail=detail)
+
+    for cid in cart_ids:
+        course = courses.get(cid)
+        if course is None:
+            _fail(cid, "course_not_found", f"Course not found: course_id={cid}")
+            continue
+        if cid in enrolled_ids:
+            _fail(cid, "duplicate", f"Already enrolled in course_id={cid} for term={effective_term}")
+            continue
+        if (course.seats_taken or 0) >= course.capacity:
+            _fail(cid, "capacity_full", f"Course is full: course_id={cid}, term={effective_term}")
+            continue
+        if not rules[cid].is_satisfied(passed):
+            _fail(
+                cid,
+                "prereq_not_met",
+                f"Missing passed prerequisites for course_id={cid}: {rules[cid].describe_unmet(passed)}",
+            )
+            continue
+        conflict_id = enrolled_occupancy.conflicts_with_course(course, meetings[cid])
+        if conflict_id is not None:
+            _fail(cid, "time_conflict", f"Time conflict with enrolled course_id={conflict_id}")
+
+    # Pairwise conflicts between cart courses (each course vs. the ones before it)
+    cart_courses = [courses[cid] for cid in cart_ids if cid in courses]
+    cart_occupancy = WeeklyOccupancy()
+    for c in cart_courses:
+        other_id = cart_occupancy.conflicts_with_course(c, meetings[c.id])
+        if other_id is not None:
+            _fail(c.id, "time_conflict", f"Time conflict with cart course_id={other_id}")
+            _fail(other_id, "time_conflict", f"Time conflict with cart course_id={c.id}")
+        cart_occupancy.add_course(c, meetings[c.id])
+
+    # Unit cap on the combined total
     policy = unit_limit_service.get_unit_limits_service(db)
-    current_units = enrollment_repository.sum_student_units(db, student_id, effective_term)
-    if current_units + course.units > policy.max_units:
-        raise UnitLimitViolationError(
-            f"Unit limit exceeded: current={current_units}, new={course.units}, max={policy.max_units}"
-        )
+    current_units = sum(int(c.units or 0) for _, c in term_rows)
+    cart_units = sum(int(c.units or 0) for c in cart_courses)
+    if current_units + cart_units > policy.max_units:
+        for c in cart_courses:
+            _fail(
+                c.id,
+                "unit_limit",
+                f"Unit limit exceeded: current={current_units}, cart={cart_units}, max={policy.max_units}",
+            )
+
+    ordered = [results[cid] for cid in cart_ids]
+    if not all(r["ok"] for r in ordered):
+        raise BulkEnrollmentError(ordered)
+
+    try:
+        enrollment_repository.create_many(db, student_id=student_id, course_ids=cart_ids, term=effective_term)
+    except enrollment_repository.SeatUnavailableError as exc:
+        # Lost a seat race after validation; the whole cart was rolled back
+        _fail(exc.course_id, "capacity_full", f"Course is full: course_id={exc.course_id}, term={effective_term}")
+        raise BulkEnrollmentError(ordered) from exc
 
-    # h) Create enrollment (let IntegrityError bubble)
-    return enrollment_repository.create(db, student_id=student_id, course_id=course_id, term=effective_term)
\ No newline at end of file
+    return ordered
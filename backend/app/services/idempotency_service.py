@@ -0,0 +1,127 @@
+# backend/app/services/idempotency_service.py
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy.orm import Session
+
+from backend.app.config.settings import settings
+from backend.app.repositories import idempotency_repository
+
+MAX_KEY_LENGTH = 255
+
+# Only deterministic outcomes are stored. Validation errors (422), admission
+# rejections (429) and server errors are left retryable.
+REPLAYABLE_ERROR_STATUSES = frozenset({404, 409})
+
+
+class InvalidIdempotencyKeyError(Exception):
+    """Raised when the Idempotency-Key header is empty or too long."""
+
+
+class IdempotencyKeyReuseError(Exception):
+    """Raised when a key is replayed with a different request (method, path or body)."""
+
+
+class IdempotencyKeyInProgressError(Exception):
+    """Raised when the first request with this key has not finished yet."""
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    status_code: int
+    body: Any  # decoded JSON, or None for bodiless responses
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def validate_key(key: str) -> str:
+    key = key.strip()
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise InvalidIdempotencyKeyError(f"Idempotency-Key must be 1..{MAX_KEY_LENGTH} characters")
+    return key
+
+
+def request_fingerprint(method: str, path: str, body: Any = None) -> str:
+    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{method.upper()} {path}\n{canonical}".encode("utf-8")).hexdigest()
+
+
+def get_stored_response(
+    db: Session, *, student_id: int, key: str, fingerprint: str
+) -> Optional[StoredResponse]:
+    """
+    One indexed lookup. Returns the stored outcome for a live key, None if unseen/expired.
+
+    Raises:
+        IdempotencyKeyReuseError: the key was used for a different request.
+        IdempotencyKeyInProgressError: the request holding the key is still running.
+    """
+    record = idempotency_repository.get_live_record(db, student_id=student_id, key=key, now=_utcnow())
+    if record is None:
+        return None
+    if record.request_fingerprint != fingerprint:
+        raise IdempotencyKeyReuseError("Idempotency-Key was already used for a different request")
+    if record.status_code is None:
+        raise IdempotencyKeyInProgressError("A request with this Idempotency-Key is still in progress")
+
+    body = json.loads(record.response_body) if record.response_body is not None else None
+    return StoredResponse(status_code=record.status_code, body=body)
+
+
+def claim_or_replay(
+    db: Session, *, student_id: int, key: str, fingerprint: str
+) -> Optional[StoredResponse]:
+    """
+    Return the stored outcome of a completed key, or claim an unseen key (pending
+    record, short lease) and return None: the caller then runs the request and
+    finishes with store_response or release.
+
+    Raises:
+        IdempotencyKeyReuseError: the key was used for a different request.
+        IdempotencyKeyInProgressError: another request holds the key.
+    """
+    stored = get_stored_response(db, student_id=student_id, key=key, fingerprint=fingerprint)
+    if stored is not None:
+        return stored
+
+    now = _utcnow()
+    claimed = idempotency_repository.claim_key(
+        db,
+        student_id=student_id,
+        key=key,
+        request_fingerprint=fingerprint,
+        now=now,
+        expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_PENDING_TTL_SECONDS),
+    )
+    if claimed:
+        return None
+    # Lost the race: replay the winner's outcome, or report it as still running
+    stored = get_stored_response(db, student_id=student_id, key=key, fingerprint=fingerprint)
+    if stored is None:
+        raise IdempotencyKeyInProgressError("A request with this Idempotency-Key is still in progress")
+    return stored
+
+
+def store_response(db: Session, *, student_id: int, key: str, status_code: int, body: Any = None) -> None:
+    """Complete the claimed key with the outcome, replayed for TTL seconds."""
+    idempotency_repository.complete_record(
+        db,
+        student_id=student_id,
+        key=key,
+        status_code=status_code,
+        response_body=json.dumps(body, default=str) if body is not None else None,
+        expires_at=_utcnow() + timedelta(seconds=settings.IDEMPOTENCY_TTL_SECONDS),
+    )
+
+
+def release(db: Session, *, student_id: int, key: str) -> None:
+    """Free the claimed key after an outcome that is not replayed (the client may retry)."""
+    idempotency_repository.release_key(db, student_id=student_id, key=key)
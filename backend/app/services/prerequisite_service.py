@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List, Mapping, Sequence
 from sqlalchemy.orm import Session
+from pydantic import ValidationError
 
 from backend.app.models.course_prerequisite import CoursePrerequisite
+from backend.app.repositories import course_history_repository
 from backend.app.repositories import course_repository
 from backend.app.repositories import prerequisite_repository
+from backend.app.schemas.legacy_prerequisite import LegacyPrerequisiteCreate
+from backend.app.utils.etag import make_etag
+from backend.app.utils.prerequisite_graph import PrerequisiteGraph, PrerequisiteLink
+from backend.app.utils.prerequisite_rules import PrerequisiteRule, groups_to_links
+
+MAX_IMPORT_ROWS = 20_000
 
 
 class PrerequisiteNotFoundError(Exception):
@@ -19,10 +27,10 @@ class DuplicatePrerequisiteError(Exception):
 
 
 class InvalidPrerequisiteRelationError(Exception):
-    """Raised when the prerequisite relation is invalid (e.g., self prerequisite)."""
+    """Raised when the prerequisite relation is invalid (e.g., self prerequisite or a cycle)."""
 
 
-def list_prerequisites_service(db: Session, course_id: int) -> List[CoursePrerequisite]:
+def list_prerequisites_service(db: Session, course_id: int) -> List[PrerequisiteLink]:
     """
     Return all prerequisite links for a course.
     Business rule: course must exist.
@@ -34,12 +42,18 @@ def list_prerequisites_service(db: Session, course_id: int) -> List[CoursePrereq
     return prerequisite_repository.get_prereqs_for_course(db, course_id)
 
 
-def list_all_prerequisites_service(db: Session) -> List[CoursePrerequisite]:
+def list_all_prerequisites_service(db: Session) -> List[PrerequisiteLink]:
     """
-    Return all prerequisite relations (no extra business rules).
-    Used by legacy flat endpoint /api/prerequisites.
+    Return all plain ("all of") prerequisite relations.
+    Used by legacy flat endpoint /api/prerequisites, which cannot express "any of"
+    groups; those links are only visible through the expression endpoints.
     """
-    return prerequisite_repository.get_all_prereqs(db)
+    return [link for link in prerequisite_repository.get_all_prereqs(db) if link.any_of_group is None]
+
+
+def prerequisites_etag_service(db: Session, request_key: str) -> str:
+    """ETag of a prerequisite listing: the graph fingerprint plus request_key. No query once the graph is loaded."""
+    return make_etag(prerequisite_repository.get_prereq_graph(db).fingerprint(), request_key)
 
 
 def add_prerequisite_service(
@@ -52,6 +66,7 @@ def add_prerequisite_service(
     - no self prerequisite
     - both courses must exist
     - no duplicates
+    - no cycles (prereq_course_id must not already require course_id, even transitively)
     """
     if course_id == prereq_course_id:
         raise InvalidPrerequisiteRelationError(
@@ -73,6 +88,11 @@ def add_prerequisite_service(
         if existing is not None:
             raise DuplicatePrerequisiteError("Prerequisite relation already exists")
 
+    if prerequisite_repository.would_create_cycle(db, course_id, prereq_course_id):
+        raise InvalidPrerequisiteRelationError(
+            f"Adding prerequisite {prereq_course_id} to course {course_id} would create a cycle."
+        )
+
     try:
         return prerequisite_repository.add_prereq(db, course_id, prereq_course_id)
     except Exception as exc:
@@ -101,3 +121,194 @@ def remove_prerequisite_service(db: Session, course_id: int, prereq_course_id: i
     deleted = prerequisite_repository.remove_prereq(db, course_id, prereq_course_id)
     if not deleted:
         raise PrerequisiteNotFoundError("Prerequisite relation not found")
+
+
+def get_prerequisite_expression_service(db: Session, course_id: int) -> PrerequisiteRule:
+    """
+    Return the AND/OR prerequisite rule of a course.
+    Business rule: course must exist.
+    """
+    if course_repository.get_course_by_id(db, course_id) is None:
+        raise PrerequisiteNotFoundError("Course not found")
+    return prerequisite_repository.get_prereq_rule(db, course_id)
+
+
+def set_prerequisite_expression_service(
+    db: Session, course_id: int, groups: Sequence[Sequence[int]]
+) -> PrerequisiteRule:
+    """
+    Replace the whole prerequisite expression of a course: an AND over `groups`,
+    each group an OR over course ids (single-course groups are plain requirements).
+
+    Rules:
+    - the course and every referenced course must exist (one IN query)
+    - no self prerequisite; a course may appear in one group only
+    - no cycles: the checks run on a scratch copy of the graph without the
+      course's current links, so rewriting an expression never trips on itself
+    """
+    if course_repository.get_course_by_id(db, course_id) is None:
+        raise PrerequisiteNotFoundError("Course not found")
+
+    links = groups_to_links(groups)
+    prereq_ids = [p for p, _ in links]
+    if course_id in prereq_ids:
+        raise InvalidPrerequisiteRelationError("A course cannot be its own prerequisite")
+    if len(set(prereq_ids)) != len(prereq_ids):
+        raise InvalidPrerequisiteRelationError("A course may appear in only one group of the expression")
+
+    missing = sorted(set(prereq_ids) - course_repository.get_existing_course_ids(db, prereq_ids))
+    if missing:
+        raise PrerequisiteNotFoundError(f"Course not found: {missing}")
+
+    scratch = PrerequisiteGraph()
+    scratch.load(link for link in prerequisite_repository.get_prereq_graph(db).links() if link.course_id != course_id)
+    for p in prereq_ids:
+        if scratch.would_create_cycle(course_id, p):
+            raise InvalidPrerequisiteRelationError(
+                f"Prerequisite course_id={p} would create a cycle (it already requires course_id={course_id})"
+            )
+
+    try:
+        prerequisite_repository.replace_prereqs(db, course_id, links)
+    except prerequisite_repository.DuplicatePrerequisiteError as exc:
+        raise DuplicatePrerequisiteError(str(exc)) from exc
+    return prerequisite_repository.get_prereq_rule(db, course_id)
+
+
+def get_unlocks_service(
+    db: Session, course_ids: Sequence[int], student_ids: Sequence[int] = ()
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    "What does passing X unlock", for many courses and (optionally) many students at once.
+
+    - courses: direct dependents of each course, from the graph's reverse index.
+    - students: per student and course, the dependents whose AND/OR prerequisite
+      rule is unmet today but met once that course is passed (courses the student
+      already passed are left out). Only prerequisites are considered, not seats,
+      time conflicts or unit limits.
+
+    Costs one IN query for course existence plus one for the passed sets not cached yet.
+    """
+    ids = list(dict.fromkeys(course_ids))
+    missing = sorted(set(ids) - course_repository.get_existing_course_ids(db, ids))
+    if missing:
+        raise PrerequisiteNotFoundError(f"Course not found: {missing}")
+
+    dependents = prerequisite_repository.get_dependent_ids_for_courses(db, ids)
+    courses = [{"course_id": cid, "unlocks": dependents[cid]} for cid in ids]
+    if not student_ids:
+        return {"courses": courses, "students": []}
+
+    rules = prerequisite_repository.get_prereq_rules_for_courses(
+        db, {d for deps in dependents.values() for d in deps}
+    )
+    passed_sets = course_history_repository.get_passed_course_sets(db, student_ids)
+
+    students: List[Dict[str, Any]] = []
+    for student_id in dict.fromkeys(student_ids):
+        passed = passed_sets[student_id]
+        rows: List[Dict[str, Any]] = []
+        for cid in ids:
+            if cid in passed:
+                rows.append({"course_id": cid, "already_passed": True, "unlocks": []})
+                continue
+            after = passed.with_course(cid)
+            unlocked = [
+                d
+                for d in dependents[cid]
+                if d not in passed and not rules[d].is_satisfied(passed) and rules[d].is_satisfied(after)
+            ]
+            rows.append({"course_id": cid, "already_passed": False, "unlocks": unlocked})
+        students.append({"student_id": student_id, "courses": rows})
+
+    return {"courses": courses, "students": students}
+
+
+class PrerequisiteImportError(Exception):
+    """Raised when a bulk import is rejected as a whole; `results` holds the per-row report."""
+
+    def __init__(self, message: str, results: List[Dict[str, Any]]):
+        super().__init__(message)
+        self.results = results
+
+
+def _first_validation_message(exc: ValidationError) -> str:
+    err = exc.errors()[0]
+    loc = ".".join(str(part) for part in err.get("loc", ()))
+    return f"{loc}: {err['msg']}" if loc else err["msg"]
+
+
+def bulk_import_prerequisites_service(
+    db: Session, rows: Sequence[Mapping[str, Any]], *, all_or_nothing: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Validate and insert many prerequisite links at once.
+
+    Rows accept both key styles ({course_id, prereq_course_id} or
+    {target_course_id, prerequisite_course_id}). Validation is set-based:
+    one IN query for course existence; duplicates (existing or within the batch)
+    and cycles (against the current graph plus earlier rows of the batch) are
+    detected in memory. Valid rows are inserted with one executemany in one
+    transaction.
+
+    Returns a per-row report ({row, course_id, prereq_course_id, status, detail}).
+    Raises PrerequisiteImportError (nothing written) if all_or_nothing and any row fails.
+    """
+    if len(rows) > MAX_IMPORT_ROWS:
+        raise InvalidPrerequisiteRelationError(f"Too many rows: {len(rows)} > {MAX_IMPORT_ROWS}")
+
+    results: List[Dict[str, Any]] = []
+    parsed: List[Dict[str, Any]] = []
+    for i, raw in enumerate(rows, start=1):
+        result: Dict[str, Any] = {"row": i, "course_id": None, "prereq_course_id": None, "status": "valid", "detail": None}
+        results.append(result)
+        try:
+            data = LegacyPrerequisiteCreate.model_validate(dict(raw))
+        except ValidationError as exc:
+            result.update(status="invalid", detail=_first_validation_message(exc))
+            continue
+        result.update(course_id=data.course_id, prereq_course_id=data.prereq_course_id)
+        if data.course_id == data.prereq_course_id:
+            result.update(status="invalid", detail="A course cannot be its own prerequisite")
+            continue
+        parsed.append(result)
+
+    existing_ids = course_repository.get_existing_course_ids(
+        db, {r["course_id"] for r in parsed} | {r["prereq_course_id"] for r in parsed}
+    )
+    graph = prerequisite_repository.get_prereq_graph(db)
+    scratch = PrerequisiteGraph()
+    scratch.load(graph.links())
+
+    seen = set()
+    accepted: List[Dict[str, Any]] = []
+    for result in parsed:
+        pair = (result["course_id"], result["prereq_course_id"])
+        missing = [cid for cid in pair if cid not in existing_ids]
+        if missing:
+            result.update(status="course_not_found", detail=f"Course not found: {missing}")
+        elif pair in seen:
+            result.update(status="duplicate_in_batch", detail="Same link appears earlier in the batch")
+        elif graph.has_link(*pair):
+            result.update(status="duplicate", detail="Prerequisite relation already exists")
+        elif scratch.would_create_cycle(*pair):
+            result.update(status="cycle", detail="Link would create a prerequisite cycle")
+        else:
+            scratch.add_link(*pair)
+            accepted.append(result)
+        seen.add(pair)
+
+    failed = len(results) - len(accepted)
+    if all_or_nothing and failed:
+        raise PrerequisiteImportError(f"Import rejected: {failed} invalid row(s); nothing was written.", results)
+
+    try:
+        prerequisite_repository.add_prereqs_bulk(
+            db, [(r["course_id"], r["prereq_course_id"]) for r in accepted]
+        )
+    except prerequisite_repository.DuplicatePrerequisiteError as exc:
+        raise DuplicatePrerequisiteError(str(exc)) from exc
+
+    for result in accepted:
+        result["status"] = "created"
+    return results
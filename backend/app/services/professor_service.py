@@ -12,6 +12,7 @@ from backend.app.models.enrollment import Enrollment
 from backend.app.schemas.professor import ProfessorCourseStudentsRead, ProfessorCourseStudentRead
 from backend.app.utils.current_term import get_current_term
 from backend.app.repositories import enrollment_repository
+from backend.app.services import waitlist_service
 
 
 class NotCourseOwnerError(Exception):
@@ -31,8 +32,9 @@ except Exception:  # pragma: no cover
         pass
 
 
-def _normalize_name(value: str | None) -> str:
-    return " ".join((value or "").split()).strip().lower()
+def _owns(course: Course, professor) -> bool:
+    # Course.professor_id is kept in step with professor_name (see models/course.py)
+    return course.professor_id is not None and course.professor_id == getattr(professor, "id", None)
 
 
 def _name_sort_key(full_name: str, student_number: str):
@@ -59,8 +61,8 @@ def list_course_students_for_professor(
     if not course:
         raise CourseNotFoundError()
 
-    # Ownership check 
-    if _normalize_name(course.professor_name) != _normalize_name(getattr(professor, "full_name", None)):
+    # Ownership check
+    if not _owns(course, professor):
         raise NotCourseOwnerError()
 
     # Fetch students enrolled in this course in CURRENT term
@@ -97,22 +99,14 @@ def list_professor_courses(
 ) -> List[Course]:
     current_term = term or get_current_term()
 
-    prof_full_name = getattr(professor, "full_name", None)
-    prof_norm = _normalize_name(prof_full_name)
-
-    # Scope to current term in DB; ownership match in Python for robust whitespace normalization.
-    courses_in_term = db.query(Course).filter(Course.semester == current_term).all()
-
-    owned = [c for c in courses_in_term if _normalize_name(getattr(c, "professor_name", None)) == prof_norm]
-
-    # Stable sort
-    if hasattr(Course, "code"):
-        owned.sort(key=lambda c: ((c.code or ""), c.id))
-    else:
-        owned.sort(key=lambda c: c.id)
-
-    return owned
-
+    # Indexed lookup on (professor_id, semester), sorted by code in SQL
+    return (
+        db.query(Course)
+        .filter(Course.professor_id == getattr(professor, "id", None))
+        .filter(Course.semester == current_term)
+        .order_by(Course.code.asc(), Course.id.asc())
+        .all()
+    )
 
 
 def professor_remove_student(
@@ -135,7 +129,7 @@ def professor_remove_student(
     if not course:
         raise CourseNotFoundError()
 
-    if _normalize_name(course.professor_name) != _normalize_name(getattr(professor, "full_name", "")):
+    if not _owns(course, professor):
         raise NotCourseOwnerError()
 
     # Try current term first
@@ -151,4 +145,7 @@ def professor_remove_student(
     if getattr(enrollment, "term", None) != current:
         raise NotCurrentTermError()
 
-    enrollment_repository.delete(db, enrollment)
\ No newline at end of file
+    # Free the seat and hand it to the next eligible waitlisted student atomically
+    enrollment_repository.delete(db, enrollment, commit=False)
+    waitlist_service.promote_next(db, course_id=course_id, term=current)
+    db.commit()
\ No newline at end of file
@@ -6,43 +6,43 @@ from typing import Optional, Dict, List
 
 from sqlalchemy.orm import Session
 
-from backend.app.repositories import enrollment_repository, course_repository
+from backend.app.repositories import course_meeting_repository, enrollment_repository
 from backend.app.schemas.schedule import WeeklyScheduleRead, ScheduleDayRead, ScheduleBlockRead
 from backend.app.utils.current_term import get_current_term
-
-DAY_ORDER = ["SAT", "SUN", "MON", "TUE", "WED", "THU", "FRI"]
+from backend.app.utils.time_bitmap import DAY_ORDER, WeeklyOccupancy
 
 
 def build_weekly_schedule(db: Session, student_id: int, term: Optional[str] = None) -> WeeklyScheduleRead:
     effective_term = term or get_current_term()
 
-    enrollments = enrollment_repository.list_student_enrollments(db, student_id, effective_term)
+    # One joined query, ordered by start_time in SQL, plus one batch for additional meetings
+    courses = enrollment_repository.list_student_schedule_courses(db, student_id, effective_term)
+    meetings = course_meeting_repository.get_meetings_for_courses(db, [c.id for c in courses])
 
     grouped: Dict[str, List[ScheduleBlockRead]] = {d: [] for d in DAY_ORDER}
 
-    for e in enrollments:
-        course = course_repository.get_course_by_id(db, e.course_id)
-        if course is None:
-            continue
-
-        block = ScheduleBlockRead(
-            course_id=course.id,
-            code=course.code,
-            name=course.name,
-            start_time=course.start_time,
-            end_time=course.end_time,
-            location=course.location,
-            professor_name=course.professor_name,
-            units=course.units,
-        )
-
-        day = course.day_of_week
-        if day not in grouped:
-            grouped[day] = []
-        grouped[day].append(block)
-
-    for day, blocks in grouped.items():
-        blocks.sort(key=lambda b: b.start_time)
+    for course in courses:
+        extra = meetings.get(course.id, [])
+        slots = [(course.day_of_week, course.start_time, course.end_time, course.location)] + [
+            (m.day_of_week, m.start_time, m.end_time, m.location or course.location) for m in extra
+        ]
+        for day, start, end, location in slots:
+            block = ScheduleBlockRead(
+                course_id=course.id,
+                code=course.code,
+                name=course.name,
+                start_time=start,
+                end_time=end,
+                location=location,
+                professor_name=course.professor_name,
+                units=course.units,
+            )
+            grouped.setdefault(day, []).append(block)
+
+    if any(meetings.values()):
+        # Additional meetings break the SQL ordering within a day
+        for blocks in grouped.values():
+            blocks.sort(key=lambda b: b.start_time)
 
     days: List[ScheduleDayRead] = [
         ScheduleDayRead(day_of_week=day, blocks=grouped.get(day, [])) for day in DAY_ORDER
@@ -53,4 +53,15 @@ def build_weekly_schedule(db: Session, student_id: int, term: Optional[str] = No
     for d in extra_days:
         days.append(ScheduleDayRead(day_of_week=d, blocks=grouped[d]))
 
-    return WeeklyScheduleRead(term=effective_term, days=days)
\ No newline at end of file
+    return WeeklyScheduleRead(term=effective_term, days=days)
+
+
+def build_weekly_occupancy(db: Session, student_id: int, term: Optional[str] = None) -> WeeklyOccupancy:
+    """
+    Compact weekly occupancy bitmap of the student's enrolled courses for a term.
+    """
+    effective_term = term or get_current_term()
+    courses = enrollment_repository.list_student_schedule_courses(db, student_id, effective_term)
+    return WeeklyOccupancy.from_courses(
+        courses, course_meeting_repository.get_meetings_for_courses(db, [c.id for c in courses])
+    )
\ No newline at end of file
@@ -0,0 +1,148 @@
+# backend/app/services/waitlist_service.py
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend.app.models.enrollment import Enrollment
+from backend.app.models.waitlist_entry import WaitlistEntry
+from backend.app.repositories import (
+    course_history_repository,
+    course_meeting_repository,
+    course_repository,
+    enrollment_repository,
+    prerequisite_repository,
+    waitlist_repository,
+)
+from backend.app.services import unit_limit_service
+from backend.app.services.enrollment_service import CourseNotFoundError
+from backend.app.utils import student_cache
+from backend.app.utils.current_term import get_current_term
+from backend.app.utils.time_bitmap import WeeklyOccupancy
+
+
+class AlreadyWaitlistedError(Exception):
+    pass
+
+
+class AlreadyEnrolledError(Exception):
+    pass
+
+
+class SeatsAvailableError(Exception):
+    """Raised when joining the waitlist of a course that still has free seats."""
+    pass
+
+
+class NotWaitlistedError(Exception):
+    pass
+
+
+def join_waitlist(
+    db: Session,
+    *,
+    student_id: int,
+    course_id: int,
+    term: Optional[str] = None,
+) -> Tuple[WaitlistEntry, int]:
+    """
+    Put the student at the end of the (course, term) waitlist.
+    Returns (entry, 1-based position).
+    """
+    current = term or get_current_term()
+
+    course = course_repository.get_course_by_id(db, course_id)
+    if course is None:
+        raise CourseNotFoundError(f"Course not found: course_id={course_id}")
+
+    if enrollment_repository.get_by_student_course_term(db, student_id, course_id, current):
+        raise AlreadyEnrolledError(f"Already enrolled in course_id={course_id} for term={current}")
+
+    if waitlist_repository.get_entry(db, student_id, course_id, current):
+        raise AlreadyWaitlistedError(f"Already on the waitlist of course_id={course_id} for term={current}")
+
+    if (course.seats_taken or 0) < course.capacity:
+        raise SeatsAvailableError(f"Course has free seats; enroll directly: course_id={course_id}")
+
+    entry = waitlist_repository.add_entry(db, student_id=student_id, course_id=course_id, term=current)
+    return entry, waitlist_repository.get_position(db, entry)
+
+
+def leave_waitlist(db: Session, *, student_id: int, course_id: int, term: Optional[str] = None) -> None:
+    current = term or get_current_term()
+    entry = waitlist_repository.get_entry(db, student_id, course_id, current)
+    if entry is None:
+        raise NotWaitlistedError(f"Not on the waitlist of course_id={course_id} for term={current}")
+    waitlist_repository.delete_entry(db, entry)
+
+
+def get_waitlist_position(db: Session, *, student_id: int, course_id: int, term: Optional[str] = None) -> int:
+    current = term or get_current_term()
+    entry = waitlist_repository.get_entry(db, student_id, course_id, current)
+    if entry is None:
+        raise NotWaitlistedError(f"Not on the waitlist of course_id={course_id} for term={current}")
+    return waitlist_repository.get_position(db, entry)
+
+
+def list_my_waitlist(db: Session, *, student_id: int, term: Optional[str] = None) -> List[Tuple[WaitlistEntry, int]]:
+    current = term or get_current_term()
+    entries = waitlist_repository.list_student_entries(db, student_id, current)
+    return [(e, waitlist_repository.get_position(db, e)) for e in entries]
+
+
+def promote_next(db: Session, *, course_id: int, term: str) -> Optional[Enrollment]:
+    """
+    Give a freed seat to the first ELIGIBLE waitlisted student (FIFO).
+
+    Must be called inside the transaction that freed the seat; does NOT commit.
+    Prereqs, time conflicts and unit caps are re-checked; ineligible students keep
+    their place, entries of students who are already enrolled are discarded.
+
+    The whole queue is evaluated on a fixed number of set-based queries (term
+    courses, meetings and passed sets of every waitlisted student at once), so
+    the time spent under the course row lock taken by release_seat does not grow
+    with one query batch per skipped entry.
+    """
+    course = course_repository.get_course_by_id(db, course_id)
+    if course is None:
+        return None
+
+    queue = waitlist_repository.list_course_queue(db, course_id, term)
+    if not queue:
+        return None
+
+    student_ids = [entry.student_id for entry in queue]
+    term_courses = enrollment_repository.list_term_courses_for_students(db, student_ids, term)
+    meetings = course_meeting_repository.get_meetings_for_courses(
+        db, {c.id for courses in term_courses.values() for c in courses} | {course_id}
+    )
+    passed = course_history_repository.get_passed_course_sets(db, student_ids)
+    rule = prerequisite_repository.get_prereq_rule(db, course_id)
+    max_units = unit_limit_service.get_unit_limits_service(db).max_units
+
+    for entry in queue:
+        courses = term_courses[entry.student_id]
+        if any(c.id == course_id for c in courses):
+            waitlist_repository.delete_entry(db, entry, commit=False)
+            continue
+        if not rule.is_satisfied(passed[entry.student_id]):
+            continue
+        occupancy = WeeklyOccupancy.from_courses(courses, meetings)
+        if occupancy.conflicts_with_course(course, meetings[course_id]) is not None:
+            continue
+        if sum(int(c.units or 0) for c in courses) + course.units > max_units:
+            continue
+
+        if not course_repository.reserve_seat(db, course_id):
+            return None
+
+        enrollment = Enrollment(student_id=entry.student_id, course_id=course_id, term=term)
+        db.add(enrollment)
+        waitlist_repository.delete_entry(db, entry, commit=False)
+        # The promoted student's cached eligibility matrix now has a new enrollment
+        student_cache.invalidate_student(db, entry.student_id, term)
+        return enrollment
+
+    return None
@@ -0,0 +1,31 @@
+# backend/app/utils/cursor.py
+
+from __future__ import annotations
+
+import base64
+import json
+from typing import Any, Dict
+
+# Response header carrying the cursor of the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or belongs to a different listing."""
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    """Opaque, URL-safe cursor (unpadded base64 of compact JSON)."""
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+    if not isinstance(payload, dict):
+        raise InvalidCursorError("Malformed cursor")
+    return payload
@@ -0,0 +1,39 @@
+# backend/app/utils/etag.py
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Response, status
+
+ETAG_HEADER = "ETag"
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag (quoted hex digest) of the repr of parts: a version stamp plus whatever else shapes the body."""
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match evaluation (RFC 9110 13.1.2): "*" or any listed tag equal to etag
+    under weak comparison, i.e. ignoring a W/ prefix.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 carrying the current ETag."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag})
@@ -0,0 +1,23 @@
+# backend/app/utils/fast_json.py
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from fastapi.responses import ORJSONResponse  # needs orjson (requirements.txt)
+
+
+def rows_as_dicts(rows: Iterable[Sequence[Any]], fields: Sequence[str]) -> List[Dict[str, Any]]:
+    """
+    Column tuples -> JSON-ready dicts keyed by fields (positional; extra trailing
+    columns such as a sort score are dropped).
+    """
+    return [dict(zip(fields, row)) for row in rows]
+
+
+def json_response(content: Any, *, headers: Optional[Mapping[str, str]] = None) -> ORJSONResponse:
+    """
+    Encode already JSON-shaped content with orjson, skipping response_model validation
+    (date/time values are written in the same ISO format pydantic uses).
+    """
+    return ORJSONResponse(content, headers=dict(headers) if headers else None)
@@ -0,0 +1,29 @@
+# backend/app/utils/import_body.py
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Any, Dict, List
+
+
+def parse_import_body(content_type: str, raw: bytes) -> List[Dict[str, Any]]:
+    """
+    Rows of a bulk import request: a CSV body (text/csv, header row required) or a
+    JSON body (an array of objects, or {"items": [...]}).
+
+    Raises ValueError / UnicodeDecodeError / csv.Error for an unreadable body.
+    """
+    text = raw.decode("utf-8-sig")
+    if content_type.startswith(("text/csv", "application/csv")):
+        reader = csv.DictReader(io.StringIO(text))
+        # Blank cells are treated as missing keys so both header styles can share one file
+        return [{k.strip(): v.strip() for k, v in row.items() if k and v and v.strip()} for row in reader]
+
+    data = json.loads(text)
+    if isinstance(data, dict):
+        data = data.get("items")
+    if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+        raise ValueError("Expected a JSON array of objects (or {\"items\": [...]})")
+    return data
@@ -0,0 +1,68 @@
+# backend/app/utils/passed_courses.py
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Set
+
+
+class PassedCourseSet:
+    """
+    Compact, immutable set of the course ids a student has passed: one int
+    used as a bitset (bit n set <=> course n passed).
+
+    Course ids are small autoincrement integers, so a student with a few dozen
+    passed courses costs a few hundred bytes and membership / subset checks are
+    single bitwise operations instead of row lookups.
+    """
+
+    __slots__ = ("bits",)
+
+    def __init__(self, bits: int = 0) -> None:
+        self.bits = bits
+
+    @classmethod
+    def from_ids(cls, course_ids: Iterable[int]) -> "PassedCourseSet":
+        return cls(cls.mask(course_ids))
+
+    @staticmethod
+    def mask(course_ids: Iterable[int]) -> int:
+        bits = 0
+        for cid in course_ids:
+            if cid >= 0:
+                bits |= 1 << cid
+        return bits
+
+    def __contains__(self, course_id: object) -> bool:
+        return isinstance(course_id, int) and course_id >= 0 and bool((self.bits >> course_id) & 1)
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __iter__(self) -> Iterator[int]:
+        """Course ids in ascending order."""
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, PassedCourseSet) and other.bits == self.bits
+
+    def __repr__(self) -> str:
+        return f"PassedCourseSet({list(self)})"
+
+    def with_course(self, course_id: int) -> "PassedCourseSet":
+        """A copy that also contains course_id (what-if: the student passes it)."""
+        return PassedCourseSet(self.bits | (1 << course_id)) if course_id >= 0 else self
+
+    def issuperset(self, course_ids: Iterable[int]) -> bool:
+        """True if every course in course_ids has been passed (e.g. all prerequisites met)."""
+        return all(cid in self for cid in course_ids)
+
+    def missing(self, course_ids: Iterable[int]) -> List[int]:
+        """The course ids not passed yet, in input order."""
+        return [cid for cid in course_ids if cid not in self]
+
+    def intersection(self, course_ids: Iterable[int]) -> Set[int]:
+        return {cid for cid in course_ids if cid in self}
@@ -0,0 +1,302 @@
+# backend/app/utils/prerequisite_graph.py
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from backend.app.utils.prerequisite_rules import EMPTY_RULE, PrerequisiteRule
+
+
+class PrerequisiteLink(NamedTuple):
+    """course_id requires prereq_course_id (same attribute names as CoursePrerequisite)."""
+
+    course_id: int
+    prereq_course_id: int
+    any_of_group: Optional[int] = None
+
+
+_EMPTY: FrozenSet[int] = frozenset()
+
+
+class PrerequisiteGraph:
+    """
+    In-memory prerequisite DAG: course -> direct prerequisites, the reverse
+    (dependents) index and the precomputed transitive closure of every course.
+    Alternatives ("any of" groups) are edges like any other for closure and
+    cycle purposes; the AND/OR structure of each course is compiled on demand
+    into a PrerequisiteRule (see rule()).
+
+    - Reads never touch the database.
+    - `version` increases on every change (full load or single edge).
+    - `generation` increases on every incremental change or invalidation, loaded
+      or not: a reload whose rows were read before such a change is not installed
+      (see load()).
+    - `fingerprint()` is a digest of the links themselves (HTTP ETags): equal
+      graphs give equal fingerprints, in every process.
+    - Adding an edge updates the closure of the course and of everything that
+      (transitively) depends on it; removing one recomputes just those nodes.
+    - Thread-safe; one instance is shared per process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._prereqs: Dict[int, Set[int]] = {}
+        self._dependents: Dict[int, Set[int]] = {}
+        self._closure: Dict[int, FrozenSet[int]] = {}
+        # (course_id, prereq_course_id) -> any_of_group, only for grouped links
+        self._any_of: Dict[Tuple[int, int], int] = {}
+        self._rules: Dict[int, PrerequisiteRule] = {}
+        # (version, digest) of the last fingerprint() call
+        self._fingerprint: Tuple[int, str] = (-1, "")
+        self.version = 0
+        self.generation = 0
+        self.loaded = False
+        self._loaded_at = 0.0
+
+    # -----------------------------
+    # loading
+    # -----------------------------
+
+    def load(self, links: Iterable[Sequence[Optional[int]]], generation: Optional[int] = None) -> bool:
+        """
+        Replace the whole graph with `links`: (course_id, prereq_course_id) pairs or
+        (course_id, prereq_course_id, any_of_group) triples.
+
+        With `generation` (read before the links were queried) the links are only
+        installed if no change or invalidation happened since; otherwise the graph
+        stays as it is and False is returned.
+        """
+        prereqs: Dict[int, Set[int]] = {}
+        dependents: Dict[int, Set[int]] = {}
+        any_of: Dict[Tuple[int, int], int] = {}
+        for course_id, prereq_course_id, *rest in links:
+            prereqs.setdefault(course_id, set()).add(prereq_course_id)
+            dependents.setdefault(prereq_course_id, set()).add(course_id)
+            if rest and rest[0] is not None:
+                any_of[(course_id, prereq_course_id)] = rest[0]
+
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+            self._prereqs = prereqs
+            self._dependents = dependents
+            self._any_of = any_of
+            self._rules = {}
+            self._closure = self._compute_all_closures()
+            self.version += 1
+            self.loaded = True
+            self._loaded_at = time.monotonic()
+        return True
+
+    def invalidate(self) -> None:
+        """Force a full reload on next use (e.g. after a rollback or a bulk statement)."""
+        with self._lock:
+            self.generation += 1
+            self.loaded = False
+
+    def needs_load(self, max_age_seconds: Optional[float] = None) -> bool:
+        if not self.loaded:
+            return True
+        return max_age_seconds is not None and time.monotonic() - self._loaded_at > max_age_seconds
+
+    # -----------------------------
+    # reads
+    # -----------------------------
+
+    def direct_prereqs(self, course_id: int) -> List[int]:
+        return sorted(self._prereqs.get(course_id, ()))
+
+    def direct_prereqs_many(self, course_ids: Iterable[int]) -> Dict[int, List[int]]:
+        return {cid: sorted(self._prereqs.get(cid, ())) for cid in set(course_ids)}
+
+    def dependents(self, course_id: int) -> List[int]:
+        """Courses that list course_id as a direct prerequisite."""
+        return sorted(self._dependents.get(course_id, ()))
+
+    def all_prereqs(self, course_id: int) -> FrozenSet[int]:
+        """Transitive closure: every course reachable through prerequisite links (alternatives included)."""
+        return self._closure.get(course_id, _EMPTY)
+
+    def has_link(self, course_id: int, prereq_course_id: int) -> bool:
+        return prereq_course_id in self._prereqs.get(course_id, ())
+
+    def rule(self, course_id: int) -> PrerequisiteRule:
+        """The compiled AND/OR requirement of course_id (compiled once, kept until its links change)."""
+        compiled = self._rules.get(course_id)
+        if compiled is not None:
+            return compiled
+        with self._lock:
+            prereqs = self._prereqs.get(course_id)
+            if not prereqs:
+                return EMPTY_RULE
+            compiled = PrerequisiteRule.from_links(
+                (p, self._any_of.get((course_id, p))) for p in prereqs
+            )
+            self._rules[course_id] = compiled
+            return compiled
+
+    def rules_many(self, course_ids: Iterable[int]) -> Dict[int, PrerequisiteRule]:
+        return {cid: self.rule(cid) for cid in set(course_ids)}
+
+    def links(self, course_id: Optional[int] = None) -> List[PrerequisiteLink]:
+        """All links (or the links of one course), ordered by (course_id, prereq_course_id)."""
+        with self._lock:
+            courses = [course_id] if course_id is not None else sorted(self._prereqs)
+            return [
+                PrerequisiteLink(c, p, self._any_of.get((c, p)))
+                for c in courses
+                for p in sorted(self._prereqs.get(c, ()))
+            ]
+
+    def fingerprint(self) -> str:
+        """Digest of every link, recomputed at most once per version."""
+        with self._lock:
+            if self._fingerprint[0] != self.version:
+                digest = hashlib.blake2b(repr(self.links()).encode("ascii"), digest_size=12).hexdigest()
+                self._fingerprint = (self.version, digest)
+            return self._fingerprint[1]
+
+    def would_create_cycle(self, course_id: int, prereq_course_id: int) -> bool:
+        """
+        True if adding course_id -> prereq_course_id closes a cycle, i.e. the new
+        prerequisite already (transitively) requires course_id. BFS over the
+        prerequisite edges from prereq_course_id: O(V + E) worst case.
+        """
+        if course_id == prereq_course_id:
+            return True
+        with self._lock:
+            return course_id in self._reachable_from(prereq_course_id)
+
+    # -----------------------------
+    # incremental updates
+    # -----------------------------
+
+    def add_link(self, course_id: int, prereq_course_id: int, any_of_group: Optional[int] = None) -> None:
+        """Add a link, or move an existing one to another "any of" group."""
+        with self._lock:
+            self.generation += 1
+            if not self.loaded:
+                return
+            if self.has_link(course_id, prereq_course_id):
+                if self._any_of.get((course_id, prereq_course_id)) != any_of_group:
+                    self._set_group(course_id, prereq_course_id, any_of_group)
+                    self.version += 1
+                return
+            self._set_group(course_id, prereq_course_id, any_of_group)
+            self._prereqs.setdefault(course_id, set()).add(prereq_course_id)
+            self._dependents.setdefault(prereq_course_id, set()).add(course_id)
+
+            gained = self._closure.get(prereq_course_id, _EMPTY) | {prereq_course_id}
+            for node in self._with_dependents(course_id):
+                self._closure[node] = self._closure.get(node, _EMPTY) | gained
+            self.version += 1
+
+    def remove_link(self, course_id: int, prereq_course_id: int) -> None:
+        with self._lock:
+            self.generation += 1
+            if not self.loaded or not self.has_link(course_id, prereq_course_id):
+                return
+            self._discard(self._prereqs, course_id, prereq_course_id)
+            self._discard(self._dependents, prereq_course_id, course_id)
+            self._set_group(course_id, prereq_course_id, None)
+            self._recompute(self._with_dependents(course_id))
+            self.version += 1
+
+    def remove_course(self, course_id: int) -> None:
+        """Drop a deleted course and every link touching it."""
+        with self._lock:
+            self.generation += 1
+            if not self.loaded:
+                return
+            affected = self._with_dependents(course_id) - {course_id}
+            for p in self._prereqs.pop(course_id, ()):
+                self._discard(self._dependents, p, course_id)
+                self._set_group(course_id, p, None)
+            for d in self._dependents.pop(course_id, ()):
+                self._discard(self._prereqs, d, course_id)
+                self._set_group(d, course_id, None)
+            self._closure.pop(course_id, None)
+            self._recompute(affected)
+            self.version += 1
+
+    # -----------------------------
+    # internals
+    # -----------------------------
+
+    @staticmethod
+    def _discard(index: Dict[int, Set[int]], key: int, value: int) -> None:
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        bucket.discard(value)
+        if not bucket:
+            del index[key]
+
+    def _set_group(self, course_id: int, prereq_course_id: int, any_of_group: Optional[int]) -> None:
+        if any_of_group is None:
+            self._any_of.pop((course_id, prereq_course_id), None)
+        else:
+            self._any_of[(course_id, prereq_course_id)] = any_of_group
+        self._rules.pop(course_id, None)
+
+    def _reachable_from(self, start: int) -> Set[int]:
+        seen: Set[int] = set()
+        queue = deque(self._prereqs.get(start, ()))
+        while queue:
+            node = queue.popleft()
+            if node in seen:
+                continue
+            seen.add(node)
+            queue.extend(self._prereqs.get(node, ()))
+        return seen
+
+    def _with_dependents(self, course_id: int) -> Set[int]:
+        """course_id plus every course that transitively depends on it."""
+        seen = {course_id}
+        queue = deque([course_id])
+        while queue:
+            for d in self._dependents.get(queue.popleft(), ()):
+                if d not in seen:
+                    seen.add(d)
+                    queue.append(d)
+        return seen
+
+    def _recompute(self, nodes: Iterable[int]) -> None:
+        for node in nodes:
+            reach = self._reachable_from(node)
+            if reach:
+                self._closure[node] = frozenset(reach)
+            else:
+                self._closure.pop(node, None)
+
+    def _compute_all_closures(self) -> Dict[int, FrozenSet[int]]:
+        """
+        Closures in topological order (prerequisites before dependents), so each
+        course unions already-finished closures. Courses on a cycle (only possible
+        for rows inserted before cycle checks existed) fall back to a BFS.
+        """
+        remaining = {c: len(ps) for c, ps in self._prereqs.items()}
+        ready = deque(p for p in self._dependents if p not in remaining)
+        closure: Dict[int, FrozenSet[int]] = {}
+
+        while ready:
+            node = ready.popleft()
+            acc: Set[int] = set()
+            for p in self._prereqs.get(node, ()):
+                acc.add(p)
+                acc |= closure.get(p, _EMPTY)
+            if acc:
+                closure[node] = frozenset(acc)
+            for d in self._dependents.get(node, ()):
+                remaining[d] -= 1
+                if remaining[d] == 0:
+                    ready.append(d)
+
+        for node, left in remaining.items():
+            if left > 0:
+                closure[node] = frozenset(self._reachable_from(node))
+        return closure
@@ -0,0 +1,105 @@
+# backend/app/utils/prerequisite_rules.py
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from backend.app.utils.passed_courses import PassedCourseSet
+
+
+class PrerequisiteRule:
+    """
+    Compiled prerequisite requirement of one course: an AND over groups, each
+    group an OR over course ids ("one of (CS101, CS102) and MATH201" is
+    ((CS101, CS102), (MATH201,))). A course without prerequisites has no groups.
+
+    Built once from the course's links and evaluated against a PassedCourseSet
+    with bitwise operations only: every single-course group is folded into one
+    "all of" mask, every alternative group becomes one "any of" mask.
+    """
+
+    __slots__ = ("groups", "_all_mask", "_any_masks")
+
+    def __init__(self, groups: Iterable[Iterable[int]] = ()) -> None:
+        normalized = {tuple(sorted(set(g))) for g in groups}
+        self.groups: Tuple[Tuple[int, ...], ...] = tuple(sorted(g for g in normalized if g))
+        self._all_mask = PassedCourseSet.mask(g[0] for g in self.groups if len(g) == 1)
+        self._any_masks = tuple(PassedCourseSet.mask(g) for g in self.groups if len(g) > 1)
+
+    @classmethod
+    def from_links(cls, links: Iterable[Tuple[int, Optional[int]]]) -> "PrerequisiteRule":
+        """
+        Build from (prereq_course_id, any_of_group) pairs of one course: links without a
+        group are required on their own, links sharing a group number form one OR group.
+        """
+        groups: List[List[int]] = []
+        alternatives: Dict[int, List[int]] = {}
+        for prereq_course_id, any_of_group in links:
+            if any_of_group is None:
+                groups.append([prereq_course_id])
+            else:
+                alternatives.setdefault(any_of_group, []).append(prereq_course_id)
+        return cls(groups + list(alternatives.values()))
+
+    @property
+    def is_all_of(self) -> bool:
+        """True if every group is a single course (plain "all of these" requirement)."""
+        return not self._any_masks
+
+    @property
+    def course_ids(self) -> List[int]:
+        return sorted({cid for g in self.groups for cid in g})
+
+    def is_satisfied(self, passed: PassedCourseSet) -> bool:
+        bits = passed.bits
+        if self._all_mask & ~bits:
+            return False
+        for mask in self._any_masks:
+            if not bits & mask:
+                return False
+        return True
+
+    def unmet_groups(self, passed: PassedCourseSet) -> List[Tuple[int, ...]]:
+        bits = passed.bits
+        return [g for g in self.groups if not bits & PassedCourseSet.mask(g)]
+
+    def missing_ids(self, passed: PassedCourseSet) -> List[int]:
+        """Course ids of every unmet group (any one per OR group would do)."""
+        return sorted({cid for g in self.unmet_groups(passed) for cid in g})
+
+    def describe_unmet(self, passed: PassedCourseSet) -> str:
+        """e.g. "[7, one of (3, 4)]"; for plain all-of rules the same as str(missing ids)."""
+        parts = [str(g[0]) if len(g) == 1 else f"one of ({', '.join(map(str, g))})" for g in self.unmet_groups(passed)]
+        return f"[{', '.join(parts)}]"
+
+    def expression(self) -> str:
+        """Readable form, e.g. "(3 OR 4) AND 7"; empty string when there are no prerequisites."""
+        return " AND ".join(
+            str(g[0]) if len(g) == 1 else "(" + " OR ".join(map(str, g)) + ")" for g in self.groups
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, PrerequisiteRule) and other.groups == self.groups
+
+    def __repr__(self) -> str:
+        return f"PrerequisiteRule({list(self.groups)})"
+
+
+EMPTY_RULE = PrerequisiteRule()
+
+
+def groups_to_links(groups: Sequence[Sequence[int]]) -> List[Tuple[int, Optional[int]]]:
+    """
+    Inverse of PrerequisiteRule.from_links: (prereq_course_id, any_of_group) pairs,
+    numbering OR groups 1..n in input order and leaving single-course groups ungrouped.
+    """
+    links: List[Tuple[int, Optional[int]]] = []
+    next_group = 1
+    for group in groups:
+        ids = list(dict.fromkeys(group))
+        if len(ids) == 1:
+            links.append((ids[0], None))
+        elif ids:
+            links.extend((cid, next_group) for cid in ids)
+            next_group += 1
+    return links
@@ -0,0 +1,39 @@
+# backend/app/utils/row_export.py
+
+from __future__ import annotations
+
+import csv
+import io
+from datetime import date, datetime, time
+from typing import Any, Iterable, Sequence
+
+import orjson
+
+# format -> media type of the streamed body
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def encode_ndjson(rows: Iterable[Sequence[Any]], fields: Sequence[str]) -> bytes:
+    """One JSON object per line (same keys and value formats as the JSON listings)."""
+    return b"".join(orjson.dumps(dict(zip(fields, row))) + b"\n" for row in rows)
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return "" if value is None else value
+
+
+def encode_csv(rows: Iterable[Sequence[Any]], fields: Sequence[str], *, header: bool = False) -> bytes:
+    """RFC 4180 lines (CRLF) for rows, optionally preceded by the header line."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(fields)
+    writer.writerows([_csv_value(v) for v in row[: len(fields)]] for row in rows)
+    return buffer.getvalue().encode("utf-8")
@@ -0,0 +1,124 @@
+# backend/app/utils/student_cache.py
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_registry: List["StudentTermCache"] = []
+
+_PENDING_KEY = "student_cache_pending_invalidations"
+_ALL = object()
+
+
+class StudentTermCache:
+    """
+    Small in-process LRU cache keyed by (student_id, term), with a TTL.
+
+    Entries are dropped explicitly through invalidate_student()/invalidate_all(),
+    which the repositories call on every write that changes a student's state;
+    the TTL only bounds staleness from writes outside this process.
+
+    A value computed from the database is only stored if nothing was invalidated
+    for the student since the read started: take generation() before the query
+    and pass it to set(), which ignores values read before a concurrent commit.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int = 10_000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[int, Hashable], Tuple[float, Any]]" = OrderedDict()
+        # student_id -> invalidation count; _epoch counts clear() calls
+        self._generations: Dict[int, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def get(self, student_id: int, term: Hashable) -> Optional[Any]:
+        key = (student_id, term)
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is None:
+                return None
+            expires, value = hit
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def generation(self, student_id: int) -> Tuple[int, int]:
+        with self._lock:
+            return self._epoch, self._generations.get(student_id, 0)
+
+    def set(self, student_id: int, term: Hashable, value: Any, *, generation: Tuple[int, int]) -> None:
+        """Store `value` unless the student was invalidated since `generation` was taken."""
+        with self._lock:
+            if generation != (self._epoch, self._generations.get(student_id, 0)):
+                return
+            self._entries[(student_id, term)] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end((student_id, term))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, student_id: int, term: Optional[Hashable] = None) -> None:
+        """Drop one (student, term) entry, or every term of the student if term is None."""
+        with self._lock:
+            self._generations[student_id] = self._generations.get(student_id, 0) + 1
+            if term is not None:
+                self._entries.pop((student_id, term), None)
+                return
+            for key in [k for k in self._entries if k[0] == student_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._generations.clear()
+            self._entries.clear()
+
+
+def invalidate_student(db: Session, student_id: int, term: Optional[Hashable] = None) -> None:
+    """
+    Invalidate the student's entries in every cache now, and again once `db` commits,
+    so a read racing with the still-open transaction cannot leave stale data behind.
+    """
+    _invalidate(student_id, term)
+    db.info.setdefault(_PENDING_KEY, set()).add((student_id, term))
+
+
+def invalidate_all(db: Session) -> None:
+    """Catalog-wide change (course times, prerequisites): drop every entry."""
+    _invalidate(_ALL, None)
+    db.info.setdefault(_PENDING_KEY, set()).add((_ALL, None))
+
+
+def clear_all() -> None:
+    """Drop every entry of every cache (tests, admin tooling)."""
+    _invalidate(_ALL, None)
+
+
+def _invalidate(student_id: Any, term: Optional[Hashable]) -> None:
+    for cache in _registry:
+        if student_id is _ALL:
+            cache.clear()
+        else:
+            cache.invalidate(student_id, term)
+
+
+@event.listens_for(Session, "after_commit")
+def _flush_pending_invalidations(session: Session) -> None:
+    for student_id, term in session.info.pop(_PENDING_KEY, ()):
+        _invalidate(student_id, term)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _flush_pending_on_rollback(session: Session, previous_transaction) -> None:
+    # Entries read inside the rolled-back transaction may reflect writes that never landed.
+    for student_id, term in session.info.pop(_PENDING_KEY, ()):
+        _invalidate(student_id, term)
@@ -0,0 +1,65 @@
+# backend/app/utils/text_search.py
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Iterable, List, Optional
+
+# Arabic code points that Persian keyboards and Arabic keyboards type differently
+# for the same letter, plus Persian / Arabic-Indic digits.
+_FOLD_TABLE = str.maketrans(
+    {
+        "ي": "ی",  # ARABIC YEH -> FARSI YEH
+        "ى": "ی",  # ALEF MAKSURA -> FARSI YEH
+        "ئ": "ی",  # YEH WITH HAMZA ABOVE -> FARSI YEH
+        "ك": "ک",  # ARABIC KAF -> KEHEH
+        "ة": "ه",  # TEH MARBUTA -> HEH
+        "ۀ": "ه",  # HEH WITH YEH ABOVE -> HEH
+        "أ": "ا",  # ALEF WITH HAMZA ABOVE -> ALEF
+        "إ": "ا",  # ALEF WITH HAMZA BELOW -> ALEF
+        "آ": "ا",  # ALEF WITH MADDA -> ALEF
+        "ٱ": "ا",  # ALEF WASLA -> ALEF
+        "ؤ": "و",  # WAW WITH HAMZA ABOVE -> WAW
+        "\u200c": " ",  # ZERO WIDTH NON-JOINER separates word parts; users type a space instead
+        **{chr(0x06F0 + d): str(d) for d in range(10)},  # Persian digits
+        **{chr(0x0660 + d): str(d) for d in range(10)},  # Arabic-Indic digits
+    }
+)
+
+# Harakat, superscript alef and tatweel carry no meaning for search.
+_STRIP = re.compile("[\u064b-\u065f\u0670\u0640]")
+_WORD = re.compile(r"\w+")
+
+
+def fold_text(value: Optional[str]) -> str:
+    """
+    Normalize text for indexing and querying: NFKC (also maps Arabic presentation
+    forms), Arabic/Persian letter and digit folding, diacritics removed, case-folded,
+    whitespace collapsed. The same function runs on both sides, so "علي" finds "علی".
+    """
+    if not value:
+        return ""
+    folded = unicodedata.normalize("NFKC", value).translate(_FOLD_TABLE)
+    folded = _STRIP.sub("", folded).casefold()
+    return " ".join(folded.split())
+
+
+def course_search_text(*fields: Optional[str]) -> str:
+    """The folded document stored in Course.search_text (code, name, professor, department)."""
+    return fold_text(" ".join(f for f in fields if f))
+
+
+def search_tokens(q: Optional[str]) -> List[str]:
+    """Folded words of a user query; punctuation and quotes are dropped."""
+    return _WORD.findall(fold_text(q))
+
+
+def fts5_match_query(tokens: Iterable[str]) -> str:
+    """SQLite FTS5 MATCH expression: every word must match as a prefix ("intro" finds "introduction")."""
+    return " AND ".join(f'"{t}"*' for t in tokens)
+
+
+def mysql_boolean_query(tokens: Iterable[str]) -> str:
+    """MySQL BOOLEAN MODE expression: every word required; the ngram parser matches it anywhere in a word."""
+    return " ".join(f'+"{t}"' for t in tokens)
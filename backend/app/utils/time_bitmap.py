@@ -0,0 +1,113 @@
+# backend/app/utils/time_bitmap.py
+
+from __future__ import annotations
+
+from datetime import time
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+DAY_ORDER = ["SAT", "SUN", "MON", "TUE", "WED", "THU", "FRI"]
+DAY_INDEX: Dict[str, int] = {d: i for i, d in enumerate(DAY_ORDER)}
+
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES  # 288
+
+
+def _minutes(t: time) -> int:
+    return t.hour * 60 + t.minute + (1 if (t.second or t.microsecond) else 0)
+
+
+def _overlaps(a_start, a_end, b_start, b_end) -> bool:
+    # If end == start => NOT a conflict (back-to-back allowed)
+    return (a_start < b_end) and (b_start < a_end)
+
+
+def interval_mask(day_of_week: str, start: time, end: time) -> int:
+    """
+    Bitmask of the 5-minute slots touched by [start, end) on the given day.
+    Slots are rounded outwards, so the mask never misses a real overlap.
+    Returns 0 for unknown day strings or empty intervals.
+    """
+    day = DAY_INDEX.get(str(day_of_week).upper())
+    if day is None:
+        return 0
+
+    first = _minutes(start) // SLOT_MINUTES
+    last = -(-_minutes(end) // SLOT_MINUTES)  # ceil
+    if last <= first:
+        return 0
+
+    width = last - first
+    return ((1 << width) - 1) << (day * SLOTS_PER_DAY + first)
+
+
+def course_slots(course, extra_meetings: Iterable = ()) -> List[Tuple[str, time, time]]:
+    """
+    Every weekly (day, start, end) of a course: its own columns (first meeting) plus
+    any additional meetings (objects with day_of_week / start_time / end_time).
+    """
+    return [(course.day_of_week, course.start_time, course.end_time)] + [
+        (m.day_of_week, m.start_time, m.end_time) for m in extra_meetings
+    ]
+
+
+class WeeklyOccupancy:
+    """
+    Compact weekly occupancy of one student for one term: a single int bitmap
+    over 7 days x 288 five-minute slots, plus the original blocks.
+
+    A conflict check is one bitwise AND. Only when the AND hits (or the day is
+    not one of DAY_ORDER) are the exact times compared, so results match the
+    original `start < other_end and other_start < end` rule even for times that
+    are not on a 5-minute boundary.
+    """
+
+    __slots__ = ("bits", "_blocks")
+
+    def __init__(self) -> None:
+        self.bits = 0
+        self._blocks: List[Tuple[str, time, time, int]] = []
+
+    @classmethod
+    def from_courses(
+        cls, courses: Iterable, meetings: Optional[Mapping[int, Sequence]] = None
+    ) -> "WeeklyOccupancy":
+        """meetings: {course_id: additional meetings} (course_meeting_repository.get_meetings_for_courses)."""
+        occ = cls()
+        for c in courses:
+            occ.add_course(c, (meetings or {}).get(c.id, ()))
+        return occ
+
+    def add_course(self, course, extra_meetings: Iterable = ()) -> None:
+        for day, start, end in course_slots(course, extra_meetings):
+            self.add(course.id, day, start, end)
+
+    def add(self, course_id: int, day_of_week: str, start: time, end: time) -> None:
+        self.bits |= interval_mask(day_of_week, start, end)
+        self._blocks.append((str(day_of_week).upper(), start, end, course_id))
+
+    def conflicting_course_id(self, day_of_week: str, start: time, end: time) -> Optional[int]:
+        """Return the id of an occupied course overlapping the interval, else None."""
+        day = str(day_of_week).upper()
+        if day in DAY_INDEX and not (self.bits & interval_mask(day, start, end)):
+            return None
+
+        for b_day, b_start, b_end, b_course_id in self._blocks:
+            if b_day == day and _overlaps(start, end, b_start, b_end):
+                return b_course_id
+        return None
+
+    def conflicts_with_course(self, course, extra_meetings: Iterable = ()) -> Optional[int]:
+        """Id of an occupied course overlapping any meeting of `course`, else None."""
+        for day, start, end in course_slots(course, extra_meetings):
+            conflict_id = self.conflicting_course_id(day, start, end)
+            if conflict_id is not None:
+                return conflict_id
+        return None
+
+    def flag_conflicts(self, courses: Iterable, meetings: Optional[Mapping[int, Sequence]] = None) -> Dict[int, bool]:
+        """
+        One pass over a catalog page: {course_id: conflicts_with_schedule}.
+        Each meeting costs a single AND on the fast path.
+        """
+        meetings = meetings or {}
+        return {c.id: self.conflicts_with_course(c, meetings.get(c.id, ())) is not None for c in courses}
@@ -8,9 +8,12 @@ from backend.app.models.course import Course  # noqa: F401
 from backend.app.models.student import Student  # noqa: F401
 from backend.app.models.professor import Professor  # noqa: F401
 from backend.app.models import course_prerequisite  # noqa: F401
+from backend.app.models import course_meeting  # noqa: F401
 from backend.app.models.unit_limit_policy import UnitLimitPolicy  # noqa: F401
 from backend.app.models.enrollment import Enrollment  # noqa
 from backend.app.models.student_course_history import StudentCourseHistory  # noqa
+from backend.app.models.waitlist_entry import WaitlistEntry  # noqa
+from backend.app.models.idempotency_record import IdempotencyRecord  # noqa
 
 
 def main() -> None:
@@ -0,0 +1,103 @@
+# backend/manual_bench_catalog_pagination.py (manual benchmark, not part of the test suite)
+"""
+Page-N latency of the course catalog: offset (skip/limit) vs keyset (cursor) paging.
+
+Seeds a throwaway SQLite database with --courses rows, then times fetching page
+1, 10, 100, ... with each strategy through course_repository.list_courses_page.
+Offset latency grows with the page number; keyset latency should stay flat.
+
+    DATABASE_URL=sqlite:///./bench.db JWT_SECRET_KEY=x \\
+        python -m backend.manual_bench_catalog_pagination --courses 200000 --page-size 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import time as dtime
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.database import Base
+from backend.app.models.course import Course
+from backend.app.repositories import course_repository
+from backend.app.utils.text_search import course_search_text
+
+import backend.create_db  # noqa: F401  (registers every model on Base.metadata)
+
+
+def _seed(session, n: int) -> None:
+    batch = []
+    for i in range(1, n + 1):
+        code, name = f"C{i:06d}", f"Course {i}"
+        batch.append(
+            {
+                "code": code,
+                "name": name,
+                "capacity": 30,
+                "professor_name": "Bench",
+                "day_of_week": "SAT",
+                "start_time": dtime(8, 0),
+                "end_time": dtime(10, 0),
+                "location": "R1",
+                "is_active": True,
+                "units": 3,
+                "department": "CS",
+                "semester": "1404-1",
+                "search_text": course_search_text(code, name, "Bench", "CS"),
+            }
+        )
+        if len(batch) == 5000:
+            session.execute(insert(Course), batch)
+            batch.clear()
+    if batch:
+        session.execute(insert(Course), batch)
+    session.commit()
+
+
+def _time(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--courses", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        _seed(session, args.courses)
+
+        size = args.page_size
+        last_page = args.courses // size
+        pages = sorted({p for p in (1, 10, 100, 1_000, 10_000, 100_000) if p <= last_page} | {last_page})
+
+        print(f"courses={args.courses} page_size={size} (median of {args.repeat} runs, ms)")
+        print(f"{'page':>8} {'offset':>10} {'keyset':>10}")
+        for page in pages:
+            skip = (page - 1) * size
+            # Key of the row just before the page (ids are 1..N here), as a client holding the cursor would send it
+            after = None if page == 1 else (None, skip)
+            offset_ms = _time(lambda: course_repository.list_courses_page(session, limit=size, skip=skip), args.repeat)
+            keyset_ms = _time(lambda: course_repository.list_courses_page(session, limit=size, after=after), args.repeat)
+            print(f"{page:>8} {offset_ms:>10.2f} {keyset_ms:>10.2f}")
+
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
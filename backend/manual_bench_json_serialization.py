@@ -0,0 +1,89 @@
+# backend/manual_bench_json_serialization.py (manual benchmark, not part of the test suite)
+"""
+Per-row cost of serializing a course listing: the ORM + pydantic path the routers
+used (Course objects -> CourseRead.model_validate -> response_model validation ->
+JSON) vs the fast path (COURSE_READ_COLUMNS tuples -> dicts -> orjson).
+
+Seeds a throwaway SQLite database with --courses rows and times fetching and encoding
+the first --rows of them (query included, as in a request).
+
+    DATABASE_URL=sqlite:///./bench.db JWT_SECRET_KEY=x \\
+        python -m backend.manual_bench_json_serialization --rows 1000 --rows 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.database import Base
+from backend.app.repositories import course_repository
+from backend.app.schemas.course import COURSE_READ_FIELDS, CourseRead
+from backend.app.utils.fast_json import json_response, rows_as_dicts
+from backend.manual_bench_catalog_pagination import _seed
+
+import backend.create_db  # noqa: F401  (registers every model on Base.metadata)
+
+# What FastAPI does with a response_model: validate the returned objects again, then dump to JSON
+_RESPONSE_ADAPTER = TypeAdapter(List[CourseRead])
+
+
+def _pydantic_path(session, rows: int) -> bytes:
+    session.expunge_all()
+    courses, _ = course_repository.list_courses_page(session, limit=rows, only_active=False)
+    items = [CourseRead.model_validate(c) for c in courses]
+    return _RESPONSE_ADAPTER.dump_json(_RESPONSE_ADAPTER.validate_python(items, from_attributes=True))
+
+
+def _fast_path(session, rows: int) -> bytes:
+    courses, _ = course_repository.list_courses_page(session, limit=rows, only_active=False, as_rows=True)
+    return json_response(rows_as_dicts(courses, COURSE_READ_FIELDS)).body
+
+
+def _time(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--courses", type=int, default=10_000)
+    parser.add_argument("--rows", type=int, action="append", help="listing sizes to time (repeatable)")
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+    sizes = args.rows or [100, 1_000, 5_000]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        _seed(session, args.courses)
+
+        print(f"courses={args.courses} (median of {args.repeat} runs; total ms and µs per row)")
+        print(f"{'rows':>8} {'pydantic ms':>12} {'fast ms':>10} {'pydantic µs/row':>16} {'fast µs/row':>12}")
+        for rows in sizes:
+            slow = _time(lambda: _pydantic_path(session, rows), args.repeat)
+            fast = _time(lambda: _fast_path(session, rows), args.repeat)
+            print(
+                f"{rows:>8} {slow * 1e3:>12.2f} {fast * 1e3:>10.2f} "
+                f"{slow * 1e6 / rows:>16.1f} {fast * 1e6 / rows:>12.1f}"
+            )
+
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# backend/manual_bench_student_routes.py (manual benchmark, not part of the test suite)
+"""
+Throughput benchmark for the student read/write routes against a running server.
+
+Run the same command against the sync build and the async-engine build (same
+worker count, same DB) and compare requests/second and latency percentiles:
+
+    uvicorn backend.app.main:app --workers 1
+    python -m backend.manual_bench_student_routes --token <student JWT> \
+        --concurrency 64 --duration 15 > bench_output.txt
+
+`--course-id` adds enroll + drop pairs to the mix (the course must be enrollable
+for the student; admission control may answer 429, which is counted separately).
+
+Reference run (read mix only, 1 uvicorn worker, SQLite, 200 courses, client on
+the same single-CPU host, 15 s per run):
+
+    build  concurrency  req/s  p50 ms  p99 ms  errors
+    sync        8        113.9    65.7   163.2   0
+    async       8        101.2    75.0   179.4   0
+    sync       16          -       -       -     stalls: QueuePool 5+10 exhausted,
+                                                 requests exceed the 30 s timeout
+    async      16         94.4   162.9   279.5   0
+    async      64        117.8   508.2  1482.2   0
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+import httpx
+
+READ_PATHS = ["/api/student/courses", "/api/student/enrollments", "/api/student/schedule"]
+
+
+async def _worker(client: httpx.AsyncClient, paths, course_id, deadline, latencies, statuses):
+    i = 0
+    while time.monotonic() < deadline:
+        started = time.monotonic()
+        if course_id is not None and i % 4 == 3:
+            r = await client.post("/api/student/enrollments", json={"course_id": course_id})
+            statuses[r.status_code] += 1
+            r = await client.delete(f"/api/student/enrollments/{course_id}")
+        else:
+            r = await client.get(paths[i % len(paths)])
+        statuses[r.status_code] += 1
+        latencies.append(time.monotonic() - started)
+        i += 1
+
+
+async def run(base_url: str, token: str, concurrency: int, duration: float, course_id) -> None:
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        headers={"Authorization": f"Bearer {token}"},
+        limits=limits,
+        timeout=30.0,
+    ) as client:
+        started = time.monotonic()
+        deadline = started + duration
+        await asyncio.gather(
+            *(_worker(client, READ_PATHS, course_id, deadline, latencies, statuses) for _ in range(concurrency))
+        )
+        elapsed = time.monotonic() - started
+
+    if not latencies:
+        print("no requests completed")
+        return
+
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000.0
+    print(f"concurrency={concurrency} duration={elapsed:.1f}s requests={len(latencies)}")
+    print(f"throughput={len(latencies) / elapsed:.1f} req/s")
+    print(
+        f"latency_ms mean={statistics.mean(latencies) * 1000.0:.1f} "
+        f"p50={pct(0.50):.1f} p95={pct(0.95):.1f} p99={pct(0.99):.1f}"
+    )
+    print("status_codes=" + ", ".join(f"{code}:{n}" for code, n in sorted(statuses.items())))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--token", required=True, help="student access token")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds")
+    parser.add_argument("--course-id", type=int, default=None, help="include enroll/drop pairs for this course")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.base_url, args.token, args.concurrency, args.duration, args.course_id))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,20 @@
 # backend/tests/conftest.py
 
 import os
-from typing import Generator
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Dict, Generator, Iterator, List
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 
-from backend.app.database import Base, get_db
+from backend.app.database import Base, get_async_db, get_db
 from backend.app.main import app
+from backend.app.repositories import prerequisite_repository
+from backend.app.services.jwt import create_access_token
+from backend.app.utils import student_cache
 from backend.tests import factories
 from backend.tests.factories import CURRENT_TERM 
 
@@ -20,12 +25,35 @@ test_engine = create_engine(
     TEST_DATABASE_URL,
     connect_args={"check_same_thread": False} if TEST_DATABASE_URL.startswith("sqlite") else {},
 )
+
+if TEST_DATABASE_URL.startswith("sqlite"):
+    # pysqlite defers BEGIN and turns RELEASE SAVEPOINT into a real commit, which lets
+    # "committed" test data (e.g. the singleton unit policy) leak between tests.
+    # Take over transaction control so the outer transaction below really rolls back.
+    @event.listens_for(test_engine, "connect")
+    def _sqlite_disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(test_engine, "begin")
+    def _sqlite_emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
 @pytest.fixture()
 def current_term(monkeypatch):
     monkeypatch.setenv("CURRENT_TERM", "1404-1")
     return "1404-1"
 
 
+@pytest.fixture(autouse=True)
+def _reset_in_process_caches():
+    # Row ids are reused once a test's transaction rolls back; never carry cached state over.
+    student_cache.clear_all()
+    prerequisite_repository.prerequisite_graph.invalidate()
+    yield
+    student_cache.clear_all()
+    prerequisite_repository.prerequisite_graph.invalidate()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def prepare_test_database() -> Generator[None, None, None]:
     Base.metadata.create_all(bind=test_engine)
@@ -67,6 +95,23 @@ def db_session() -> Generator[Session, None, None]:
 
         connection.close()
 
+class _SyncBackedAsyncSession:
+    """
+    Minimal AsyncSession stand-in over the test's sync session, so async routes
+    share the same SAVEPOINT-isolated transaction as the rest of the test.
+    Covers the subset the async routes use: execute() and run_sync().
+    """
+
+    def __init__(self, sync_session: Session):
+        self.sync_session = sync_session
+
+    async def execute(self, statement, *args, **kwargs):
+        return self.sync_session.execute(statement, *args, **kwargs)
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.sync_session, *args, **kwargs)
+
+
 @pytest.fixture()
 def client(db_session: Session) -> Generator[TestClient, None, None]:
     """
@@ -76,9 +121,63 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
     def override_get_db() -> Generator[Session, None, None]:
         yield db_session
 
+    async def override_get_async_db():
+        yield _SyncBackedAsyncSession(db_session)
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
 
     with TestClient(app) as c:
         yield c
 
-    app.dependency_overrides.clear()
\ No newline at end of file
+    app.dependency_overrides.clear()
+
+
+# -----------------------------
+# Shared helpers for query-count and API tests
+# -----------------------------
+
+@pytest.fixture()
+def capture_sql() -> Callable[..., Iterator[List[str]]]:
+    """
+    ``with capture_sql() as statements:`` collects the SQL the test engine runs inside
+    the block; ``capture_sql(selects_only=True)`` keeps only SELECT statements.
+    """
+    @contextmanager
+    def _capture(selects_only: bool = False) -> Iterator[List[str]]:
+        statements: List[str] = []
+
+        def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if not selects_only or statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", _before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(test_engine, "before_cursor_execute", _before_cursor_execute)
+
+    return _capture
+
+
+def _bearer(sub: str, role: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': sub, 'role': role})}"}
+
+
+@pytest.fixture()
+def admin_headers(db_session: Session) -> Dict[str, str]:
+    """Authorization header of a freshly created admin."""
+    s = uuid.uuid4().hex[:8]
+    admin = factories.make_admin(
+        db_session, username=f"admin_{s}", national_id=f"nid_{s}", email=f"admin_{s}@example.com"
+    )
+    return _bearer(admin.username, "admin")
+
+
+@pytest.fixture()
+def student_headers() -> Callable[..., Dict[str, str]]:
+    """``student_headers(student)``: Authorization header for that student."""
+    def _headers(student) -> Dict[str, str]:
+        return _bearer(student.student_number, "student")
+
+    return _headers
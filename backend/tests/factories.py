@@ -12,6 +12,7 @@ from backend.app.models.course import Course
 from backend.app.models.professor import Professor
 from backend.app.models.student import Student
 from backend.app.repositories import enrollment_repository
+from backend.app.services import unit_limit_service
 import uuid
 
 CURRENT_TERM = "1404-1"
@@ -265,6 +266,18 @@ def add_history(
     return _persist(db, StudentCourseHistory(**data))
 
 
+def update_unit_policy(db: Session, *, min_units: int = 0, max_units: int = 20):
+    """
+    Set the limits of the policy the service layer reads (set_unit_policy below
+    inserts another row instead) and commit.
+    """
+    policy = unit_limit_service.get_unit_limits_service(db)
+    policy.min_units = min_units
+    policy.max_units = max_units
+    db.commit()
+    return policy
+
+
 def set_unit_policy(db: Session, *, min_units: int = 0, max_units: int = 20):
     try:
         from backend.app.models.unit_limit_policy import UnitLimitPolicy  # type: ignore
@@ -0,0 +1,98 @@
+# backend/tests/test_async_student_routes.py
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from backend.app import database
+from backend.app.database import Base, to_async_url
+from backend.app.main import app
+from backend.app.services import unit_limit_service
+from backend.app.services.jwt import create_access_token
+from backend.tests import factories
+
+
+def test_to_async_url_maps_sync_drivers():
+    assert to_async_url("mysql+pymysql://u:p@h:3306/db") == "mysql+aiomysql://u:p@h:3306/db"
+    assert to_async_url("sqlite:///./dev.db") == "sqlite+aiosqlite:///./dev.db"
+    assert to_async_url("sqlite+aiosqlite:///./dev.db") == "sqlite+aiosqlite:///./dev.db"
+
+
+@pytest.fixture()
+def aiosqlite_client(tmp_path, monkeypatch, current_term):
+    """
+    Real async engine (aiosqlite) on a throwaway file DB, so the async routes run
+    end-to-end through get_async_db / AsyncSession instead of the sync test bridge.
+    """
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    db_file = tmp_path / "async_routes.db"
+    sync_engine = create_engine(f"sqlite:///{db_file}")
+    Base.metadata.create_all(bind=sync_engine)
+    seed_session = sessionmaker(bind=sync_engine, autoflush=False)()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_file}", poolclass=NullPool)
+    monkeypatch.setattr(database, "_async_engine", async_engine)
+    monkeypatch.setattr(
+        database,
+        "_AsyncSessionLocal",
+        async_sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False),
+    )
+
+    try:
+        with TestClient(app) as c:
+            yield c, seed_session
+    finally:
+        seed_session.close()
+        sync_engine.dispose()
+
+
+def test_enroll_list_schedule_catalog_and_drop_on_aiosqlite(aiosqlite_client, student_headers):
+    client, seed = aiosqlite_client
+
+    policy = unit_limit_service.get_unit_limits_service(seed)
+    policy.min_units = 0
+    policy.max_units = 20
+    seed.commit()
+
+    student = factories.make_student(seed)
+    course = factories.make_course(seed, day_of_week="MON", start_time="08:00", end_time="09:30")
+    other = factories.make_course(seed, day_of_week="MON", start_time="09:00", end_time="10:00")
+    headers = student_headers(student)
+
+    resp = client.post("/api/student/enrollments", json={"course_id": course.id}, headers=headers)
+    assert resp.status_code == 201, resp.text
+    assert resp.json()["course_id"] == course.id
+    assert resp.json()["created_at"] is not None
+
+    resp = client.get("/api/student/enrollments", headers=headers)
+    assert resp.status_code == 200, resp.text
+    assert [it["course"]["id"] for it in resp.json()] == [course.id]
+
+    resp = client.get("/api/student/schedule", headers=headers)
+    assert resp.status_code == 200, resp.text
+
+    resp = client.get("/api/student/courses", headers=headers)
+    assert resp.status_code == 200, resp.text
+    rows = {row["id"]: row for row in resp.json()}
+    assert rows[course.id]["enrolled"] == 1
+    assert rows[other.id]["has_time_conflict"] is True
+
+    resp = client.post("/api/student/enrollments", json={"course_id": other.id}, headers=headers)
+    assert resp.status_code == 409
+
+    resp = client.delete(f"/api/student/enrollments/{course.id}", headers=headers)
+    assert resp.status_code == 204, resp.text
+    assert client.get("/api/student/enrollments", headers=headers).json() == []
+
+
+def test_async_student_dependency_rejects_non_student_token(aiosqlite_client):
+    client, _ = aiosqlite_client
+    token = create_access_token(data={"sub": "someone", "role": "admin"})
+    resp = client.get("/api/student/courses", headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 403
@@ -0,0 +1,111 @@
+# backend/tests/test_catalog_etags.py
+
+from __future__ import annotations
+
+from backend.app.repositories import course_repository
+from backend.app.utils.etag import etag_matches
+from backend.tests import factories
+
+
+def _revalidate(client, url: str, headers: dict, etag: str):
+    return client.get(url, headers={**headers, "If-None-Match": etag})
+
+
+def test_if_none_match_parsing():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"a"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"a"')
+
+
+def test_admin_listing_answers_304_without_loading_course_rows(client, db_session, capture_sql, admin_headers):
+    for _ in range(3):
+        factories.make_course(db_session)
+
+    first = client.get("/api/courses?limit=2", headers=admin_headers)
+    etag = first.headers["ETag"]
+    assert etag.startswith('"')
+
+    db_session.expire_all()
+    with capture_sql() as statements:
+        resp = _revalidate(client, "/api/courses?limit=2", admin_headers, etag)
+
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["ETag"] == etag
+    assert not any("FROM courses" in s and "courses.name" in s for s in statements)
+    # the ETag is per request: another page of the same catalog is a different representation
+    assert client.get("/api/courses?limit=1", headers=admin_headers).headers["ETag"] != etag
+
+
+def test_course_writes_change_the_etag(client, db_session, admin_headers):
+    course = factories.make_course(db_session, name="Compilers")
+    url = "/api/courses"
+    etag = client.get(url, headers=admin_headers).headers["ETag"]
+
+    course.name = "Compiler Design"
+    db_session.commit()
+    resp = _revalidate(client, url, admin_headers, etag)
+    assert resp.status_code == 200
+    assert resp.json()[0]["name"] == "Compiler Design"
+    etag = resp.headers["ETag"]
+
+    # seat counter UPDATEs bypass the ORM but still bump the row version
+    assert course_repository.reserve_seat(db_session, course.id)
+    db_session.commit()
+    resp = _revalidate(client, url, admin_headers, etag)
+    assert resp.status_code == 200
+    assert resp.json()[0]["enrolled"] == 1
+    etag = resp.headers["ETag"]
+
+    db_session.delete(course)
+    db_session.commit()
+    resp = _revalidate(client, url, admin_headers, etag)
+    assert resp.status_code == 200
+    assert resp.json() == []
+
+
+def test_single_course_read_is_revalidated(client, db_session, admin_headers):
+    course_id = factories.make_course(db_session).id
+    url = f"/api/courses/{course_id}"
+    etag = client.get(url, headers=admin_headers).headers["ETag"]
+
+    assert _revalidate(client, url, admin_headers, etag).status_code == 304
+
+
+def test_student_catalog_etag_follows_the_students_schedule(client, db_session, student_headers):
+    student = factories.make_student(db_session)
+    other = factories.make_student(db_session)
+    course = factories.make_course(db_session)
+    url = "/api/student/courses"
+    etag = client.get(url, headers=student_headers(student)).headers["ETag"]
+
+    assert _revalidate(client, url, student_headers(student), etag).status_code == 304
+    # another student's enrollment changes seats_taken (and so the catalog) for everyone
+    factories.add_enrollment(db_session, student_id=other.id, course_id=course.id)
+    resp = _revalidate(client, url, student_headers(student), etag)
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+
+    # the student's own enrollments drive has_time_conflict
+    factories.add_enrollment(db_session, student_id=student.id, course_id=course.id)
+    assert _revalidate(client, url, student_headers(student), etag).status_code == 200
+    assert _revalidate(client, url, student_headers(other), etag).status_code == 200
+
+
+def test_prerequisite_list_is_revalidated_from_the_graph(client, db_session, capture_sql, admin_headers):
+    a, b, c = (factories.make_course(db_session).id for _ in range(3))
+    factories.add_prerequisite(db_session, course_id=b, prereq_course_id=a)
+    url = "/api/prerequisites"
+    first = client.get(url, headers=admin_headers)
+    etag = first.headers["ETag"]
+
+    with capture_sql() as statements:
+        resp = _revalidate(client, url, admin_headers, etag)
+    assert resp.status_code == 304
+    assert not any("course_prerequisites" in s for s in statements)
+
+    assert client.post(url, json={"course_id": c, "prereq_course_id": b}, headers=admin_headers).status_code == 201
+    resp = _revalidate(client, url, admin_headers, etag)
+    assert resp.status_code == 200
+    assert len(resp.json()) == 2
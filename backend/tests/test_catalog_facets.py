@@ -0,0 +1,92 @@
+# backend/tests/test_catalog_facets.py
+
+from __future__ import annotations
+
+from backend.app.utils.cursor import NEXT_CURSOR_HEADER
+from backend.tests import factories
+
+
+def _seed(db_session) -> dict:
+    return {
+        "cs_mon": factories.make_course(db_session, department="CS", day_of_week="MON", units=3).id,
+        "cs_sat": factories.make_course(
+            db_session, department="CS", day_of_week="SAT", units=2, start_time="14:00", end_time="16:00"
+        ).id,
+        "ee_mon": factories.make_course(db_session, department="EE", day_of_week="MON", units=3).id,
+        "math_sun": factories.make_course(db_session, department="Math", day_of_week="SUN", units=4).id,
+        "old_term": factories.make_course(db_session, department="CS", day_of_week="WED", semester="1403-2").id,
+    }
+
+
+def _ids(resp) -> list[int]:
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    return [c["id"] for c in (body["items"] if isinstance(body, dict) else body)]
+
+
+def test_filters_combine_and_repeat(client, db_session, student_headers):
+    headers = student_headers(factories.make_student(db_session))
+    ids = _seed(db_session)
+    url = "/api/student/courses"
+
+    assert _ids(client.get(url, params={"department": "CS", "semester": factories.CURRENT_TERM}, headers=headers)) == [
+        ids["cs_mon"],
+        ids["cs_sat"],
+    ]
+    assert _ids(client.get(url, params={"department": ["CS", "EE"], "day": "MON"}, headers=headers)) == [
+        ids["cs_mon"],
+        ids["ee_mon"],
+    ]
+    assert _ids(client.get(url, params={"units": [2, 4]}, headers=headers)) == [ids["cs_sat"], ids["math_sun"]]
+    assert _ids(client.get(url, params={"time_from": "13:00", "time_to": "17:00"}, headers=headers)) == [ids["cs_sat"]]
+    assert client.get(url, params={"day": "XYZ"}, headers=headers).status_code == 422
+
+
+def test_facet_counts_come_with_the_page(client, db_session, capture_sql, student_headers):
+    headers = student_headers(factories.make_student(db_session))
+    _seed(db_session)
+    params = {"semester": factories.CURRENT_TERM, "department": "CS", "facets": "true", "limit": 1}
+
+    with capture_sql() as statements:
+        resp = client.get("/api/student/courses", params=params, headers=headers)
+
+    body = resp.json()
+    assert len(body["items"]) == 1
+    assert NEXT_CURSOR_HEADER in resp.headers
+    facets = body["facets"]
+    # a facet ignores its own filter: the other departments stay selectable
+    assert facets["department"] == [
+        {"value": "CS", "count": 2},
+        {"value": "EE", "count": 1},
+        {"value": "Math", "count": 1},
+    ]
+    assert facets["day_of_week"] == [{"value": "MON", "count": 1}, {"value": "SAT", "count": 1}]
+    assert facets["units"] == [{"value": 2, "count": 1}, {"value": 3, "count": 1}]
+    assert sum("GROUP BY" in s for s in statements) == 3
+
+
+def test_facets_follow_the_search(client, db_session, student_headers):
+    headers = student_headers(factories.make_student(db_session))
+    factories.make_course(db_session, name="Graph Theory", department="CS")
+    factories.make_course(db_session, name="Graph Signal Processing", department="EE")
+    factories.make_course(db_session, name="Compilers", department="CS")
+
+    body = client.get("/api/student/courses", params={"q": "graph", "facets": "true"}, headers=headers).json()
+
+    assert len(body["items"]) == 2
+    assert body["facets"]["department"] == [{"value": "CS", "count": 1}, {"value": "EE", "count": 1}]
+
+
+def test_cursor_is_bound_to_the_filters(client, db_session, student_headers):
+    headers = student_headers(factories.make_student(db_session))
+    ids = _seed(db_session)
+
+    first = client.get("/api/student/courses", params={"department": "CS", "limit": 1}, headers=headers)
+    cursor = first.headers[NEXT_CURSOR_HEADER]
+    second = client.get(
+        "/api/student/courses", params={"department": "CS", "limit": 5, "cursor": cursor}, headers=headers
+    )
+    assert _ids(second) == [ids["cs_sat"], ids["old_term"]]
+
+    other = client.get("/api/student/courses", params={"department": "EE", "cursor": cursor}, headers=headers)
+    assert other.status_code == 400
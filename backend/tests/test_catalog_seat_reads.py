@@ -0,0 +1,23 @@
+# backend/tests/test_catalog_seat_reads.py
+
+from __future__ import annotations
+
+from backend.tests import factories
+
+
+def test_catalog_reads_seat_counts_without_touching_enrollments(client, db_session, capture_sql, admin_headers):
+
+    course = factories.make_course(db_session, capacity=5)
+    for _ in range(2):
+        student = factories.make_student(db_session)
+        factories.add_enrollment(db_session, student_id=student.id, course_id=course.id)
+
+    with capture_sql() as statements:
+        listing = client.get("/api/courses?limit=1000", headers=admin_headers)
+        detail = client.get(f"/api/courses/{course.id}", headers=admin_headers)
+
+    assert listing.status_code == 200, listing.text
+    assert detail.status_code == 200, detail.text
+    assert {c["id"]: c["enrolled"] for c in listing.json()}[course.id] == 2
+    assert detail.json()["enrolled"] == 2
+    assert not [s for s in statements if "from enrollments" in s or "join enrollments" in s]
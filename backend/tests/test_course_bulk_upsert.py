@@ -0,0 +1,126 @@
+# backend/tests/test_course_bulk_upsert.py
+
+from __future__ import annotations
+
+from sqlalchemy.exc import OperationalError
+
+from backend.app.models.course import Course
+from backend.app.repositories import course_repository
+from backend.app.services import course_service
+from backend.app.services.course_service import bulk_upsert_courses_service
+from backend.tests import factories
+
+
+def _offering(code: str, semester: str = factories.CURRENT_TERM, **overrides) -> dict:
+    row = {
+        "code": code,
+        "name": f"Course {code}",
+        "capacity": 40,
+        "professor_name": "Dr. Karimi",
+        "day_of_week": "SAT",
+        "start_time": "08:00",
+        "end_time": "10:00",
+        "location": "B-101",
+        "units": 3,
+        "department": "CS",
+        "semester": semester,
+    }
+    row.update(overrides)
+    return row
+
+
+def test_upsert_creates_updates_and_skips_unchanged(client, db_session, admin_headers):
+    kept = factories.make_course(db_session, code="CS100", semester=factories.CURRENT_TERM)
+    same = bulk_upsert_courses_service(db_session, [_offering("CS200")])[0]["course_id"]
+    other_term = factories.make_course(db_session, code="CS300", semester="1403-2")
+
+    rows = [
+        _offering("CS100", name="Renamed Course"),  # exists -> updated
+        _offering("CS200"),  # identical -> unchanged
+        _offering("CS300"),  # same code, other term -> created
+        _offering("CS300"),  # repeated key
+        _offering("CS400", units=9),  # invalid
+    ]
+    resp = client.post("/api/courses/bulk", json=rows, headers=admin_headers)
+
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert (body["created"], body["updated"], body["unchanged"], body["rejected"]) == (1, 1, 1, 2)
+    statuses = [(r["status"], r["course_id"]) for r in body["results"]]
+    assert statuses[:2] == [("updated", kept.id), ("unchanged", same)]
+    assert statuses[2][0] == "created" and statuses[2][1] not in (None, other_term.id)
+    assert [s for s, _ in statuses[3:]] == ["duplicate_in_batch", "invalid"]
+    assert body["results"][4]["detail"].startswith("units")
+
+    db_session.expire_all()
+    assert course_repository.get_course_by_id(db_session, kept.id).name == "Renamed Course"
+    created = course_repository.get_course_by_id(db_session, statuses[2][1])
+    assert (created.code, created.semester, created.seats_taken, created.is_active) == ("CS300", factories.CURRENT_TERM, 0, True)
+    # Core statements bypass the mapper hooks: the search text must still be maintained
+    found = [c.id for c in course_repository.list_courses_filtered(db_session, q="renamed", limit=10)]
+    assert found == [kept.id]
+
+
+def test_upsert_uses_set_based_statements_per_chunk(db_session, capture_sql):
+    factories.make_course(db_session, code="X000", semester=factories.CURRENT_TERM)
+    rows = [_offering(f"X{i:03d}") for i in range(7)]
+
+    with capture_sql() as statements:
+        results = bulk_upsert_courses_service(db_session, rows, chunk_size=3)
+
+    assert [r["status"] for r in results] == ["updated"] + ["created"] * 6
+    assert len({r["course_id"] for r in results}) == 7
+    inserts = [s for s in statements if s.startswith("INSERT INTO courses ")]
+    lookups = [s for s in statements if s.startswith("SELECT courses.id") and "(courses.code, courses.semester) IN" in s]
+    # 3 chunks: one existence lookup each, plus one id lookup per chunk that inserted
+    assert len(inserts) <= 3
+    assert len(lookups) == 6
+    assert db_session.query(Course).filter(Course.code.like("X%")).count() == 7
+
+
+def test_csv_upload_and_updates_change_the_catalog_etag(client, db_session, admin_headers):
+    etag = client.get("/api/courses", headers=admin_headers).headers["ETag"]
+    csv_body = (
+        "code,name,capacity,professor_name,day_of_week,start_time,end_time,location,units,department,semester\n"
+        f"MA101,Calculus I,60,Dr. Ahmadi,SUN,10:00,12:00,A-1,4,Math,{factories.CURRENT_TERM}\n"
+    )
+
+    resp = client.post("/api/courses/bulk", content=csv_body.encode(), headers={**admin_headers, "Content-Type": "text/csv"})
+
+    assert resp.json()["created"] == 1
+    assert client.get("/api/courses", headers={**admin_headers, "If-None-Match": etag}).status_code == 200
+    assert client.post("/api/courses/bulk", content=b"{", headers=admin_headers).status_code == 400
+
+
+def test_single_course_writes_use_the_same_code_semester_key(client, db_session, admin_headers):
+    bulk_upsert_courses_service(db_session, [_offering("CS900", "1403-1"), _offering("CS900", "1403-2")])
+
+    created = client.post("/api/courses", json=_offering("CS900", "1404-1"), headers=admin_headers)
+    assert created.status_code == 201, created.text
+    assert client.post("/api/courses", json=_offering("CS900", "1403-2"), headers=admin_headers).status_code == 400
+
+    course_id = created.json()["id"]
+    moved = client.put(f"/api/courses/{course_id}", json={"semester": "1403-1"}, headers=admin_headers)
+    assert moved.status_code == 400
+    renamed = client.put(f"/api/courses/{course_id}", json={"name": "Renamed"}, headers=admin_headers)
+    assert renamed.status_code == 200, renamed.text
+
+
+def test_failed_chunk_is_reported_and_other_chunks_are_kept(db_session, monkeypatch):
+    real_chunk = course_service.upsert_courses_chunk
+    calls = []
+
+    def _flaky_chunk(db, inserts, updates):
+        calls.append(len(inserts))
+        if len(calls) == 2:
+            raise OperationalError("INSERT INTO courses ...", {}, Exception("database is locked"))
+        real_chunk(db, inserts, updates)
+
+    monkeypatch.setattr(course_service, "upsert_courses_chunk", _flaky_chunk)
+    rows = [_offering(f"F{i:03d}") for i in range(6)]
+
+    results = bulk_upsert_courses_service(db_session, rows, chunk_size=2)
+
+    assert [r["status"] for r in results] == ["created", "created", "failed", "failed", "created", "created"]
+    assert all(r["course_id"] is None and "OperationalError" in r["detail"] for r in results[2:4])
+    assert db_session.query(Course).filter(Course.code.like("F%")).count() == 4
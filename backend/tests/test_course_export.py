@@ -0,0 +1,61 @@
+# backend/tests/test_course_export.py
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+
+from backend.app.repositories import course_repository
+from backend.app.schemas.course import COURSE_READ_FIELDS, CourseRead
+from backend.app.services.course_service import export_courses_service
+from backend.tests import factories
+
+
+def test_ndjson_export_has_one_course_read_per_line(client, db_session, admin_headers):
+    ids = [factories.make_course(db_session, name="آمار و احتمال").id, factories.make_course(db_session, is_active=False).id]
+
+    resp = client.get("/api/courses/export", headers=admin_headers)
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    assert 'filename="courses.ndjson"' in resp.headers["content-disposition"]
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert lines == [
+        CourseRead.model_validate(course_repository.get_course_by_id(db_session, cid)).model_dump(mode="json")
+        for cid in ids
+    ]
+
+
+def test_csv_export_with_header_and_active_filter(client, db_session, admin_headers):
+    active = factories.make_course(db_session, code="MATH1", start_time="08:30")
+    factories.make_course(db_session, is_active=False)
+
+    resp = client.get("/api/courses/export", params={"format": "csv", "active_only": "true"}, headers=admin_headers)
+
+    assert resp.headers["content-type"] == "text/csv; charset=utf-8"
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert list(rows[0]) == list(COURSE_READ_FIELDS)
+    assert [(r["id"], r["code"], r["start_time"]) for r in rows] == [(str(active.id), "MATH1", "08:30:00")]
+
+
+def test_export_streams_in_batches_without_orm_objects(db_session):
+    for _ in range(5):
+        factories.make_course(db_session)
+    db_session.expunge_all()
+
+    chunks = export_courses_service(db_session, batch_size=2)
+    first = next(chunks)
+
+    assert first.count(b"\n") == 2
+    assert len(db_session.identity_map) == 0
+    assert [c.count(b"\n") for c in chunks] == [2, 1]
+
+
+def test_export_is_admin_only(client, db_session, admin_headers, student_headers):
+    student = factories.make_student(db_session)
+
+    resp = client.get("/api/courses/export", headers=student_headers(student))
+
+    assert resp.status_code in (401, 403)
+    assert client.get("/api/courses/export?format=xml", headers=admin_headers).status_code == 422
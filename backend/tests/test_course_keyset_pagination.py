@@ -0,0 +1,92 @@
+# backend/tests/test_course_keyset_pagination.py
+
+from __future__ import annotations
+
+from backend.app.repositories import course_repository
+from backend.app.utils.cursor import NEXT_CURSOR_HEADER
+from backend.tests import factories
+
+
+def _walk(client, url: str, headers: dict, **params) -> list[list[int]]:
+    pages, cursor = [], None
+    while True:
+        resp = client.get(url, params={**params, **({"cursor": cursor} if cursor else {})}, headers=headers)
+        assert resp.status_code == 200, resp.text
+        pages.append([c["id"] for c in resp.json()])
+        cursor = resp.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return pages
+
+
+def test_cursor_walks_the_catalog_in_id_order(client, db_session, student_headers):
+    headers = student_headers(factories.make_student(db_session))
+    ids = [factories.make_course(db_session).id for _ in range(7)]
+
+    pages = _walk(client, "/api/student/courses", headers, limit=3)
+
+    assert [cid for page in pages for cid in page] == sorted(ids)
+    assert [len(p) for p in pages] == [3, 3, 1]
+
+
+def test_cursor_is_stable_while_the_catalog_changes(client, db_session, student_headers):
+    headers = student_headers(factories.make_student(db_session))
+    courses = [factories.make_course(db_session) for _ in range(6)]
+    ids = [c.id for c in courses]
+
+    first = client.get("/api/student/courses?limit=3", headers=headers)
+    cursor = first.headers[NEXT_CURSOR_HEADER]
+    # A course already shown is removed: offset paging would now skip ids[3].
+    db_session.delete(courses[0])
+    db_session.commit()
+
+    second = client.get("/api/student/courses", params={"limit": 3, "cursor": cursor}, headers=headers)
+    assert [c["id"] for c in second.json()] == ids[3:]
+    assert NEXT_CURSOR_HEADER not in second.headers
+
+
+def test_search_pages_follow_the_relevance_order(client, db_session, student_headers):
+    headers = student_headers(factories.make_student(db_session))
+    for i in range(5):
+        factories.make_course(db_session, name=" ".join(["Graph"] * (i + 1)) + " Theory")
+    factories.make_course(db_session, name="Compilers")
+    ranked = [c.id for c in course_repository.list_courses_filtered(db_session, q="graph", limit=50)]
+
+    pages = _walk(client, "/api/student/courses", headers, q="graph", limit=2)
+
+    assert [cid for page in pages for cid in page] == ranked
+    assert len(ranked) == 5
+
+
+def test_keyset_page_seeks_instead_of_skipping(db_session, capture_sql):
+    ids = [factories.make_course(db_session).id for _ in range(4)]
+    _, key = course_repository.list_courses_page(db_session, limit=2)
+
+    with capture_sql() as statements:
+        # skip is ignored once a cursor key is given
+        courses, next_key = course_repository.list_courses_page(db_session, limit=2, after=key, skip=500)
+
+    assert [c.id for c in courses] == ids[2:]
+    assert next_key is None
+    assert "courses.id > ?" in statements[-1]
+
+
+def test_invalid_or_foreign_cursor_is_rejected(client, db_session, student_headers):
+    headers = student_headers(factories.make_student(db_session))
+    for _ in range(3):
+        factories.make_course(db_session, name="Linear Algebra")
+    search_cursor = client.get("/api/student/courses?q=linear&limit=1", headers=headers).headers[NEXT_CURSOR_HEADER]
+
+    assert client.get("/api/student/courses", params={"cursor": "not-a-cursor"}, headers=headers).status_code == 400
+    resp = client.get("/api/student/courses", params={"cursor": search_cursor, "q": "algebra"}, headers=headers)
+    assert resp.status_code == 400
+
+
+def test_admin_listing_supports_cursor_and_legacy_skip(client, db_session, admin_headers):
+    ids = [factories.make_course(db_session, is_active=bool(i % 2)).id for i in range(5)]
+
+    pages = _walk(client, "/api/courses", admin_headers, limit=2)
+    assert [cid for page in pages for cid in page] == ids  # inactive courses included
+
+    legacy = client.get("/api/courses?skip=2&limit=2", headers=admin_headers)
+    assert [c["id"] for c in legacy.json()] == ids[2:4]
+    assert NEXT_CURSOR_HEADER in legacy.headers
@@ -0,0 +1,151 @@
+# backend/tests/test_course_meetings.py
+
+from __future__ import annotations
+
+from datetime import time
+
+import pytest
+
+from backend.app.repositories import course_meeting_repository
+from backend.app.services import enrollment_service
+from backend.app.services.eligibility_service import get_eligibility_matrix
+from backend.app.services.schedule_service import build_weekly_schedule
+from backend.tests import factories
+
+
+def _twice_a_week(db_session, **kwargs):
+    """MON 09:00-10:00 (the course row) + WED 14:00-15:30 in room B-2."""
+    course = factories.make_course(db_session, day_of_week="MON", start_time="09:00", end_time="10:00", **kwargs)
+    course_meeting_repository.replace_course_meetings(
+        db_session,
+        course.id,
+        [{"day_of_week": "WED", "start_time": time(14, 0), "end_time": time(15, 30), "location": "B-2"}],
+    )
+    return course
+
+
+def test_admin_replaces_and_reads_meetings(client, db_session, admin_headers):
+    course = factories.make_course(db_session, day_of_week="MON", start_time="09:00", end_time="10:00")
+    url = f"/api/courses/{course.id}/meetings"
+    version = course.row_version
+
+    body = {"meetings": [{"day_of_week": "WED", "start_time": "09:00", "end_time": "10:00"}]}
+    resp = client.put(url, json=body, headers=admin_headers)
+    assert resp.status_code == 200, resp.text
+    assert resp.json() == [{"day_of_week": "WED", "start_time": "09:00:00", "end_time": "10:00:00", "location": None}]
+    db_session.refresh(course)
+    assert course.row_version == version + 1
+
+    assert client.get(url, headers=admin_headers).json() == resp.json()
+    assert client.put(url, json={"meetings": []}, headers=admin_headers).json() == []
+    assert client.get("/api/courses/999999/meetings", headers=admin_headers).status_code == 404
+
+
+def test_overlapping_or_invalid_meetings_are_rejected(client, db_session, admin_headers):
+    course = factories.make_course(db_session, day_of_week="MON", start_time="09:00", end_time="10:00")
+    url = f"/api/courses/{course.id}/meetings"
+
+    # overlaps the course's own meeting
+    clash = {"meetings": [{"day_of_week": "MON", "start_time": "09:30", "end_time": "11:00"}]}
+    assert client.put(url, json=clash, headers=admin_headers).status_code == 409
+    # overlaps another new meeting
+    twice = {"meetings": [{"day_of_week": "TUE", "start_time": "09:00", "end_time": "10:00"}] * 2}
+    assert client.put(url, json=twice, headers=admin_headers).status_code == 409
+    backwards = {"meetings": [{"day_of_week": "TUE", "start_time": "10:00", "end_time": "09:00"}]}
+    assert client.put(url, json=backwards, headers=admin_headers).status_code == 422
+    assert course_meeting_repository.get_meetings_for_courses(db_session, [course.id]) == {course.id: []}
+
+
+def test_enrollment_conflicts_on_any_meeting(db_session):
+    student = factories.make_student(db_session)
+    enrolled = _twice_a_week(db_session)
+    factories.add_enrollment(db_session, student_id=student.id, course_id=enrolled.id)
+
+    # clashes only with the additional WED meeting
+    wed = factories.make_course(db_session, day_of_week="WED", start_time="15:00", end_time="16:00")
+    with pytest.raises(enrollment_service.TimeConflictError):
+        enrollment_service.enroll_student(db_session, student_id=student.id, course_id=wed.id)
+
+    # a candidate whose additional meeting clashes with the enrolled course's first one
+    other = factories.make_course(db_session, day_of_week="SAT", start_time="09:00", end_time="10:00")
+    course_meeting_repository.replace_course_meetings(
+        db_session, other.id, [{"day_of_week": "MON", "start_time": time(9, 30), "end_time": time(10, 30)}]
+    )
+    matrix = {row.course_id: row for row in get_eligibility_matrix(db_session, student_id=student.id).courses}
+    assert matrix[other.id].conflicting_course_id == enrolled.id
+    assert matrix[wed.id].conflicting_course_id == enrolled.id
+
+
+def test_cart_conflicts_between_additional_meetings(db_session):
+    student = factories.make_student(db_session)
+    first = _twice_a_week(db_session)
+    second = factories.make_course(db_session, day_of_week="TUE", start_time="09:00", end_time="10:00")
+    course_meeting_repository.replace_course_meetings(
+        db_session, second.id, [{"day_of_week": "WED", "start_time": time(15, 0), "end_time": time(16, 0)}]
+    )
+
+    with pytest.raises(enrollment_service.BulkEnrollmentError) as exc:
+        enrollment_service.enroll_student_bulk(db_session, student_id=student.id, course_ids=[first.id, second.id])
+    assert {r["error"] for r in exc.value.results} == {"time_conflict"}
+
+
+def test_schedule_has_a_block_per_meeting(db_session):
+    student = factories.make_student(db_session)
+    course = _twice_a_week(db_session, location="A-1")
+    early = factories.make_course(db_session, day_of_week="WED", start_time="08:00", end_time="09:00")
+    for c in (course, early):
+        factories.add_enrollment(db_session, student_id=student.id, course_id=c.id)
+
+    days = {d.day_of_week: d.blocks for d in build_weekly_schedule(db_session, student.id).days}
+    assert [(b.course_id, b.location) for b in days["MON"]] == [(course.id, "A-1")]
+    assert [(b.course_id, b.start_time, b.location) for b in days["WED"]] == [
+        (early.id, time(8, 0), early.location),
+        (course.id, time(14, 0), "B-2"),
+    ]
+
+
+def test_catalog_filters_facets_and_flags_use_all_meetings(client, db_session, student_headers):
+    student = factories.make_student(db_session)
+    headers = student_headers(student)
+    twice = _twice_a_week(db_session, department="CS")
+    friday = factories.make_course(db_session, department="CS", day_of_week="FRI", start_time="15:00", end_time="16:00")
+    factories.add_enrollment(db_session, student_id=student.id, course_id=friday.id)
+    clash = factories.make_course(db_session, department="CS", day_of_week="SUN")
+    course_meeting_repository.replace_course_meetings(
+        db_session, clash.id, [{"day_of_week": "FRI", "start_time": time(15, 30), "end_time": time(16, 30)}]
+    )
+    url = "/api/student/courses"
+
+    resp = client.get(url, params={"day": "WED", "time_from": "14:00"}, headers=headers)
+    assert [c["id"] for c in resp.json()] == [twice.id]
+    # day and window must hold for the same meeting
+    resp = client.get(url, params={"day": "WED", "time_to": "12:00"}, headers=headers)
+    assert resp.json() == []
+
+    resp = client.get(url, params={"department": "CS", "facets": "true"}, headers=headers)
+    body = resp.json()
+    days = {f["value"]: f["count"] for f in body["facets"]["day_of_week"]}
+    assert days == {"FRI": 2, "MON": 1, "SUN": 1, "WED": 1}
+    items = {c["id"]: c for c in body["items"]}
+    assert items[twice.id]["meetings"] == [
+        {"day_of_week": "WED", "start_time": "14:00:00", "end_time": "15:30:00", "location": "B-2"}
+    ]
+    assert items[friday.id]["meetings"] == []
+    assert items[clash.id]["has_time_conflict"] is True
+    assert items[twice.id]["has_time_conflict"] is False
+
+
+def test_catalog_loads_meetings_in_one_batch(client, db_session, capture_sql, student_headers):
+    student = factories.make_student(db_session)
+    headers = student_headers(student)
+    for _ in range(4):
+        _twice_a_week(db_session)
+    enrolled = factories.make_course(db_session, day_of_week="FRI")
+    factories.add_enrollment(db_session, student_id=student.id, course_id=enrolled.id)
+
+    with capture_sql() as statements:
+        resp = client.get("/api/student/courses", headers=headers)
+    assert resp.status_code == 200, resp.text
+    assert len(resp.json()) == 5
+    # one batch for the page, one for the student's own schedule
+    assert sum("FROM course_meetings" in s for s in statements) == 2
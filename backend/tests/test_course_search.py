@@ -0,0 +1,80 @@
+# backend/tests/test_course_search.py
+
+from __future__ import annotations
+
+from sqlalchemy import update
+
+from backend.app.models.course import Course
+from backend.app.repositories import course_repository
+from backend.app.utils.text_search import fold_text, fts5_match_query, search_tokens
+from backend.tests import factories
+
+
+def _search(db_session, q: str) -> list[int]:
+    return [c.id for c in course_repository.list_courses_filtered(db_session, q=q, limit=50)]
+
+
+def test_fold_text_unifies_arabic_and_persian_forms():
+    assert fold_text("علي") == fold_text("علی")
+    assert fold_text("كامپيوتر") == "کامپیوتر"
+    assert fold_text("مُحَمَّد") == "محمد"
+    assert fold_text("CS۱۰۱") == "cs101"
+    assert fold_text("کتاب‌ها") == "کتاب ها"
+    assert search_tokens('Dr. "ALICE", intro!') == ["dr", "alice", "intro"]
+    assert fts5_match_query(["intro", "alice"]) == '"intro"* AND "alice"*'
+
+
+def test_search_uses_the_fts_index_and_requires_every_word(db_session, capture_sql):
+    intro = factories.make_course(db_session, name="Introduction to Programming", professor_name="Dr. Alice").id
+    factories.make_course(db_session, name="Introduction to Networks", professor_name="Dr. Bob")
+    factories.make_course(db_session, name="Databases", professor_name="Dr. Alice")
+
+    with capture_sql() as statements:
+        assert _search(db_session, "intro alice") == [intro]
+
+    assert any("courses_fts MATCH" in s for s in statements)
+    assert not any("lower(" in s.lower() for s in statements)
+
+
+def test_search_covers_code_and_department_and_ranks_matches(db_session):
+    ml = factories.make_course(db_session, code="AI201", name="Machine Learning", department="AI").id
+    other = factories.make_course(db_session, name="Ethics of AI", department="Philosophy").id
+    factories.make_course(db_session, name="Compilers")
+
+    assert _search(db_session, "ai201") == [ml]
+    # ml matches "ai" twice (code prefix and department), the other course once
+    assert _search(db_session, "ai") == [ml, other]
+
+
+def test_persian_search_is_folded(db_session):
+    stats = factories.make_course(db_session, name="آمار و احتمال", professor_name="علی رضایی", department="کامپیوتر").id
+    factories.make_course(db_session, name="ریاضی ۱")
+
+    assert _search(db_session, "علي") == [stats]  # Arabic yeh
+    assert _search(db_session, "كامپيوتر") == [stats]  # Arabic kaf / yeh
+    assert _search(db_session, "امار") == [stats]  # alef with madda typed as plain alef
+
+
+def test_index_follows_create_update_delete(db_session):
+    course = factories.make_course(db_session, name="Operating Systems")
+    course_id = course.id
+    assert _search(db_session, "operating") == [course_id]
+
+    course.name = "Distributed Systems"
+    db_session.commit()
+    assert _search(db_session, "operating") == []
+    assert _search(db_session, "distributed") == [course_id]
+
+    db_session.delete(course)
+    db_session.commit()
+    assert _search(db_session, "distributed") == []
+
+
+def test_rebuild_backfills_search_text(db_session):
+    course_id = factories.make_course(db_session, name="Signals and Systems").id
+    db_session.execute(update(Course).where(Course.id == course_id).values(search_text=""))
+    assert _search(db_session, "signals") == []
+
+    course_repository.rebuild_course_search_index(db_session)
+
+    assert _search(db_session, "signals") == [course_id]
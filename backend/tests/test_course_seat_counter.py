@@ -0,0 +1,105 @@
+# backend/tests/test_course_seat_counter.py
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.orm.attributes import set_committed_value
+
+from backend.app.models.enrollment import Enrollment
+from backend.app.repositories import course_repository, enrollment_repository
+from backend.app.services.drop_service import drop_student_course
+from backend.app.services.enrollment_service import enroll_student, CapacityFullError
+from backend.app.services.course_service import list_courses_service
+from backend.tests import factories
+
+TERM = factories.CURRENT_TERM
+
+
+def test_enroll_and_drop_maintain_seats_taken(db_session):
+    factories.update_unit_policy(db_session)
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session, capacity=2)
+    assert course.seats_taken == 0
+
+    enroll_student(db_session, student_id=student.id, course_id=course.id, term=TERM)
+    db_session.refresh(course)
+    assert course.seats_taken == 1
+    assert course.enrolled == 1
+
+    drop_student_course(db_session, student_id=student.id, course_id=course.id, term=TERM)
+    db_session.refresh(course)
+    assert course.seats_taken == 0
+
+
+def test_reserve_seat_refuses_when_full(db_session):
+    course = factories.make_course(db_session, capacity=1)
+
+    assert course_repository.reserve_seat(db_session, course.id) is True
+    assert course_repository.reserve_seat(db_session, course.id) is False
+    db_session.refresh(course)
+    assert course.seats_taken == 1
+
+    course_repository.release_seat(db_session, course.id)
+    course_repository.release_seat(db_session, course.id)
+    db_session.refresh(course)
+    assert course.seats_taken == 0
+
+
+def test_repository_create_raises_when_counter_is_full(db_session):
+    s1 = factories.make_student(db_session)
+    s2 = factories.make_student(db_session)
+    course = factories.make_course(db_session, capacity=1)
+
+    enrollment_repository.create(db_session, student_id=s1.id, course_id=course.id, term=TERM)
+    with pytest.raises(enrollment_repository.SeatUnavailableError):
+        enrollment_repository.create(db_session, student_id=s2.id, course_id=course.id, term=TERM)
+
+    assert db_session.query(Enrollment).filter(Enrollment.course_id == course.id).count() == 1
+
+
+def test_stale_precheck_still_cannot_overbook(db_session, monkeypatch):
+    """Simulates a concurrent request that read the counter before the last seat was taken."""
+    factories.update_unit_policy(db_session)
+    s1 = factories.make_student(db_session)
+    s2 = factories.make_student(db_session)
+    course = factories.make_course(db_session, capacity=1)
+    enroll_student(db_session, student_id=s1.id, course_id=course.id, term=TERM)
+
+    real_get = course_repository.get_course_by_id
+
+    def _stale_get(db, course_id):
+        c = real_get(db, course_id)
+        set_committed_value(c, "seats_taken", 0)
+        return c
+
+    monkeypatch.setattr(course_repository, "get_course_by_id", _stale_get)
+
+    with pytest.raises(CapacityFullError):
+        enroll_student(db_session, student_id=s2.id, course_id=course.id, term=TERM)
+
+    assert db_session.query(Enrollment).filter(Enrollment.course_id == course.id).count() == 1
+
+
+def test_course_listing_reads_enrolled_without_count_queries(db_session, capture_sql):
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session)
+    enrollment_repository.create(db_session, student_id=student.id, course_id=course.id, term=TERM)
+
+    with capture_sql() as statements:
+        courses = list_courses_service(db_session, skip=0, limit=1000)
+
+    assert not any("count(" in s.lower() for s in statements)
+    assert {c.id: c.enrolled for c in courses}[course.id] == 1
+
+
+def test_recount_seats_taken_backfills_from_enrollments(db_session):
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session)
+    db_session.add(Enrollment(student_id=student.id, course_id=course.id, term=TERM))
+    db_session.commit()
+    db_session.refresh(course)
+    assert course.seats_taken == 0
+
+    course_repository.recount_seats_taken(db_session)
+    db_session.refresh(course)
+    assert course.seats_taken == 1
@@ -0,0 +1,135 @@
+# backend/tests/test_eligibility_matrix.py
+
+from __future__ import annotations
+
+from backend.app.repositories import course_history_repository, enrollment_repository
+from backend.app.services import eligibility_service, unit_limit_service
+from backend.app.services.eligibility_service import get_eligibility_matrix
+from backend.app.services.enrollment_service import enroll_student
+from backend.tests import factories
+
+TERM = factories.CURRENT_TERM
+
+
+def _by_course(matrix) -> dict:
+    return {row.course_id: row for row in matrix.courses}
+
+
+def test_matrix_flags_each_rule(db_session):
+    factories.update_unit_policy(db_session, max_units=6)
+    student = factories.make_student(db_session)
+    taken = factories.make_course(db_session, units=3, day_of_week="SAT", start_time="08:00", end_time="10:00")
+    factories.add_enrollment(db_session, student_id=student.id, course_id=taken.id)
+
+    prereq = factories.make_course(db_session, semester="1403-2")
+    locked = factories.make_course(db_session, units=3, day_of_week="SUN")
+    factories.add_prerequisite(db_session, course_id=locked.id, prereq_course_id=prereq.id)
+    clash = factories.make_course(db_session, units=3, day_of_week="SAT", start_time="09:00", end_time="11:00")
+    heavy = factories.make_course(db_session, units=4, day_of_week="MON")
+    full = factories.make_course(db_session, units=3, day_of_week="TUE", capacity=1)
+    factories.add_enrollment(db_session, student_id=factories.make_student(db_session).id, course_id=full.id)
+    ok = factories.make_course(db_session, units=3, day_of_week="WED")
+
+    matrix = get_eligibility_matrix(db_session, student_id=student.id, term=TERM)
+    rows = _by_course(matrix)
+
+    assert (matrix.current_units, matrix.max_units) == (3, 6)
+    assert prereq.id not in rows  # other term
+
+    assert rows[taken.id].already_enrolled and not rows[taken.id].time_conflict
+    assert not rows[locked.id].prereqs_met and rows[locked.id].missing_prereq_ids == [prereq.id]
+    assert rows[clash.id].time_conflict and rows[clash.id].conflicting_course_id == taken.id
+    assert not rows[heavy.id].unit_headroom
+    assert rows[full.id].seats_left == 0
+    assert rows[ok.id].eligible
+    assert [cid for cid, r in rows.items() if r.eligible] == [ok.id]
+
+
+def test_cache_hit_reads_only_seat_counters_and_sees_other_students_seats(db_session, capture_sql):
+    factories.update_unit_policy(db_session, max_units=20)
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session, capacity=2)
+    ids = (student.id, course.id)
+
+    get_eligibility_matrix(db_session, student_id=ids[0], term=TERM)
+    factories.add_enrollment(db_session, student_id=factories.make_student(db_session).id, course_id=ids[1])
+    db_session.expire_all()
+
+    with capture_sql(selects_only=True) as selects:
+        matrix = get_eligibility_matrix(db_session, student_id=ids[0], term=TERM)
+
+    assert len(selects) == 1
+    assert _by_course(matrix)[ids[1]].seats_left == 1
+
+
+def test_enroll_drop_and_history_invalidate_the_student_entry(db_session):
+    factories.update_unit_policy(db_session, max_units=20)
+    student = factories.make_student(db_session)
+    prereq = factories.make_course(db_session, semester="1403-2")
+    course = factories.make_course(db_session, day_of_week="SUN")
+    factories.add_prerequisite(db_session, course_id=course.id, prereq_course_id=prereq.id)
+
+    assert not _by_course(get_eligibility_matrix(db_session, student_id=student.id, term=TERM))[course.id].prereqs_met
+
+    course_history_repository.create_history_record(
+        db_session, student_id=student.id, course_id=prereq.id, term="1403-2", status="passed"
+    )
+    assert _by_course(get_eligibility_matrix(db_session, student_id=student.id, term=TERM))[course.id].eligible
+
+    enroll_student(db_session, student_id=student.id, course_id=course.id, term=TERM)
+    assert _by_course(get_eligibility_matrix(db_session, student_id=student.id, term=TERM))[course.id].already_enrolled
+
+    enrollment = enrollment_repository.get_by_student_course_term(db_session, student.id, course.id, TERM)
+    enrollment_repository.delete(db_session, enrollment)
+    assert not _by_course(get_eligibility_matrix(db_session, student_id=student.id, term=TERM))[course.id].already_enrolled
+
+
+def test_unit_policy_update_invalidates_cached_matrices(db_session):
+    factories.update_unit_policy(db_session, max_units=20)
+    student = factories.make_student(db_session)
+    factories.make_course(db_session, units=3)
+    assert get_eligibility_matrix(db_session, student_id=student.id, term=TERM).max_units == 20
+
+    unit_limit_service.update_unit_limits_service(db_session, min_units=0, max_units=1)
+
+    matrix = get_eligibility_matrix(db_session, student_id=student.id, term=TERM)
+    assert matrix.max_units == 1
+    assert not any(row.unit_headroom for row in matrix.courses)
+
+
+def test_flags_computed_before_a_concurrent_commit_are_not_cached(db_session, monkeypatch):
+    factories.update_unit_policy(db_session, max_units=20)
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session)
+    real_compute = eligibility_service._compute_student_flags
+    calls = []
+
+    def _compute_then_enroll_elsewhere(db, student_id, term):
+        flags = real_compute(db, student_id, term)
+        calls.append(student_id)
+        if len(calls) == 1:
+            # the student's enrollment commits in another session meanwhile
+            factories.add_enrollment(db_session, student_id=student_id, course_id=course.id)
+        return flags
+
+    monkeypatch.setattr(eligibility_service, "_compute_student_flags", _compute_then_enroll_elsewhere)
+    get_eligibility_matrix(db_session, student_id=student.id, term=TERM)
+    matrix = get_eligibility_matrix(db_session, student_id=student.id, term=TERM)
+
+    assert len(calls) == 2
+    assert _by_course(matrix)[course.id].already_enrolled is True
+
+
+def test_eligibility_endpoint(client, db_session, current_term, student_headers):
+    factories.update_unit_policy(db_session, max_units=20)
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session)
+
+    resp = client.get("/api/student/eligibility", headers=student_headers(student))
+
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["term"] == TERM
+    row = next(r for r in body["courses"] if r["course_id"] == course.id)
+    assert row["eligible"] is True
+    assert row["seats_left"] == course.capacity
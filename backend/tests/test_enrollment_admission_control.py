@@ -0,0 +1,119 @@
+# backend/tests/test_enrollment_admission_control.py
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from backend.app.services.admission_control import (
+    AdmissionController,
+    AdmissionRejectedError,
+    enrollment_admission,
+)
+from backend.tests import factories
+
+
+def _controller(**overrides) -> AdmissionController:
+    params = dict(max_concurrent=1, max_queue=2, max_wait_seconds=1.0, retry_after_seconds=3, max_per_key=1)
+    params.update(overrides)
+    return AdmissionController(**params)
+
+
+def test_waiters_are_admitted_fifo_when_slots_free_up():
+    ctl = _controller(max_per_key=5)
+    order: list[str] = []
+
+    async def worker(name: str):
+        await ctl.acquire(name)
+        order.append(name)
+        await asyncio.sleep(0.01)
+        ctl.release(name)
+
+    async def main():
+        await asyncio.gather(worker("a"), worker("b"), worker("c"))
+
+    asyncio.run(main())
+
+    assert order == ["a", "b", "c"]
+    snap = ctl.snapshot()
+    assert snap["admitted"] == 3
+    assert snap["active"] == 0
+    assert snap["queue_depth"] == 0
+    assert snap["max_wait_ms"] > 0
+
+
+def test_full_queue_is_rejected_immediately_with_retry_after():
+    ctl = _controller(max_queue=1)
+
+    async def main():
+        await ctl.acquire("holder")
+        queued = asyncio.create_task(ctl.acquire("queued"))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejectedError) as exc:
+            await ctl.acquire("overflow")
+        ctl.release("holder")
+        await queued
+        ctl.release("queued")
+        return exc.value
+
+    err = asyncio.run(main())
+    assert err.reason == "queue_full"
+    assert err.retry_after == 3
+    assert ctl.snapshot()["rejected_queue_full"] == 1
+
+
+def test_per_student_cap_keeps_one_client_from_flooding():
+    ctl = _controller(max_concurrent=5, max_per_key=1)
+
+    async def main():
+        await ctl.acquire("s1")
+        with pytest.raises(AdmissionRejectedError) as exc:
+            await ctl.acquire("s1")
+        await ctl.acquire("s2")  # other students are unaffected
+        ctl.release("s1")
+        ctl.release("s2")
+        return exc.value
+
+    assert asyncio.run(main()).reason == "per_key_limit"
+
+
+def test_waiter_times_out_and_frees_its_queue_position():
+    ctl = _controller(max_wait_seconds=0.02)
+
+    async def main():
+        await ctl.acquire("holder")
+        with pytest.raises(AdmissionRejectedError) as exc:
+            await ctl.acquire("late")
+        ctl.release("holder")
+        return exc.value
+
+    assert asyncio.run(main()).reason == "timeout"
+    snap = ctl.snapshot()
+    assert snap["queue_depth"] == 0
+    assert snap["active"] == 0
+
+
+def test_enroll_route_returns_429_when_queue_is_full(client, db_session, monkeypatch, student_headers):
+    monkeypatch.setattr(enrollment_admission, "_active", enrollment_admission.max_concurrent)
+    monkeypatch.setattr(enrollment_admission, "max_queue", 0)
+
+    student = factories.make_student(db_session)
+
+    resp = client.post(
+        "/api/student/enrollments",
+        json={"course_id": 1},
+        headers=student_headers(student),
+    )
+
+    assert resp.status_code == 429, resp.text
+    assert resp.headers["Retry-After"] == str(enrollment_admission.retry_after_seconds)
+
+
+def test_admin_can_read_queue_stats(client, admin_headers):
+    resp = client.get("/api/admin/enrollment-queue", headers=admin_headers)
+
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    for key in ("queue_depth", "active", "admitted", "rejected_queue_full", "avg_wait_ms"):
+        assert key in body
@@ -0,0 +1,186 @@
+# backend/tests/test_enrollment_idempotency.py
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.app.models.enrollment import Enrollment
+from backend.app.models.idempotency_record import IdempotencyRecord
+from backend.app.services import enrollment_service, idempotency_service
+from backend.tests import factories
+
+
+def _enrollment_count(db_session, student_id: int) -> int:
+    return db_session.query(Enrollment).filter(Enrollment.student_id == student_id).count()
+
+
+def test_replayed_enroll_returns_stored_response_without_validation_queries(client, db_session, current_term, capture_sql, student_headers):
+    factories.update_unit_policy(db_session)
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session)
+    headers = {**student_headers(student), "Idempotency-Key": "enroll-abc"}
+    body = {"course_id": course.id}
+
+    first = client.post("/api/student/enrollments", json=body, headers=headers)
+    assert first.status_code == 201, first.text
+    assert "Idempotent-Replayed" not in first.headers
+
+    with capture_sql() as statements:
+        second = client.post("/api/student/enrollments", json=body, headers=headers)
+
+    assert second.status_code == 201, second.text
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert second.json() == first.json()
+    assert _enrollment_count(db_session, student.id) == 1
+
+    # Only the auth lookup and the idempotency lookup; no course/enrollment/prereq queries.
+    assert len(statements) == 2
+    assert not any("enrollments" in s or "courses" in s for s in statements)
+
+
+def test_key_reused_for_different_request_is_rejected(client, db_session, current_term, student_headers):
+    factories.update_unit_policy(db_session)
+    student = factories.make_student(db_session)
+    a = factories.make_course(db_session, day_of_week="SAT")
+    b = factories.make_course(db_session, day_of_week="SUN")
+    headers = {**student_headers(student), "Idempotency-Key": "k1"}
+
+    assert client.post("/api/student/enrollments", json={"course_id": a.id}, headers=headers).status_code == 201
+    resp = client.post("/api/student/enrollments", json={"course_id": b.id}, headers=headers)
+
+    assert resp.status_code == 422
+    assert _enrollment_count(db_session, student.id) == 1
+
+
+def test_keys_are_scoped_per_student(client, db_session, current_term, student_headers):
+    factories.update_unit_policy(db_session)
+    s1 = factories.make_student(db_session)
+    s2 = factories.make_student(db_session)
+    course = factories.make_course(db_session, capacity=5)
+
+    for s in (s1, s2):
+        resp = client.post("/api/student/enrollments", json={"course_id": course.id}, headers={**student_headers(s), "Idempotency-Key": "same"})
+        assert resp.status_code == 201, resp.text
+        assert "Idempotent-Replayed" not in resp.headers
+
+
+def test_conflict_outcome_is_stored_and_replayed(client, db_session, current_term, student_headers):
+    factories.update_unit_policy(db_session)
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session)
+    factories.add_enrollment(db_session, student_id=student.id, course_id=course.id)
+    headers = {**student_headers(student), "Idempotency-Key": "dup"}
+
+    first = client.post("/api/student/enrollments", json={"course_id": course.id}, headers=headers)
+    second = client.post("/api/student/enrollments", json={"course_id": course.id}, headers=headers)
+
+    assert first.status_code == second.status_code == 409
+    assert second.json() == first.json()
+    assert second.headers["Idempotent-Replayed"] == "true"
+
+
+def test_replayed_drop_returns_204_instead_of_not_enrolled(client, db_session, current_term, student_headers):
+    factories.update_unit_policy(db_session)
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session)
+    factories.add_enrollment(db_session, student_id=student.id, course_id=course.id)
+    headers = {**student_headers(student), "Idempotency-Key": "drop-1"}
+
+    first = client.delete(f"/api/student/enrollments/{course.id}", headers=headers)
+    second = client.delete(f"/api/student/enrollments/{course.id}", headers=headers)
+    without_key = client.delete(f"/api/student/enrollments/{course.id}", headers=student_headers(student))
+
+    assert first.status_code == second.status_code == 204
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert without_key.status_code == 404
+
+
+def test_expired_key_runs_the_request_again(client, db_session, current_term, student_headers):
+    factories.update_unit_policy(db_session)
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session)
+    factories.add_enrollment(db_session, student_id=student.id, course_id=course.id)
+    headers = {**student_headers(student), "Idempotency-Key": "old"}
+
+    assert client.delete(f"/api/student/enrollments/{course.id}", headers=headers).status_code == 204
+
+    record = db_session.query(IdempotencyRecord).filter(IdempotencyRecord.key == "old").one()
+    record.expires_at = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=1)
+    db_session.commit()
+
+    resp = client.delete(f"/api/student/enrollments/{course.id}", headers=headers)
+    assert resp.status_code == 404
+    assert "Idempotent-Replayed" not in resp.headers
+
+
+def test_requests_without_key_store_nothing(client, db_session, current_term, student_headers):
+    factories.update_unit_policy(db_session)
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session)
+
+    assert client.post("/api/student/enrollments", json={"course_id": course.id}, headers=student_headers(student)).status_code == 201
+    assert db_session.query(IdempotencyRecord).count() == 0
+
+
+def _claim(db_session, student_id: int, key: str, fingerprint: str = "x" * 64) -> None:
+    """A pending record, as left by a first request that is still running."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    db_session.add(
+        IdempotencyRecord(
+            student_id=student_id,
+            key=key,
+            request_fingerprint=fingerprint,
+            status_code=None,
+            expires_at=now + timedelta(seconds=60),
+        )
+    )
+    db_session.commit()
+
+
+def test_retry_while_first_request_runs_is_turned_away(client, db_session, current_term, student_headers):
+    factories.update_unit_policy(db_session)
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session)
+    body = {"course_id": course.id}
+    fingerprint = idempotency_service.request_fingerprint("POST", "/api/student/enrollments", body)
+    _claim(db_session, student.id, "slow", fingerprint)
+
+    resp = client.post("/api/student/enrollments", json=body, headers={**student_headers(student), "Idempotency-Key": "slow"})
+
+    assert resp.status_code == 409
+    assert "Retry-After" in resp.headers
+    assert _enrollment_count(db_session, student.id) == 0
+    # the running request still owns the key and records its own outcome
+    record = db_session.query(IdempotencyRecord).filter(IdempotencyRecord.key == "slow").one()
+    assert record.status_code is None
+
+
+def test_key_is_claimed_then_completed(client, db_session, current_term, student_headers):
+    factories.update_unit_policy(db_session)
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session)
+
+    resp = client.post("/api/student/enrollments", json={"course_id": course.id}, headers={**student_headers(student), "Idempotency-Key": "k"})
+
+    assert resp.status_code == 201
+    record = db_session.query(IdempotencyRecord).filter(IdempotencyRecord.key == "k").one()
+    assert record.status_code == 201
+    assert record.expires_at > datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+
+
+def test_failed_request_releases_the_key(client, db_session, current_term, monkeypatch, student_headers):
+    factories.update_unit_policy(db_session)
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session)
+
+    def _boom(*args, **kwargs):
+        raise RuntimeError("database went away")
+
+    monkeypatch.setattr(enrollment_service, "enroll_student", _boom)
+    with pytest.raises(RuntimeError):
+        client.post("/api/student/enrollments", json={"course_id": course.id}, headers={**student_headers(student), "Idempotency-Key": "boom"})
+
+    # nothing to replay: the key is free for the client's retry
+    assert db_session.query(IdempotencyRecord).filter(IdempotencyRecord.key == "boom").count() == 0
@@ -0,0 +1,87 @@
+# backend/tests/test_enrollment_query_plan.py
+
+from __future__ import annotations
+
+from datetime import time
+
+import pytest
+
+from backend.app.repositories import course_history_repository, enrollment_repository, prerequisite_repository
+from backend.app.services.enrollment_service import enroll_student, PrereqNotMetError, TimeConflictError
+from backend.tests import factories
+
+
+def _seed(db_session, *, n_prereqs: int, n_enrolled: int):
+    factories.update_unit_policy(db_session, min_units=0, max_units=40)
+    student = factories.make_student(db_session)
+    target = factories.make_course(db_session, units=1, day_of_week="SAT")
+
+    for _ in range(n_prereqs):
+        p = factories.make_course(db_session, units=1, day_of_week="SUN")
+        factories.add_prerequisite(db_session, course_id=target.id, prereq_course_id=p.id)
+        factories.add_history(db_session, student_id=student.id, course_id=p.id, term="1403-2")
+
+    for i in range(n_enrolled):
+        c = factories.make_course(
+            db_session, units=1, day_of_week="MON", start_time=time(8 + i, 0), end_time=time(9 + i, 0)
+        )
+        factories.add_enrollment(db_session, student_id=student.id, course_id=c.id)
+
+    ids = (student.id, target.id)
+    db_session.expire_all()
+    return ids
+
+
+def _enroll_select_count(db_session, capture_sql, *, n_prereqs: int, n_enrolled: int) -> int:
+    student_id, target_id = _seed(db_session, n_prereqs=n_prereqs, n_enrolled=n_enrolled)
+    prerequisite_repository.get_prereq_graph(db_session)  # warm: prereq ids come from memory
+
+    with capture_sql(selects_only=True) as selects:
+        enroll_student(db_session, student_id=student_id, course_id=target_id, term=factories.CURRENT_TERM)
+
+    return len(selects)
+
+
+def test_enroll_select_count_does_not_grow_with_prereqs_or_enrollments(db_session, capture_sql):
+    small = _enroll_select_count(db_session, capture_sql, n_prereqs=1, n_enrolled=1)
+    large = _enroll_select_count(db_session, capture_sql, n_prereqs=6, n_enrolled=8)
+
+    assert small == large
+    # course, term enrollments+courses, capacity, passed subset, policy, refresh
+    assert large <= 6
+
+
+def test_list_passed_course_ids_among_returns_only_passed_subset(db_session):
+    student = factories.make_student(db_session)
+    a = factories.make_course(db_session)
+    b = factories.make_course(db_session)
+    c = factories.make_course(db_session)
+    factories.add_history(db_session, student_id=student.id, course_id=a.id, status="passed")
+    factories.add_history(db_session, student_id=student.id, course_id=b.id, status="failed")
+
+    got = course_history_repository.list_passed_course_ids_among(db_session, student.id, [a.id, b.id, c.id])
+    assert got == {a.id}
+    assert course_history_repository.list_passed_course_ids_among(db_session, student.id, []) == set()
+
+
+def test_batched_path_keeps_prereq_and_conflict_semantics(db_session):
+    factories.update_unit_policy(db_session, min_units=0, max_units=40)
+    student = factories.make_student(db_session)
+    p1 = factories.make_course(db_session, day_of_week="SUN")
+    p2 = factories.make_course(db_session, day_of_week="SUN")
+    target = factories.make_course(db_session, day_of_week="TUE", start_time="10:00", end_time="11:00")
+    factories.add_prerequisite(db_session, course_id=target.id, prereq_course_id=p1.id)
+    factories.add_prerequisite(db_session, course_id=target.id, prereq_course_id=p2.id)
+    factories.add_history(db_session, student_id=student.id, course_id=p1.id)
+
+    with pytest.raises(PrereqNotMetError) as exc:
+        enroll_student(db_session, student_id=student.id, course_id=target.id, term=factories.CURRENT_TERM)
+    assert str(p2.id) in str(exc.value)
+    assert str(p1.id) not in str(exc.value).split(":")[-1]
+
+    factories.add_history(db_session, student_id=student.id, course_id=p2.id)
+    busy = factories.make_course(db_session, day_of_week="TUE", start_time="10:30", end_time="11:30")
+    enrollment_repository.create(db_session, student_id=student.id, course_id=busy.id, term=factories.CURRENT_TERM)
+
+    with pytest.raises(TimeConflictError):
+        enroll_student(db_session, student_id=student.id, course_id=target.id, term=factories.CURRENT_TERM)
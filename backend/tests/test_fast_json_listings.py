@@ -0,0 +1,65 @@
+# backend/tests/test_fast_json_listings.py
+
+from __future__ import annotations
+
+from backend.app.repositories import course_repository
+from backend.app.schemas.course import CourseRead, StudentCatalogCourseRead
+from backend.app.schemas.legacy_prerequisite import LegacyPrerequisiteRead
+from backend.tests import factories
+
+
+def _seed(db_session) -> list[int]:
+    first = factories.make_course(db_session, name="برنامه‌سازی پیشرفته", department="کامپیوتر", start_time="08:30")
+    second = factories.make_course(db_session, name="Data Structures", day_of_week="SAT", units=4, is_active=False)
+    factories.add_enrollment(db_session, student_id=factories.make_student(db_session).id, course_id=first.id)
+    return [first.id, second.id]
+
+
+def test_admin_listing_matches_the_pydantic_shape(client, db_session, admin_headers):
+    ids = _seed(db_session)
+
+    resp = client.get("/api/courses", headers=admin_headers)
+
+    assert resp.headers["content-type"] == "application/json"
+    expected = [
+        CourseRead.model_validate(course_repository.get_course_by_id(db_session, cid)).model_dump(mode="json")
+        for cid in ids
+    ]
+    assert resp.json() == expected
+    assert list(resp.json()[0]) == list(expected[0])  # same key order
+    assert resp.json()[0]["enrolled"] == 1
+    assert resp.json()[0]["start_time"] == "08:30:00"
+
+
+def test_student_catalog_rows_carry_conflict_flags(client, db_session, student_headers):
+    student = factories.make_student(db_session)
+    headers = student_headers(student)
+    taken = factories.make_course(db_session, day_of_week="MON", start_time="10:00", end_time="12:00")
+    clash = factories.make_course(db_session, day_of_week="MON", start_time="11:00", end_time="13:00")
+    free = factories.make_course(db_session, day_of_week="TUE", name="Compilers")
+    factories.add_enrollment(db_session, student_id=student.id, course_id=taken.id)
+
+    body = client.get("/api/student/courses", headers=headers).json()
+
+    flags = {row["id"]: row["has_time_conflict"] for row in body}
+    assert flags == {taken.id: True, clash.id: True, free.id: False}
+    row = next(r for r in body if r["id"] == free.id)
+    expected = StudentCatalogCourseRead.model_validate(course_repository.get_course_by_id(db_session, free.id))
+    assert row == expected.model_dump(mode="json")
+
+    # search pages (rows plus a relevance column) keep the same shape
+    searched = client.get("/api/student/courses", params={"q": "compilers"}, headers=headers).json()
+    assert searched == [row]
+
+
+def test_prerequisite_list_matches_the_pydantic_shape(client, db_session, admin_headers):
+    a, b = (factories.make_course(db_session).id for _ in range(2))
+    factories.add_prerequisite(db_session, course_id=b, prereq_course_id=a)
+
+    body = client.get("/api/prerequisites", headers=admin_headers).json()
+
+    assert body == [
+        LegacyPrerequisiteRead(
+            id=f"{b}-{a}", course_id=b, prereq_course_id=a, target_course_id=b, prerequisite_course_id=a
+        ).model_dump(mode="json")
+    ]
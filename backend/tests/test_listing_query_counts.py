@@ -0,0 +1,39 @@
+# backend/tests/test_listing_query_counts.py
+
+from __future__ import annotations
+
+from backend.tests import factories
+
+
+def _seed(db_session, n: int) -> None:
+    for _ in range(n):
+        course = factories.make_course(db_session, name="Discrete Mathematics")
+        factories.add_enrollment(db_session, student_id=factories.make_student(db_session).id, course_id=course.id)
+
+
+def _statement_count(client, db_session, capture_sql, url: str, headers: dict) -> int:
+    db_session.expire_all()
+    with capture_sql() as statements:
+        resp = client.get(url, headers=headers)
+    assert resp.status_code == 200, resp.text
+    return len(statements)
+
+
+def test_every_listing_costs_the_same_number_of_queries_for_any_page_size(
+    client, db_session, capture_sql, admin_headers, student_headers
+):
+    as_student = student_headers(factories.make_student(db_session))
+    urls = [
+        ("/api/courses?limit=200", admin_headers),
+        ("/api/student/courses?limit=200", as_student),
+        ("/api/student/courses?q=discrete&limit=200", as_student),
+    ]
+
+    _seed(db_session, 2)
+    small = [_statement_count(client, db_session, capture_sql, url, headers) for url, headers in urls]
+    _seed(db_session, 25)
+    large = [_statement_count(client, db_session, capture_sql, url, headers) for url, headers in urls]
+
+    assert large == small
+    # enrolled comes from the seats_taken column of the same row: no aggregate, no per-row COUNT
+    assert client.get(urls[0][0], headers=admin_headers).json()[0]["enrolled"] == 1
@@ -0,0 +1,72 @@
+# backend/tests/test_passed_course_set.py
+
+from __future__ import annotations
+
+from backend.app.repositories import course_history_repository
+from backend.app.utils import student_cache
+from backend.app.utils.passed_courses import PassedCourseSet
+from backend.tests import factories
+
+
+def test_bitset_operations():
+    passed = PassedCourseSet.from_ids([7, 3, 130, 3])
+
+    assert list(passed) == [3, 7, 130]
+    assert len(passed) == 3
+    assert 130 in passed and 4 not in passed and -1 not in passed
+    assert passed.issuperset([3, 130]) and not passed.issuperset([3, 8])
+    assert passed.missing([8, 7, 2]) == [8, 2]
+    assert passed.intersection({1, 3, 130}) == {3, 130}
+    assert PassedCourseSet() == PassedCourseSet.from_ids([])
+
+
+def test_one_query_then_served_from_cache(db_session, capture_sql):
+    student_id = factories.make_student(db_session).id
+    a = factories.make_course(db_session, semester="1403-2").id
+    b = factories.make_course(db_session, semester="1403-2").id
+    factories.add_history(db_session, student_id=student_id, course_id=a, term="1403-2")
+    factories.add_history(db_session, student_id=student_id, course_id=b, term="1403-2", status="failed")
+
+    with capture_sql() as statements:
+        assert course_history_repository.list_passed_courses(db_session, student_id) == [a]
+        assert course_history_repository.has_passed_course(db_session, student_id, a)
+        assert not course_history_repository.has_passed_course(db_session, student_id, b)
+        assert course_history_repository.list_passed_course_ids_among(db_session, student_id, [a, b]) == {a}
+
+    assert len(statements) == 1
+
+
+def test_history_writes_invalidate_the_cached_set(db_session):
+    student_id = factories.make_student(db_session).id
+    a = factories.make_course(db_session, semester="1403-2").id
+    b = factories.make_course(db_session, semester="1403-2").id
+    assert list(course_history_repository.get_passed_course_set(db_session, student_id)) == []
+
+    course_history_repository.create_history_record(
+        db_session, student_id=student_id, course_id=a, term="1403-2", status="passed"
+    )
+    assert list(course_history_repository.get_passed_course_set(db_session, student_id)) == [a]
+
+    # Plain ORM insert (no repository call): the flush hook drops the entry too.
+    factories.add_history(db_session, student_id=student_id, course_id=b, term="1403-2")
+    assert list(course_history_repository.get_passed_course_set(db_session, student_id)) == sorted([a, b])
+
+
+def test_sets_read_before_a_concurrent_history_commit_are_not_cached(db_session, monkeypatch):
+    student_id = factories.make_student(db_session).id
+    other_id = factories.make_student(db_session).id
+    real_query = db_session.query
+
+    def _query_then_commit_elsewhere(*entities):
+        query = real_query(*entities)
+        # another session's history write commits while this read is in flight
+        student_cache.clear_all()
+        return query
+
+    monkeypatch.setattr(db_session, "query", _query_then_commit_elsewhere)
+    course_history_repository.get_passed_course_set(db_session, student_id)
+    course_history_repository.get_passed_course_sets(db_session, [student_id, other_id])
+    monkeypatch.undo()
+
+    for sid in (student_id, other_id):
+        assert course_history_repository._passed_cache.get(sid, course_history_repository._PASSED_SLOT) is None
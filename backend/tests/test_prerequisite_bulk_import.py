@@ -0,0 +1,80 @@
+# backend/tests/test_prerequisite_bulk_import.py
+
+from __future__ import annotations
+
+from backend.app.repositories import prerequisite_repository
+from backend.tests import factories
+
+
+def _statuses(body) -> list:
+    return [r["status"] for r in body["results"]]
+
+
+def test_json_import_reports_every_row(client, db_session, admin_headers):
+    a, b, c = (factories.make_course(db_session).id for _ in range(3))
+    factories.add_prerequisite(db_session, course_id=c, prereq_course_id=a)
+
+    rows = [
+        {"course_id": b, "prereq_course_id": a},
+        {"target_course_id": c, "prerequisite_course_id": b},
+        {"course_id": b, "prereq_course_id": a},  # repeated in the batch
+        {"course_id": c, "prereq_course_id": a},  # already stored
+        {"course_id": a, "prereq_course_id": c},  # a -> c -> a
+        {"course_id": b, "prereq_course_id": 999_999},
+        {"course_id": "x", "prereq_course_id": a},
+        {"course_id": a, "prereq_course_id": a},
+    ]
+    resp = client.post("/api/prerequisites/bulk", json=rows, headers=admin_headers)
+
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert _statuses(body) == [
+        "created",
+        "created",
+        "duplicate_in_batch",
+        "duplicate",
+        "cycle",
+        "course_not_found",
+        "invalid",
+        "invalid",
+    ]
+    assert (body["created"], body["rejected"]) == (2, 6)
+    assert prerequisite_repository.get_prereq_ids_for_course(db_session, c) == sorted([a, b])
+    assert prerequisite_repository.get_prereq_graph(db_session).all_prereqs(c) == {a, b}
+
+
+def test_csv_import(client, db_session, admin_headers):
+    a, b = (factories.make_course(db_session).id for _ in range(2))
+    csv_body = f"course_id,prereq_course_id\n{b},{a}\n{a},{b}\n"
+
+    resp = client.post(
+        "/api/prerequisites/bulk",
+        content=csv_body.encode("utf-8-sig"),
+        headers={**admin_headers, "Content-Type": "text/csv"},
+    )
+
+    assert resp.status_code == 200, resp.text
+    assert _statuses(resp.json()) == ["created", "cycle"]
+    assert prerequisite_repository.get_prereq_ids_for_course(db_session, b) == [a]
+
+
+def test_all_or_nothing_writes_nothing_on_any_failure(client, db_session, admin_headers):
+    a, b = (factories.make_course(db_session).id for _ in range(2))
+
+    resp = client.post(
+        "/api/prerequisites/bulk?all_or_nothing=true",
+        json={"items": [{"course_id": b, "prereq_course_id": a}, {"course_id": b, "prereq_course_id": 999_999}]},
+        headers=admin_headers,
+    )
+
+    assert resp.status_code == 409
+    assert [r["status"] for r in resp.json()["detail"]["results"]] == ["valid", "course_not_found"]
+    assert prerequisite_repository.get_prereq_ids_for_course(db_session, b) == []
+
+
+def test_malformed_body_and_auth(client, db_session, admin_headers):
+
+    assert client.post("/api/prerequisites/bulk", content=b"{not json", headers={
+        **admin_headers, "Content-Type": "application/json"}).status_code == 400
+    assert client.post("/api/prerequisites/bulk", json={"rows": []}, headers=admin_headers).status_code == 400
+    assert client.post("/api/prerequisites/bulk", json=[]).status_code == 401
@@ -0,0 +1,115 @@
+# backend/tests/test_prerequisite_expressions.py
+
+from __future__ import annotations
+
+import pytest
+
+from backend.app.services import unit_limit_service
+from backend.app.services.enrollment_service import PrereqNotMetError, enroll_student
+from backend.app.utils.passed_courses import PassedCourseSet
+from backend.app.utils.prerequisite_rules import PrerequisiteRule, groups_to_links
+from backend.tests import factories
+
+
+# -----------------------------
+# PrerequisiteRule (pure)
+# -----------------------------
+
+def test_rule_evaluates_and_of_or_groups():
+    # one of (1, 2) and 7
+    rule = PrerequisiteRule.from_links([(7, None), (1, 5), (2, 5)])
+
+    assert rule.groups == ((1, 2), (7,))
+    assert rule.expression() == "(1 OR 2) AND 7"
+    assert not rule.is_all_of
+
+    assert rule.is_satisfied(PassedCourseSet.from_ids([2, 7]))
+    assert not rule.is_satisfied(PassedCourseSet.from_ids([1, 2]))
+    assert not rule.is_satisfied(PassedCourseSet.from_ids([7]))
+
+    passed = PassedCourseSet.from_ids([3])
+    assert rule.missing_ids(passed) == [1, 2, 7]
+    assert rule.describe_unmet(passed) == "[one of (1, 2), 7]"
+
+
+def test_plain_rule_and_empty_rule():
+    rule = PrerequisiteRule.from_links([(4, None), (9, None)])
+
+    assert rule.is_all_of
+    assert rule.describe_unmet(PassedCourseSet.from_ids([4])) == "[9]"
+    assert PrerequisiteRule().is_satisfied(PassedCourseSet())
+
+
+def test_groups_round_trip_through_links():
+    links = groups_to_links([[3, 4], [7], [8, 9]])
+
+    assert links == [(3, 1), (4, 1), (7, None), (8, 2), (9, 2)]
+    assert PrerequisiteRule.from_links(links) == PrerequisiteRule([[3, 4], [7], [8, 9]])
+
+
+# -----------------------------
+# API / enrollment integration
+# -----------------------------
+
+def test_expression_endpoints_and_legacy_view(client, db_session, admin_headers):
+    cs101, cs102, math201, target = (factories.make_course(db_session).id for _ in range(4))
+
+    resp = client.put(
+        f"/api/courses/{target}/prerequisites/expression",
+        json={"all_of": [{"any_of": [cs101, cs102]}, math201]},
+        headers=admin_headers,
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["expression"] == f"({cs101} OR {cs102}) AND {math201}"
+
+    body = client.get(f"/api/courses/{target}/prerequisites/expression", headers=admin_headers).json()
+    assert body["all_of"] == [{"any_of": [cs101, cs102]}, math201]
+
+    # The flat legacy view only lists the plain "all of" link.
+    legacy = client.get("/api/prerequisites", headers=admin_headers).json()
+    assert [(r["target_course_id"], r["prerequisite_course_id"]) for r in legacy] == [(target, math201)]
+
+    # Rewriting replaces every link of the course.
+    resp = client.put(
+        f"/api/courses/{target}/prerequisites/expression", json={"all_of": [cs101]}, headers=admin_headers
+    )
+    assert resp.json()["expression"] == str(cs101)
+    links = client.get(f"/api/courses/{target}/prerequisites", headers=admin_headers).json()
+    assert links == [{"course_id": target, "prereq_course_id": cs101, "any_of_group": None}]
+
+
+def test_expression_validation(client, db_session, admin_headers):
+    a, b = (factories.make_course(db_session).id for _ in range(2))
+    factories.add_prerequisite(db_session, course_id=b, prereq_course_id=a)
+    url = f"/api/courses/{a}/prerequisites/expression"
+
+    assert client.put(url, json={"all_of": [{"any_of": [b, 999_999]}]}, headers=admin_headers).status_code == 404
+    assert client.put(url, json={"all_of": [{"any_of": [b]}]}, headers=admin_headers).status_code == 400  # cycle
+    assert client.put(url, json={"all_of": [a]}, headers=admin_headers).status_code == 400
+    c = factories.make_course(db_session).id
+    assert client.put(
+        f"/api/courses/{c}/prerequisites/expression", json={"all_of": [a, {"any_of": [a, b]}]}, headers=admin_headers
+    ).status_code == 400
+
+
+def test_enroll_accepts_any_alternative(client, db_session, admin_headers):
+    policy = unit_limit_service.get_unit_limits_service(db_session)
+    policy.min_units, policy.max_units = 0, 20
+    db_session.commit()
+    cs101, cs102, math201 = (factories.make_course(db_session, semester="1403-2").id for _ in range(3))
+    target = factories.make_course(db_session).id
+    client.put(
+        f"/api/courses/{target}/prerequisites/expression",
+        json={"all_of": [{"any_of": [cs101, cs102]}, math201]},
+        headers=admin_headers,
+    )
+    student_id = factories.make_student(db_session).id
+    factories.add_history(db_session, student_id=student_id, course_id=math201, term="1403-2")
+
+    with pytest.raises(PrereqNotMetError) as exc:
+        enroll_student(db_session, student_id=student_id, course_id=target, term=factories.CURRENT_TERM)
+    assert f"one of ({cs101}, {cs102})" in str(exc.value)
+
+    factories.add_history(db_session, student_id=student_id, course_id=cs102, term="1403-2")
+    enrollment = enroll_student(db_session, student_id=student_id, course_id=target, term=factories.CURRENT_TERM)
+    assert enrollment.course_id == target
@@ -0,0 +1,195 @@
+# backend/tests/test_prerequisite_graph.py
+
+from __future__ import annotations
+
+import pytest
+
+from backend.app.models.course_prerequisite import CoursePrerequisite
+from backend.app.repositories import prerequisite_repository
+from backend.app.services import unit_limit_service
+from backend.app.services.enrollment_service import enroll_student
+from backend.app.services.prerequisite_service import (
+    InvalidPrerequisiteRelationError,
+    add_prerequisite_service,
+)
+from backend.app.utils.prerequisite_graph import PrerequisiteGraph
+from backend.tests import factories
+
+
+# -----------------------------
+# PrerequisiteGraph (pure)
+# -----------------------------
+
+def _graph(*links) -> PrerequisiteGraph:
+    g = PrerequisiteGraph()
+    g.load(links)
+    return g
+
+
+def test_closure_is_transitive():
+    # 4 -> 3 -> 2 -> 1, and 4 -> 5
+    g = _graph((2, 1), (3, 2), (4, 3), (4, 5))
+
+    assert g.all_prereqs(4) == {1, 2, 3, 5}
+    assert g.all_prereqs(2) == {1}
+    assert g.all_prereqs(1) == frozenset()
+    assert g.direct_prereqs(4) == [3, 5]
+    assert g.dependents(2) == [3]
+
+
+def test_incremental_add_and_remove_update_dependents_closure():
+    g = _graph((2, 1), (3, 2))
+    v = g.version
+
+    g.add_link(1, 9)
+    assert g.all_prereqs(3) == {1, 2, 9}
+    assert g.version == v + 1
+
+    g.remove_link(2, 1)
+    assert g.all_prereqs(3) == {2}
+    assert g.all_prereqs(2) == frozenset()
+    assert g.all_prereqs(1) == {9}
+
+
+def test_remove_course_drops_its_links():
+    g = _graph((2, 1), (3, 2))
+    g.remove_course(2)
+
+    assert g.all_prereqs(3) == frozenset()
+    assert g.links() == []
+
+
+def test_cycle_detection():
+    g = _graph((2, 1), (3, 2))
+
+    assert g.would_create_cycle(1, 3)  # 3 already requires 1
+    assert g.would_create_cycle(1, 2)
+    assert g.would_create_cycle(5, 5)
+    assert not g.would_create_cycle(3, 1)  # redundant but acyclic
+    assert not g.would_create_cycle(4, 3)
+
+
+def test_load_tolerates_cycles_already_in_the_table():
+    g = _graph((1, 2), (2, 1), (3, 1))
+
+    assert g.all_prereqs(3) == {1, 2}
+    assert 1 in g.all_prereqs(1)
+
+
+def test_load_is_refused_after_a_concurrent_change():
+    g = PrerequisiteGraph()
+    generation = g.generation
+    g.invalidate()  # a commit lands while the rows are being read
+    assert g.load([(1, 2)], generation=generation) is False
+    assert g.needs_load()
+
+    generation = g.generation
+    assert g.load([(1, 2)], generation=generation) is True
+    g.add_link(2, 3)
+    assert g.load([(1, 2)], generation=generation) is False
+    assert g.direct_prereqs(2) == [3]
+
+
+# -----------------------------
+# Repository / service integration
+# -----------------------------
+
+def test_service_rejects_cycles(db_session):
+    a = factories.make_course(db_session)
+    b = factories.make_course(db_session)
+    c = factories.make_course(db_session)
+    add_prerequisite_service(db_session, course_id=b.id, prereq_course_id=a.id)
+    add_prerequisite_service(db_session, course_id=c.id, prereq_course_id=b.id)
+
+    with pytest.raises(InvalidPrerequisiteRelationError):
+        add_prerequisite_service(db_session, course_id=a.id, prereq_course_id=c.id)
+
+    assert prerequisite_repository.get_prereq_link(db_session, a.id, c.id) is None
+
+
+def test_admin_api_returns_400_for_cycle(client, db_session, admin_headers):
+    a = factories.make_course(db_session)
+    b = factories.make_course(db_session)
+    factories.add_prerequisite(db_session, course_id=b.id, prereq_course_id=a.id)
+
+    resp = client.post(
+        f"/api/courses/{a.id}/prerequisites",
+        json={"course_id": a.id, "prereq_course_id": b.id},
+        headers=admin_headers,
+    )
+    assert resp.status_code == 400
+    assert "cycle" in resp.json()["detail"]
+
+
+def test_graph_follows_orm_writes_and_rollbacks(db_session):
+    a_id = factories.make_course(db_session).id
+    b_id = factories.make_course(db_session).id
+    graph = prerequisite_repository.get_prereq_graph(db_session)
+    assert graph.direct_prereqs(b_id) == []
+
+    factories.add_prerequisite(db_session, course_id=b_id, prereq_course_id=a_id)
+    assert prerequisite_repository.get_prereq_ids_for_course(db_session, b_id) == [a_id]
+
+    # flushed but uncommitted links stay out of the shared graph
+    savepoint = db_session.begin_nested()
+    db_session.add(CoursePrerequisite(course_id=a_id, prereq_course_id=b_id))
+    db_session.flush()
+    assert graph.direct_prereqs(a_id) == []
+    savepoint.rollback()
+    assert prerequisite_repository.get_prereq_ids_for_course(db_session, a_id) == []
+
+    prerequisite_repository.remove_prereq(db_session, b_id, a_id)
+    assert prerequisite_repository.get_prereq_ids_for_course(db_session, b_id) == []
+
+
+def test_flushed_links_reach_the_graph_on_commit(db_session):
+    a_id = factories.make_course(db_session).id
+    b_id = factories.make_course(db_session).id
+    graph = prerequisite_repository.get_prereq_graph(db_session)
+
+    db_session.add(CoursePrerequisite(course_id=b_id, prereq_course_id=a_id))
+    db_session.flush()
+    assert graph.direct_prereqs(b_id) == []
+    db_session.commit()
+    assert graph.direct_prereqs(b_id) == [a_id]
+
+
+def test_reload_racing_a_commit_is_not_installed(db_session, monkeypatch):
+    a_id = factories.make_course(db_session).id
+    b_id = factories.make_course(db_session).id
+    factories.add_prerequisite(db_session, course_id=b_id, prereq_course_id=a_id)
+    shared = prerequisite_repository.prerequisite_graph
+    shared.invalidate()
+
+    real_query = db_session.query
+
+    def _query_then_commit_elsewhere(*entities):
+        query = real_query(*entities)
+        shared.invalidate()  # another session's bulk statement commits mid-reload
+        return query
+
+    monkeypatch.setattr(db_session, "query", _query_then_commit_elsewhere)
+    graph = prerequisite_repository.get_prereq_graph(db_session)
+    monkeypatch.undo()
+
+    assert graph is not shared and graph.direct_prereqs(b_id) == [a_id]
+    assert shared.needs_load()
+    assert prerequisite_repository.get_prereq_graph(db_session) is shared
+
+
+def test_enroll_reads_prerequisites_from_memory(db_session, capture_sql):
+    policy = unit_limit_service.get_unit_limits_service(db_session)
+    policy.min_units, policy.max_units = 0, 20
+    db_session.commit()
+    student = factories.make_student(db_session)
+    p = factories.make_course(db_session, semester="1403-2")
+    target = factories.make_course(db_session)
+    factories.add_prerequisite(db_session, course_id=target.id, prereq_course_id=p.id)
+    factories.add_history(db_session, student_id=student.id, course_id=p.id, term="1403-2")
+    ids = (student.id, target.id)
+    prerequisite_repository.get_prereq_graph(db_session)
+
+    with capture_sql() as statements:
+        enroll_student(db_session, student_id=ids[0], course_id=ids[1], term=factories.CURRENT_TERM)
+
+    assert not any("course_prerequisites" in s for s in statements)
@@ -0,0 +1,59 @@
+# backend/tests/test_prerequisite_unlocks.py
+
+from __future__ import annotations
+
+from backend.app.repositories import prerequisite_repository
+from backend.app.services.prerequisite_service import get_unlocks_service, set_prerequisite_expression_service
+from backend.tests import factories
+
+
+def _curriculum(db_session):
+    """algo requires ds AND math; ai requires one of (ds, stats)."""
+    ds, math, stats, algo, ai = (factories.make_course(db_session).id for _ in range(5))
+    set_prerequisite_expression_service(db_session, algo, [[ds], [math]])
+    set_prerequisite_expression_service(db_session, ai, [[ds, stats]])
+    return ds, math, stats, algo, ai
+
+
+def test_unlocks_per_course_and_per_student(db_session):
+    ds, math, stats, algo, ai = _curriculum(db_session)
+    fresh = factories.make_student(db_session).id
+    has_math = factories.make_student(db_session).id
+    has_stats = factories.make_student(db_session).id
+    factories.add_history(db_session, student_id=has_math, course_id=math, term="1403-2")
+    factories.add_history(db_session, student_id=has_stats, course_id=stats, term="1403-2")
+
+    report = get_unlocks_service(db_session, [ds, math], [fresh, has_math, has_stats])
+
+    assert report["courses"] == [
+        {"course_id": ds, "unlocks": sorted([algo, ai])},
+        {"course_id": math, "unlocks": [algo]},
+    ]
+    by_student = {s["student_id"]: {c["course_id"]: c for c in s["courses"]} for s in report["students"]}
+    assert by_student[fresh][ds]["unlocks"] == [ai]  # algo still needs math
+    assert by_student[has_math][ds]["unlocks"] == sorted([algo, ai])
+    assert by_student[has_math][math] == {"course_id": math, "already_passed": True, "unlocks": []}
+    assert by_student[has_stats][ds]["unlocks"] == []  # ai already met through stats
+
+
+def test_batch_runs_a_fixed_number_of_queries(db_session, capture_sql):
+    ds, *_ = _curriculum(db_session)
+    students = [factories.make_student(db_session).id for _ in range(5)]
+    prerequisite_repository.get_prereq_graph(db_session)
+
+    with capture_sql() as statements:
+        get_unlocks_service(db_session, [ds], students)
+
+    assert len(statements) == 2  # course existence + passed sets of all students
+
+
+def test_unlocks_endpoint(client, db_session, admin_headers):
+    ds, math, stats, algo, ai = _curriculum(db_session)
+
+    resp = client.post("/api/prerequisites/unlocks", json={"course_ids": [stats]}, headers=admin_headers)
+    assert resp.status_code == 200, resp.text
+    assert resp.json() == {"courses": [{"course_id": stats, "unlocks": [ai]}], "students": []}
+
+    resp = client.post("/api/prerequisites/unlocks", json={"course_ids": [999_999]}, headers=admin_headers)
+    assert resp.status_code == 404
+    assert client.post("/api/prerequisites/unlocks", json={"course_ids": [stats]}).status_code == 401
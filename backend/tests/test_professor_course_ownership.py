@@ -0,0 +1,104 @@
+# backend/tests/test_professor_course_ownership.py
+
+from __future__ import annotations
+
+from sqlalchemy import update
+
+from backend.app.models.course import Course
+from backend.app.repositories import course_repository
+from backend.app.schemas.course import CourseUpdate
+from backend.app.services.course_service import bulk_upsert_courses_service, update_course_service
+from backend.app.services.professor_service import list_professor_courses
+from backend.tests import factories
+
+
+def test_course_is_linked_to_the_professor_with_that_name(db_session):
+    prof = factories.make_professor(db_session, full_name="Dr. Sara   Karimi")
+    course = factories.make_course(db_session, professor_name="  dr. sara KARIMI ")
+    other = factories.make_course(db_session, professor_name="Dr. Nobody")
+
+    assert course.professor_id == prof.id
+    assert other.professor_id is None
+
+
+def test_new_professor_claims_courses_listed_under_their_name(db_session):
+    course = factories.make_course(db_session, professor_name="Dr. Reza Amini")
+    assert course.professor_id is None
+
+    prof = factories.make_professor(db_session, full_name="dr. reza amini")
+    db_session.refresh(course)
+    assert course.professor_id == prof.id
+
+    # a later account with the same name does not take the course over
+    factories.make_professor(db_session, full_name="Dr. Reza Amini")
+    db_session.refresh(course)
+    assert course.professor_id == prof.id
+
+
+def test_renaming_the_professor_of_a_course_moves_ownership(db_session):
+    first = factories.make_professor(db_session, full_name="Dr. A")
+    second = factories.make_professor(db_session, full_name="Dr. B")
+    course = factories.make_course(db_session, professor_name="Dr. A")
+    assert course.professor_id == first.id
+
+    update_course_service(db_session, course.id, CourseUpdate(professor_name="Dr. B"))
+    assert course.professor_id == second.id
+    update_course_service(db_session, course.id, CourseUpdate(name="Renamed course"))
+    assert course.professor_id == second.id
+
+
+def test_bulk_upsert_and_backfill_set_professor_id(db_session):
+    prof = factories.make_professor(db_session, full_name="Dr. Bulk")
+    row = {
+        "code": "BK100",
+        "name": "Bulk Course",
+        "capacity": 30,
+        "professor_name": "DR.  BULK",
+        "day_of_week": "MON",
+        "start_time": "09:00",
+        "end_time": "10:00",
+        "location": "A-1",
+        "units": 3,
+        "department": "CS",
+        "semester": factories.CURRENT_TERM,
+    }
+    [result] = bulk_upsert_courses_service(db_session, [row])
+    course = course_repository.get_course_by_id(db_session, result["course_id"])
+    assert course.professor_id == prof.id
+
+    # databases created before the column: owners are backfilled by name
+    db_session.execute(update(Course).where(Course.id == course.id).values(professor_id=None))
+    db_session.commit()
+    assert course_repository.backfill_course_professors(db_session) >= 1
+    db_session.refresh(course)
+    assert course.professor_id == prof.id
+
+
+def test_owner_resolution_uses_the_name_key_indexes(db_session, capture_sql):
+    factories.make_professor(db_session, full_name="Dr. Other")
+    with capture_sql() as statements:
+        prof = factories.make_professor(db_session, full_name="Dr. Index")
+    [claim] = [s for s in statements if s.startswith("UPDATE courses")]
+    assert "courses.professor_key = " in claim and "courses.professor_id IS NULL" in claim
+
+    with capture_sql() as statements:
+        course = factories.make_course(db_session, professor_name="dr.  INDEX")
+    assert course.professor_key == "dr. index" and course.professor_id == prof.id
+    lookups = [s for s in statements if "FROM professors" in s]
+    assert lookups and all("professors.name_key = " in s for s in lookups)
+
+
+def test_professor_course_list_is_an_indexed_lookup(db_session, capture_sql):
+    prof = factories.make_professor(db_session, full_name="Dr. Lookup")
+    owned = [
+        factories.make_course(db_session, code=code, professor_name="Dr. Lookup") for code in ("CS200", "CS100")
+    ]
+    factories.make_course(db_session, code="CS050", professor_name="Dr. Lookup", semester="1403-2")
+    factories.make_course(db_session, code="CS010", professor_name="Dr. Someone Else")
+
+    with capture_sql() as statements:
+        courses = list_professor_courses(db_session, professor=prof, term=factories.CURRENT_TERM)
+
+    assert [c.id for c in courses] == [owned[1].id, owned[0].id]
+    [statement] = [s for s in statements if "FROM courses" in s]
+    assert "courses.professor_id = " in statement and "courses.semester = " in statement
@@ -0,0 +1,105 @@
+# backend/tests/test_student_enrollment_batch_api.py
+
+from __future__ import annotations
+
+from backend.app.models.enrollment import Enrollment
+from backend.tests import factories
+
+TERM = factories.CURRENT_TERM
+
+
+def _enrolled_ids(db_session, student_id: int) -> set[int]:
+    rows = db_session.query(Enrollment.course_id).filter(Enrollment.student_id == student_id).all()
+    return {cid for (cid,) in rows}
+
+
+def test_batch_enroll_commits_all_courses(client, db_session, monkeypatch, student_headers):
+    monkeypatch.setenv("CURRENT_TERM", TERM)
+    factories.update_unit_policy(db_session, max_units=20)
+    student = factories.make_student(db_session)
+    a = factories.make_course(db_session, day_of_week="SAT")
+    b = factories.make_course(db_session, day_of_week="SUN")
+
+    resp = client.post(
+        "/api/student/enrollments/batch",
+        json={"course_ids": [a.id, b.id]},
+        headers=student_headers(student),
+    )
+
+    assert resp.status_code == 201, resp.text
+    body = resp.json()
+    assert body["term"] == TERM
+    assert [r["course_id"] for r in body["results"]] == [a.id, b.id]
+    assert all(r["ok"] for r in body["results"])
+    assert _enrolled_ids(db_session, student.id) == {a.id, b.id}
+
+
+def test_batch_enroll_is_all_or_nothing_with_diagnostics(client, db_session, monkeypatch, student_headers):
+    monkeypatch.setenv("CURRENT_TERM", TERM)
+    factories.update_unit_policy(db_session, max_units=20)
+    student = factories.make_student(db_session)
+    ok_course = factories.make_course(db_session, day_of_week="SAT")
+    prereq = factories.make_course(db_session, day_of_week="FRI")
+    locked = factories.make_course(db_session, day_of_week="SUN")
+    factories.add_prerequisite(db_session, course_id=locked.id, prereq_course_id=prereq.id)
+
+    resp = client.post(
+        "/api/student/enrollments/batch",
+        json={"courseIds": [ok_course.id, locked.id, 999999]},
+        headers=student_headers(student),
+    )
+
+    assert resp.status_code == 409, resp.text
+    results = {r["course_id"]: r for r in resp.json()["detail"]["results"]}
+    assert results[ok_course.id]["ok"] is True
+    assert results[locked.id]["error"] == "prereq_not_met"
+    assert results[999999]["error"] == "course_not_found"
+    assert _enrolled_ids(db_session, student.id) == set()
+
+
+def test_batch_enroll_detects_pairwise_and_existing_conflicts(client, db_session, monkeypatch, student_headers):
+    monkeypatch.setenv("CURRENT_TERM", TERM)
+    factories.update_unit_policy(db_session, max_units=20)
+    student = factories.make_student(db_session)
+    existing = factories.make_course(db_session, day_of_week="MON", start_time="08:00", end_time="09:00")
+    factories.add_enrollment(db_session, student_id=student.id, course_id=existing.id)
+
+    clash_existing = factories.make_course(db_session, day_of_week="MON", start_time="08:30", end_time="09:30")
+    x = factories.make_course(db_session, day_of_week="TUE", start_time="10:00", end_time="11:00")
+    y = factories.make_course(db_session, day_of_week="TUE", start_time="10:30", end_time="11:30")
+
+    resp = client.post(
+        "/api/student/enrollments/batch",
+        json={"course_ids": [clash_existing.id, x.id, y.id]},
+        headers=student_headers(student),
+    )
+
+    assert resp.status_code == 409, resp.text
+    results = {r["course_id"]: r for r in resp.json()["detail"]["results"]}
+    assert results[clash_existing.id]["error"] == "time_conflict"
+    assert results[x.id]["error"] == "time_conflict"
+    assert results[y.id]["error"] == "time_conflict"
+
+
+def test_batch_enroll_checks_unit_cap_on_combined_total(client, db_session, monkeypatch, student_headers):
+    monkeypatch.setenv("CURRENT_TERM", TERM)
+    factories.update_unit_policy(db_session, max_units=5)
+    student = factories.make_student(db_session)
+    a = factories.make_course(db_session, units=3, day_of_week="SAT")
+    b = factories.make_course(db_session, units=3, day_of_week="SUN")
+
+    resp = client.post(
+        "/api/student/enrollments/batch",
+        json={"course_ids": [a.id, b.id]},
+        headers=student_headers(student),
+    )
+
+    assert resp.status_code == 409, resp.text
+    assert {r["error"] for r in resp.json()["detail"]["results"]} == {"unit_limit"}
+    assert _enrolled_ids(db_session, student.id) == set()
+
+
+def test_batch_enroll_rejects_empty_list(client, db_session, student_headers):
+    student = factories.make_student(db_session)
+    resp = client.post("/api/student/enrollments/batch", json={"course_ids": []}, headers=student_headers(student))
+    assert resp.status_code == 422
@@ -0,0 +1,66 @@
+# backend/tests/test_time_bitmap.py
+
+from __future__ import annotations
+
+from datetime import time
+from types import SimpleNamespace
+
+from backend.app.utils.time_bitmap import SLOTS_PER_DAY, WeeklyOccupancy, interval_mask
+from backend.tests import factories
+
+
+def _course(cid: int, day: str, start: time, end: time):
+    return SimpleNamespace(id=cid, day_of_week=day, start_time=start, end_time=end)
+
+
+def test_interval_mask_slots_and_days():
+    mon = interval_mask("MON", time(9, 0), time(10, 0))
+    assert bin(mon).count("1") == 12  # 60 min / 5 min
+    assert interval_mask("TUE", time(9, 0), time(10, 0)) == mon << SLOTS_PER_DAY
+    assert interval_mask("XYZ", time(9, 0), time(10, 0)) == 0
+
+
+def test_back_to_back_is_not_a_conflict():
+    occ = WeeklyOccupancy.from_courses([_course(1, "MON", time(9, 0), time(10, 0))])
+    assert occ.conflicting_course_id("MON", time(10, 0), time(11, 0)) is None
+    assert occ.conflicting_course_id("MON", time(8, 0), time(9, 0)) is None
+    assert occ.conflicting_course_id("MON", time(9, 30), time(10, 30)) == 1
+    assert occ.conflicting_course_id("TUE", time(9, 30), time(10, 30)) is None
+
+
+def test_unaligned_times_keep_exact_semantics():
+    occ = WeeklyOccupancy.from_courses([_course(7, "SAT", time(9, 2), time(10, 2))])
+    # Same 5-minute slot as the existing end, but starts after it ends
+    assert occ.conflicting_course_id("SAT", time(10, 3), time(11, 0)) is None
+    assert occ.conflicting_course_id("SAT", time(10, 1), time(11, 0)) == 7
+
+
+def test_unknown_day_falls_back_to_exact_compare():
+    occ = WeeklyOccupancy.from_courses([_course(3, "Mon-Extra", time(9, 0), time(10, 0))])
+    assert occ.conflicting_course_id("MON-EXTRA", time(9, 30), time(9, 45)) == 3
+
+
+def test_flag_conflicts_over_a_catalog_page():
+    occ = WeeklyOccupancy.from_courses([_course(1, "WED", time(8, 0), time(10, 0))])
+    page = [
+        _course(10, "WED", time(9, 0), time(11, 0)),
+        _course(11, "WED", time(10, 0), time(11, 0)),
+        _course(12, "THU", time(8, 0), time(10, 0)),
+    ]
+    assert occ.flag_conflicts(page) == {10: True, 11: False, 12: False}
+
+
+def test_student_catalog_flags_courses_clashing_with_schedule(client, db_session, monkeypatch, student_headers):
+    monkeypatch.setenv("CURRENT_TERM", factories.CURRENT_TERM)
+    student = factories.make_student(db_session)
+    taken = factories.make_course(db_session, day_of_week="THU", start_time="13:00", end_time="15:00")
+    factories.add_enrollment(db_session, student_id=student.id, course_id=taken.id)
+    clash = factories.make_course(db_session, day_of_week="THU", start_time="14:00", end_time="16:00")
+    fine = factories.make_course(db_session, day_of_week="THU", start_time="15:00", end_time="16:00")
+
+    resp = client.get("/api/student/courses?limit=200", headers=student_headers(student))
+
+    assert resp.status_code == 200, resp.text
+    flags = {item["id"]: item["has_time_conflict"] for item in resp.json()}
+    assert flags[clash.id] is True
+    assert flags[fine.id] is False
@@ -0,0 +1,161 @@
+# backend/tests/test_waitlist.py
+
+from __future__ import annotations
+
+import pytest
+
+from backend.app.models.enrollment import Enrollment
+from backend.app.repositories import enrollment_repository, prerequisite_repository
+from backend.app.services import waitlist_service
+from backend.app.services.drop_service import drop_student_course
+from backend.app.services.eligibility_service import get_eligibility_matrix
+from backend.tests import factories
+
+TERM = factories.CURRENT_TERM
+
+
+def _full_course(db_session, **kwargs):
+    holder = factories.make_student(db_session)
+    course = factories.make_course(db_session, capacity=1, **kwargs)
+    factories.add_enrollment(db_session, student_id=holder.id, course_id=course.id)
+    return holder, course
+
+
+def _is_enrolled(db_session, student_id: int, course_id: int) -> bool:
+    return enrollment_repository.get_by_student_course_term(db_session, student_id, course_id, TERM) is not None
+
+
+def test_join_reports_fifo_positions(db_session):
+    _, course = _full_course(db_session)
+    s1 = factories.make_student(db_session)
+    s2 = factories.make_student(db_session)
+
+    _, pos1 = waitlist_service.join_waitlist(db_session, student_id=s1.id, course_id=course.id, term=TERM)
+    _, pos2 = waitlist_service.join_waitlist(db_session, student_id=s2.id, course_id=course.id, term=TERM)
+
+    assert (pos1, pos2) == (1, 2)
+    with pytest.raises(waitlist_service.AlreadyWaitlistedError):
+        waitlist_service.join_waitlist(db_session, student_id=s1.id, course_id=course.id, term=TERM)
+
+
+def test_join_rejected_when_seats_are_free(db_session):
+    student = factories.make_student(db_session)
+    course = factories.make_course(db_session, capacity=5)
+
+    with pytest.raises(waitlist_service.SeatsAvailableError):
+        waitlist_service.join_waitlist(db_session, student_id=student.id, course_id=course.id, term=TERM)
+
+
+def test_drop_promotes_first_waitlisted_student(db_session):
+    factories.update_unit_policy(db_session)
+    holder, course = _full_course(db_session)
+    s1 = factories.make_student(db_session)
+    s2 = factories.make_student(db_session)
+    waitlist_service.join_waitlist(db_session, student_id=s1.id, course_id=course.id, term=TERM)
+    waitlist_service.join_waitlist(db_session, student_id=s2.id, course_id=course.id, term=TERM)
+
+    drop_student_course(db_session, student_id=holder.id, course_id=course.id, term=TERM)
+
+    assert _is_enrolled(db_session, s1.id, course.id)
+    assert not _is_enrolled(db_session, s2.id, course.id)
+    assert waitlist_service.get_waitlist_position(db_session, student_id=s2.id, course_id=course.id, term=TERM) == 1
+    db_session.refresh(course)
+    assert course.seats_taken == 1
+
+
+def test_promotion_invalidates_the_promoted_students_cached_matrix(db_session):
+    factories.update_unit_policy(db_session)
+    holder, course = _full_course(db_session)
+    student = factories.make_student(db_session)
+    waitlist_service.join_waitlist(db_session, student_id=student.id, course_id=course.id, term=TERM)
+
+    def _row():
+        matrix = get_eligibility_matrix(db_session, student_id=student.id, term=TERM)
+        return next(r for r in matrix.courses if r.course_id == course.id)
+
+    assert _row().already_enrolled is False  # cached now
+
+    drop_student_course(db_session, student_id=holder.id, course_id=course.id, term=TERM)
+
+    assert _row().already_enrolled is True
+
+
+def test_promotion_skips_ineligible_students(db_session):
+    factories.update_unit_policy(db_session)
+    holder, course = _full_course(db_session, day_of_week="WED", start_time="10:00", end_time="11:00")
+
+    busy = factories.make_student(db_session)
+    clash = factories.make_course(db_session, day_of_week="WED", start_time="10:30", end_time="11:30")
+    factories.add_enrollment(db_session, student_id=busy.id, course_id=clash.id)
+    free = factories.make_student(db_session)
+
+    waitlist_service.join_waitlist(db_session, student_id=busy.id, course_id=course.id, term=TERM)
+    waitlist_service.join_waitlist(db_session, student_id=free.id, course_id=course.id, term=TERM)
+
+    drop_student_course(db_session, student_id=holder.id, course_id=course.id, term=TERM)
+
+    assert not _is_enrolled(db_session, busy.id, course.id)
+    assert _is_enrolled(db_session, free.id, course.id)
+    # The skipped student keeps their place
+    assert waitlist_service.get_waitlist_position(db_session, student_id=busy.id, course_id=course.id, term=TERM) == 1
+
+
+def test_promotion_query_count_does_not_grow_with_skipped_entries(db_session, capture_sql):
+    factories.update_unit_policy(db_session)
+
+    def _drop_with_queue(skipped: int) -> int:
+        holder, course = _full_course(db_session)
+        prereq = factories.make_course(db_session)
+        factories.add_prerequisite(db_session, course_id=course.id, prereq_course_id=prereq.id)
+        for _ in range(skipped):
+            student = factories.make_student(db_session)
+            waitlist_service.join_waitlist(db_session, student_id=student.id, course_id=course.id, term=TERM)
+        ready = factories.make_student(db_session)
+        factories.add_history(db_session, student_id=ready.id, course_id=prereq.id)
+        waitlist_service.join_waitlist(db_session, student_id=ready.id, course_id=course.id, term=TERM)
+        prerequisite_repository.get_prereq_graph(db_session)  # keep a one-off graph load out of the count
+
+        with capture_sql(selects_only=True) as statements:
+            drop_student_course(db_session, student_id=holder.id, course_id=course.id, term=TERM)
+
+        assert _is_enrolled(db_session, ready.id, course.id)
+        return len(statements)
+
+    assert _drop_with_queue(skipped=6) == _drop_with_queue(skipped=1)
+
+
+def test_waitlist_api_join_position_leave(client, db_session, monkeypatch, student_headers):
+    monkeypatch.setenv("CURRENT_TERM", TERM)
+    _, course = _full_course(db_session)
+    student = factories.make_student(db_session)
+
+    resp = client.post("/api/student/waitlist", json={"course_id": course.id}, headers=student_headers(student))
+    assert resp.status_code == 201, resp.text
+    assert resp.json()["position"] == 1
+
+    resp = client.get(f"/api/student/waitlist/{course.id}", headers=student_headers(student))
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["position"] == 1
+
+    resp = client.get("/api/student/waitlist", headers=student_headers(student))
+    assert [item["course_id"] for item in resp.json()] == [course.id]
+
+    resp = client.delete(f"/api/student/waitlist/{course.id}", headers=student_headers(student))
+    assert resp.status_code == 204
+
+    resp = client.get(f"/api/student/waitlist/{course.id}", headers=student_headers(student))
+    assert resp.status_code == 404
+
+
+def test_api_drop_promotes_in_same_request(client, db_session, monkeypatch, student_headers):
+    monkeypatch.setenv("CURRENT_TERM", TERM)
+    factories.update_unit_policy(db_session)
+    holder, course = _full_course(db_session)
+    waiting = factories.make_student(db_session)
+    waitlist_service.join_waitlist(db_session, student_id=waiting.id, course_id=course.id, term=TERM)
+
+    resp = client.delete(f"/api/student/enrollments/{course.id}", headers=student_headers(holder))
+    assert resp.status_code == 204, resp.text
+
+    rows = db_session.query(Enrollment.student_id).filter(Enrollment.course_id == course.id).all()
+    assert [sid for (sid,) in rows] == [waiting.id]
@@ -16,6 +16,9 @@ export class StudentCourseController {
       unitConfig: { min_units: 12, max_units: 20 },
       searchQuery: "",
       filterType: "course_mix",
+      // Server-side catalog filters; backend uses 1404-1 as the current term
+      filters: { semester: "1404-1", department: "", day: "", units: "" },
+      facets: null,
     };
 
     this.myEnrollmentsBtn = document.getElementById("my-enrollments-btn");
@@ -57,6 +60,13 @@ export class StudentCourseController {
       });
     }
 
+    if (this.view.bindFacetFilter) {
+      this.view.bindFacetFilter((param, value) => {
+        this.state.filters[param] = value;
+        this.reloadCourses();
+      });
+    }
+
     if (this.myEnrollmentsBtn) {
       this.myEnrollmentsBtn.addEventListener("click", () =>
         this.showMyEnrollments()
@@ -78,16 +88,20 @@ export class StudentCourseController {
     try {
       // Load data with individual error handling to prevent one failure from breaking everything
       let courses = [];
+      let coursesFailed = false;
       let prerequisites = [];
       let enrollments = [];
       let config = null;
 
       try {
         // Use student-specific endpoint
-        courses = await this.api.getStudentCourses();
+        const page = await this.api.getStudentCourses({ ...this.state.filters, facets: true });
+        courses = page.items;
+        this.state.facets = page.facets;
         console.log("Courses loaded:", courses);
       } catch (error) {
         console.error("Error loading courses:", error);
+        coursesFailed = true;
         // Continue with empty array
       }
 
@@ -120,12 +134,7 @@ export class StudentCourseController {
       const prerequisitesArray = Array.isArray(prerequisites) ? prerequisites : [];
       const enrollmentsArray = Array.isArray(enrollments) ? enrollments : [];
 
-      // Use current term - backend uses 1404-1 by default
-      // This should match backend's CURRENT_TERM setting
-      const currentSemester = "1404-1";
-      this.state.allCourses = coursesArray.filter(
-        (c) => c && c.semester === currentSemester
-      );
+      this.state.allCourses = this._currentTermCourses(coursesArray);
 
       this.state.prerequisites = prerequisitesArray;
       this.state.myEnrollments = enrollmentsArray;
@@ -135,7 +144,7 @@ export class StudentCourseController {
       }
 
       // Only show error if courses failed to load
-      if (coursesArray.length === 0 && !this.api.USE_MOCK) {
+      if (coursesFailed && !this.api.USE_MOCK) {
         this.view.showError("خطا در دریافت لیست دروس. لطفاً اتصال خود را بررسی کنید.");
       } else {
         this._filterAndRender();
@@ -153,6 +162,26 @@ export class StudentCourseController {
     }
   }
 
+  async reloadCourses() {
+    try {
+      const page = await this.api.getStudentCourses({ ...this.state.filters, facets: true });
+      this.state.allCourses = this._currentTermCourses(page.items);
+      this.state.facets = page.facets;
+      this._filterAndRender();
+    } catch (error) {
+      console.error("Error loading courses:", error);
+      this.view.showError(error?.message || "خطا در دریافت لیست دروس.");
+    }
+  }
+
+  _currentTermCourses(courses) {
+    // Mock data is not filtered by the server, so keep only the selected term
+    const { semester } = this.state.filters;
+    return (Array.isArray(courses) ? courses : []).filter(
+      (c) => c && c.semester === semester
+    );
+  }
+
   _filterAndRender() {
     const { allCourses, searchQuery, filterType, myEnrollments, prerequisites } = this.state;
     let filteredCourses = allCourses;
@@ -174,6 +203,10 @@ export class StudentCourseController {
     const enrolledIds = new Set((myEnrollments || []).map((e) => e.course?.id).filter(Boolean));
     const prereqList = Array.isArray(prerequisites) ? prerequisites : [];
 
+    if (this.view.renderFacets) {
+      this.view.renderFacets(this.state.facets, this.state.filters);
+    }
+
     // Pass parameters in correct order: courses, prerequisites, onEnrollClick, enrolledIdsSet
     this.view.renderCourses(
       filteredCourses,
@@ -15,6 +15,10 @@ export class ApiService {
     // Mock Mode
     this.USE_MOCK = false;
 
+    // Idempotency-Key per pending enroll/drop action. Kept after a timeout or
+    // network error so the user's retry replays the original outcome server-side.
+    this._idempotencyKeys = new Map();
+
     // Mock Database
     this._mockDB = {
       courses: [
@@ -274,11 +278,46 @@ export class ApiService {
 
   // --- Enrollment Methods ---
 
+  /**
+   * Sends a write with an Idempotency-Key that survives timeouts/network errors,
+   * so a retry of the same action cannot run the enrollment pipeline twice.
+   * The key is dropped once the server has answered (success or HTTP error).
+   */
+  async _idempotentRequest(action, endpoint, options = {}) {
+    let key = this._idempotencyKeys.get(action);
+    if (!key) {
+      key = crypto.randomUUID
+        ? crypto.randomUUID()
+        : `${Date.now()}-${Math.random().toString(16).slice(2)}`;
+      this._idempotencyKeys.set(action, key);
+    }
+
+    try {
+      const result = await this._request(endpoint, {
+        ...options,
+        headers: { ...(options.headers || {}), "Idempotency-Key": key },
+      });
+      this._idempotencyKeys.delete(action);
+      return result;
+    } catch (error) {
+      // fetch() rejects with TypeError when no response arrived at all
+      const message = error.message || "";
+      const noAnswer =
+        error.name === "TypeError" ||
+        message.startsWith("Request timeout") ||
+        message.startsWith("Network error");
+      if (!noAnswer) {
+        this._idempotencyKeys.delete(action);
+      }
+      throw error;
+    }
+  }
+
   /**
    */
   async enrollCourse(courseId) {
     try {
-      return await this._request("/api/student/enrollments", {
+      return await this._idempotentRequest(`enroll:${courseId}`, "/api/student/enrollments", {
         method: "POST",
         body: JSON.stringify({ course_id: courseId }),
       });
@@ -328,7 +367,7 @@ export class ApiService {
    */
   async dropCourse(courseId) {
     try {
-      return await this._request(`/api/student/enrollments/${courseId}`, {
+      return await this._idempotentRequest(`drop:${courseId}`, `/api/student/enrollments/${courseId}`, {
         method: "DELETE",
       });
     } catch (error) {
@@ -467,48 +506,50 @@ export class ApiService {
 
   /**
    * Gets student courses - used by STUDENT panel
-   * @returns {Promise<Array<Object>>} - An array of course objects available for enrollment.
+   * @param {Object} [filters] - Optional server-side filters: q, semester, department, day,
+   *   units (arrays repeat the parameter), time_from, time_to, facets.
+   *   With facets: true the server also returns per-value counts.
+   * @returns {Promise<{items: Array<Object>, facets: Object|null}>} - The courses available for
+   *   enrollment and, when requested, their facet counts (department, day_of_week, units).
    */
-  async getStudentCourses() {
+  async getStudentCourses(filters = {}) {
     // --- MOCK MODE ---
     if (this.USE_MOCK) {
       console.warn("⚠️ API: Fetching student courses (MOCK mode)");
       await new Promise((r) => setTimeout(r, 300));
-      return structuredClone(this._mockDB.courses);
+      return { items: structuredClone(this._mockDB.courses), facets: null };
     }
 
     // --- REAL MODE ---
     // Student endpoint - returns courses available for enrollment
     try {
-      console.log("Fetching courses from /api/student/courses");
-      const response = await this._request("/api/student/courses", { method: "GET" });
+      const params = new URLSearchParams();
+      Object.entries(filters).forEach(([key, value]) => {
+        if (value === undefined || value === null || value === "") return;
+        (Array.isArray(value) ? value : [value]).forEach((v) => params.append(key, v));
+      });
+      const query = params.toString();
+      const endpoint = query ? `/api/student/courses?${query}` : "/api/student/courses";
+      console.log(`Fetching courses from ${endpoint}`);
+      const response = await this._request(endpoint, { method: "GET" });
       console.log("Student courses response:", response);
 
       if (response && typeof response === "object") {
         if (Array.isArray(response)) {
           console.log(`Received ${response.length} student courses`);
-          return response;
-        }
-        if (response.courses && Array.isArray(response.courses)) {
-          console.log(`Received ${response.courses.length} courses from courses field`);
-          return response.courses;
+          return { items: response, facets: null };
         }
-        if (response.data && Array.isArray(response.data)) {
-          console.log(`Received ${response.data.length} courses from data field`);
-          return response.data;
-        }
-        if (response.items && Array.isArray(response.items)) {
-          console.log(`Received ${response.items.length} courses from items field`);
-          return response.items;
-        }
-        if (response.results && Array.isArray(response.results)) {
-          console.log(`Received ${response.results.length} courses from results field`);
-          return response.results;
+        const facets = response.facets || null;
+        for (const field of ["items", "courses", "data", "results"]) {
+          if (Array.isArray(response[field])) {
+            console.log(`Received ${response[field].length} courses from ${field} field`);
+            return { items: response[field], facets };
+          }
         }
       }
 
       console.warn("فرمت پاسخ API ناشناخته است:", response);
-      return [];
+      return { items: [], facets: null };
     } catch (error) {
       console.error("Error fetching student courses:", error);
       // Re-throw with more context
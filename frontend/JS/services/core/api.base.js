@@ -1,11 +1,27 @@
 /**
  * js/services/core/api.base.js
  */
+
+// Most recently used GET responses kept for ETag revalidation; filtered catalog
+// URLs are endless, so older entries are dropped beyond this.
+const ETAG_CACHE_MAX_ENTRIES = 32;
+
 export class BaseApiService {
   constructor(baseUrl = "http://localhost:8000") {
     this.baseUrl = baseUrl;
     this.timeout = 10000; // 10 seconds timeout
     this.USE_MOCK = false;
+    // GET url -> { token, etag, data }: revalidated with If-None-Match, reused on 304.
+    // Map keeps insertion order, so the first key is the least recently used one.
+    this._etagCache = new Map();
+  }
+
+  _rememberEtag(url, entry) {
+    this._etagCache.delete(url);
+    this._etagCache.set(url, entry);
+    while (this._etagCache.size > ETAG_CACHE_MAX_ENTRIES) {
+      this._etagCache.delete(this._etagCache.keys().next().value);
+    }
   }
 
   _getAuthToken() {
@@ -27,11 +43,17 @@ export class BaseApiService {
 
     try {
       const url = `${this.baseUrl}${endpoint}`;
+      const isGet = (options.method || "GET").toUpperCase() === "GET";
+      const token = this._getAuthToken();
+      const cached = isGet ? this._etagCache.get(url) : undefined;
+      const conditional =
+        cached && cached.token === token ? { "If-None-Match": cached.etag } : {};
 
       const response = await fetch(url, {
         ...options,
         headers: {
           ...this._getHeaders(),
+          ...conditional,
           ...options.headers,
         },
         signal: controller.signal,
@@ -39,6 +61,11 @@ export class BaseApiService {
 
       clearTimeout(timeoutId);
 
+      if (response.status === 304 && cached) {
+        this._rememberEtag(url, cached);
+        return cached.data;
+      }
+
       if (!response.ok) {
         let errorMessage = `HTTP ${response.status}: ${response.statusText}`;
 
@@ -74,12 +101,19 @@ export class BaseApiService {
       }
 
       const contentType = response.headers.get("content-type");
+      let data;
       if (contentType && contentType.includes("application/json")) {
-        return await response.json();
+        data = await response.json();
       } else {
         const text = await response.text();
-        return text ? JSON.parse(text) : { success: true };
+        data = text ? JSON.parse(text) : { success: true };
+      }
+
+      const etag = isGet ? response.headers.get("ETag") : null;
+      if (etag) {
+        this._rememberEtag(url, { token, etag, data });
       }
+      return data;
     } catch (error) {
       clearTimeout(timeoutId);
       if (error.name === "AbortError") {
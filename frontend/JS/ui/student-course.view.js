@@ -12,6 +12,7 @@ export class StudentCourseView {
       logoutBtn: document.getElementById("logout-btn"),
       searchInput: document.getElementById("course-search"),
       filterTypeSelect: document.getElementById("search-filter-type"),
+      facetSelects: document.querySelectorAll("select[data-facet]"),
       searchToolbar: document.querySelector(".student-search-toolbar"),
 
       enrollmentsSection: document.getElementById("enrollments-section"),
@@ -278,6 +279,33 @@ export class StudentCourseView {
     }
   }
 
+  /**
+   * Fills the facet dropdowns with the server's per-value counts.
+   * @param {Object|null} facets - { department, day_of_week, units }, each a list of { value, count }
+   * @param {Object} activeFilters - current filter values keyed by query parameter
+   */
+  renderFacets(facets, activeFilters = {}) {
+    if (!facets) return;
+    this.elements.facetSelects.forEach((select) => {
+      const counts = facets[select.dataset.facet] || [];
+      const allOption = select.options[0];
+      const selected = String(activeFilters[select.dataset.param] ?? "");
+
+      select.innerHTML = "";
+      select.appendChild(allOption);
+      counts.forEach(({ value, count }) => {
+        const label =
+          select.dataset.facet === "day_of_week"
+            ? this._translateDay(value)
+            : select.dataset.facet === "units"
+            ? `${value} واحد`
+            : value;
+        select.appendChild(new Option(`${label} (${count})`, value));
+      });
+      select.value = selected;
+    });
+  }
+
   bindLogout(handler) {
     if (this.elements.logoutBtn) {
       this.elements.logoutBtn.addEventListener("click", handler);
@@ -301,4 +329,12 @@ export class StudentCourseView {
       });
     }
   }
+
+  bindFacetFilter(handler) {
+    this.elements.facetSelects.forEach((select) => {
+      select.addEventListener("change", (e) => {
+        handler(select.dataset.param, e.target.value);
+      });
+    });
+  }
 }